@@ -0,0 +1,4 @@
+"""
+Benchmarks of optenum. Run the suite with `python -m benchmarks`, or a benchmark module directly, e.g.
+`python -m benchmarks.bench_option_class`
+"""
@@ -0,0 +1,60 @@
+"""
+Vectorized `decode`/`encode` against a python loop over dict lookups.
+
+    python -m benchmarks.bench_arrays [size ...]      # default sizes 1M and 10M. e.g. 1000000 10000000 100000000
+
+The python loop is measured up to `LOOP_LIMIT` elements.
+"""
+from __future__ import print_function
+
+import sys
+
+import numpy as np
+
+from benchmarks.common import measure, make_options_class, fmt_seconds, print_table
+
+SIZES = (1000000, 10000000)
+LOOP_LIMIT = 10000000
+OPTIONS = 200
+
+
+def run(sizes=SIZES):
+    rows = []
+    int_options = make_options_class('IntCodes', OPTIONS)
+    str_options = make_options_class('StrCodes', OPTIONS, code_type=str)
+    rng = np.random.RandomState(0)
+
+    for size in sizes:
+        repeat = 3 if size <= LOOP_LIMIT else 1
+        ordinals = rng.randint(0, OPTIONS, size)
+        cases = (
+            ('int code -> name', int_options, np.asarray(int_options.codes)[ordinals], 'code', 'name'),
+            ('int code -> ordinal', int_options, np.asarray(int_options.codes)[ordinals], 'code', 'ordinal'),
+            ('str code -> name', str_options, np.asarray(str_options.codes)[ordinals], 'code', 'name'),
+            ('name -> int code', int_options, np.asarray(int_options.names)[ordinals], 'name', 'code'),
+        )
+        for label, cls, values, from_field, to_field in cases:
+            if from_field == 'code':
+                vectorized = measure(lambda: cls.decode(values, to_field), repeat=repeat)
+            else:
+                vectorized = measure(lambda: cls.encode(values), repeat=repeat)
+
+            if size <= LOOP_LIMIT:
+                if to_field == 'ordinal':
+                    mapping = dict((o.code, i) for i, o in enumerate(cls.all))
+                else:
+                    mapping = cls.get_dict(from_field, to_field)
+                items = values.tolist()
+                loop = measure(lambda: [mapping[v] for v in items], repeat=repeat)
+                speedup = '%.1fx' % (loop / vectorized)
+            else:
+                loop, speedup = None, '-'
+            rows.append((size, label, fmt_seconds(vectorized), fmt_seconds(loop), speedup))
+
+    print_table('Vectorized conversion (%d options)' % OPTIONS, ('size', 'conversion', 'numpy', 'python loop',
+                                                                 'speedup'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run([int(s) for s in sys.argv[1:]] or SIZES)
@@ -0,0 +1,47 @@
+"""
+Tag changes one by one against `Options.batch_tags()` and `Options.set_tags()`: tag and untag every option of a
+class. One by one rebuilds the group tuple on every change, which is quadratic.
+
+    python -m benchmarks.bench_batch_tags
+"""
+from __future__ import print_function
+
+from benchmarks.common import measure, make_options_class, fmt_seconds, print_table
+
+SIZES = (100, 1000, 10000)
+
+
+def run(sizes=SIZES):
+    rows = []
+    for size in sizes:
+        cls = make_options_class('Bench%d' % size, size)
+        options = cls.all
+
+        def one_by_one():
+            for opt in options:
+                opt.add_tag('BENCH')
+            for opt in options:
+                opt.remove_tag('BENCH')
+
+        def batched():
+            with cls.batch_tags():
+                for opt in options:
+                    opt.add_tag('BENCH')
+            with cls.batch_tags():
+                for opt in options:
+                    opt.remove_tag('BENCH')
+
+        def set_tags():
+            cls.set_tags(dict((opt, ('BENCH', )) for opt in options))
+            cls.set_tags(dict((opt, ()) for opt in options))
+
+        repeat = 1 if size > 1000 else 3
+        rows.append((size, size * 2, fmt_seconds(measure(one_by_one, repeat=repeat)),
+                     fmt_seconds(measure(batched, repeat=repeat)), fmt_seconds(measure(set_tags, repeat=repeat))))
+
+    print_table('Tag changes', ('options', 'changes', 'one by one', 'batch_tags()', 'set_tags()'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
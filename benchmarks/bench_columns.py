@@ -0,0 +1,44 @@
+"""
+Object column of Option objects against categorical column of an Options class.
+
+    python -m benchmarks.bench_columns [size]
+"""
+from __future__ import print_function
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import measure, make_options_class, fmt_seconds, fmt_bytes, print_table
+from optenum import columns
+
+SIZE = 1000000
+OPTIONS = 200
+
+
+def run(size=SIZE):
+    cls = make_options_class('Codes', OPTIONS)
+    codes = np.asarray(cls.codes)[np.random.RandomState(0).randint(0, OPTIONS, size)]
+    code_series = pd.Series(codes)
+
+    from_code = cls.from_code
+    objects = pd.Series([from_code(c) for c in codes.tolist()], dtype=object)
+    categorical = columns.to_categorical(cls, code_series)
+
+    rows = [
+        ('build', fmt_seconds(measure(lambda: pd.Series([from_code(c) for c in codes.tolist()], dtype=object),
+                                      repeat=3)),
+         fmt_seconds(measure(lambda: columns.to_categorical(cls, code_series), repeat=3))),
+        ('memory', fmt_bytes(objects.memory_usage(deep=False)), fmt_bytes(categorical.memory_usage(deep=False))),
+        ('value_counts', fmt_seconds(measure(lambda: objects.value_counts(), repeat=3)),
+         fmt_seconds(measure(lambda: categorical.value_counts(), repeat=3))),
+        ('names', fmt_seconds(measure(lambda: objects.map(lambda o: o.name), repeat=3)),
+         fmt_seconds(measure(lambda: columns.from_categorical(cls, categorical), repeat=3))),
+    ]
+    print_table('%d codes of %d options' % (size, OPTIONS), ('operation', 'object Options', 'categorical'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
@@ -0,0 +1,42 @@
+"""
+`option in MyOptions` by identity index against scanning all options.
+
+    python -m benchmarks.bench_contains
+"""
+from __future__ import print_function
+
+from optenum import Option
+from benchmarks.common import measure, make_options_class, fmt_seconds, print_table
+
+SIZES = (10, 1000, 100000)
+NUMBER = 1000
+
+
+def scan_contains(cls, item):
+    # `OptionsMeta.__contains__` of optenum <= 1.1.9
+    if isinstance(item, Option):
+        return item in cls.__name_options_mapping__.values()
+    else:
+        return item in cls.__code_options_mapping__.keys()
+
+
+def run(sizes=SIZES, number=NUMBER):
+    rows = []
+    for size in sizes:
+        cls = make_options_class('Bench%d' % size, size)
+        last = cls.all[-1]
+        middle = cls.all[size // 2]
+        other = Option(int(last), 'OTHER')       # same code, not member
+
+        for label, item in (('middle', middle), ('last', last), ('miss', other)):
+            number_scan = max(1, number * 10 // size)
+            scan = measure(lambda: scan_contains(cls, item), number=number_scan)
+            index = measure(lambda: item in cls, number=number)
+            rows.append((size, label, fmt_seconds(scan), fmt_seconds(index), '%.0fx' % (scan / index)))
+
+    print_table('option in Options', ('options', 'item', 'scan', 'index', 'speedup'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,69 @@
+"""
+Decoding codes to options on dense and sparse integer codes.
+
+  * `from_code()` per code against `from_codes()` batch.
+  * dict lookup (`from_code()`) against an offset-indexed tuple for a single code.
+
+    python -m benchmarks.bench_from_codes
+"""
+from __future__ import print_function
+
+import random
+from collections import OrderedDict
+
+from optenum import Options
+from benchmarks.common import measure, make_options_class, fmt_seconds, print_table
+
+OPTIONS = 200
+CODES = 100000
+NUMBER = 100000
+
+
+def make_sparse_class(name, count):
+    namespace = OrderedDict(('OPT_%d' % i, i * 1000) for i in range(count))
+    return type(Options)(name, (Options, ), namespace)
+
+
+def make_table(cls):
+    offset = min(cls.codes)
+    table = [None] * (max(cls.codes) - offset + 1)
+    for opt in cls.all:
+        table[opt - offset] = opt
+    return tuple(table), offset
+
+
+def table_lookup(table, offset, code):
+    if type(code) is int:
+        i = code - offset
+        if 0 <= i < len(table) and table[i] is not None:
+            return table[i]
+    raise KeyError(code)
+
+
+def run(options=OPTIONS, count=CODES, number=NUMBER):
+    batch_rows = []
+    for label, cls in (('dense', make_options_class('Dense', options)),
+                       ('sparse', make_sparse_class('Sparse', options))):
+        rnd = random.Random(0)
+        codes = [rnd.choice(cls.codes) for _ in range(count)]
+        from_code = cls.from_code
+
+        loop = measure(lambda: [from_code(c) for c in codes], repeat=3)
+        batch = measure(lambda: cls.from_codes(codes), repeat=3)
+        batch_rows.append((label, fmt_seconds(loop), fmt_seconds(batch), '%.1fx' % (loop / batch)))
+    print_table('Decode %d codes of %d options' % (count, options),
+                ('codes', 'from_code loop', 'from_codes', 'speedup'), batch_rows)
+    print()
+
+    cls = make_options_class('Dense', options)
+    table, offset = make_table(cls)
+    code = cls.codes[options // 2]
+    by_dict = measure(lambda: cls.from_code(code), number=number)
+    by_table = measure(lambda: table_lookup(table, offset, code), number=number)
+    single_rows = [(fmt_seconds(by_dict), fmt_seconds(by_table))]
+    print_table('Single dense code', ('dict (from_code)', 'tuple table'), single_rows)
+    return batch_rows, single_rows
+
+
+if __name__ == '__main__':
+    run()
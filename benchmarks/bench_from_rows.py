@@ -0,0 +1,42 @@
+"""
+Build an Options class from rows with `Options.from_rows()` against generating source code and `exec` it.
+
+    python -m benchmarks.bench_from_rows
+"""
+from __future__ import print_function
+
+from optenum import Options
+from benchmarks.common import measure, fmt_seconds, print_table
+
+SIZES = (1000, 10000, 100000)
+
+
+def make_rows(count):
+    return [('OPT_%d' % i, i, 'Option %d' % i, ('TAG_%d' % (i % 10), )) for i in range(count)]
+
+
+def exec_rows(name, rows):
+    lines = ['class %s(Options):' % name]
+    for attr, code, text, tags in rows:
+        lines.append('    %s = %r, %r, %r' % (attr, code, text, tags))
+    namespace = {'Options': Options}
+    exec(compile('\n'.join(lines), '<options>', 'exec'), namespace)
+    return namespace[name]
+
+
+def run(sizes=SIZES):
+    rows = []
+    for size in sizes:
+        data = make_rows(size)
+        repeat = 3 if size < 100000 else 1
+        executed = measure(lambda: exec_rows('Bench', data), repeat=repeat)
+        built = measure(lambda: Options.from_rows('Bench', data), repeat=repeat)
+        rows.append((size, fmt_seconds(executed), fmt_seconds(built), '%.1fx' % (executed / built),
+                     '%.0f' % (size / built)))
+
+    print_table('Options class from rows', ('rows', 'exec', 'from_rows', 'speedup', 'rows/s'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,51 @@
+"""
+Set-backed `OptionGroup` against the list-backed one of optenum <= 1.1.9: building a group and `in`.
+
+    python -m benchmarks.bench_groups
+"""
+from __future__ import print_function
+
+from optenum import OptionGroup
+from benchmarks.common import measure, make_options_class, fmt_seconds, print_table
+
+SIZES = (10, 1000, 10000)
+NUMBER = 1000
+
+
+class ListOptionGroup(list):
+    # `OptionGroup` of optenum <= 1.1.9
+
+    def __init__(self, *args):
+        super(ListOptionGroup, self).__init__()
+        for arg in args:
+            if isinstance(arg, ListOptionGroup):
+                for a in arg:
+                    if a not in self:
+                        self.append(a)
+            else:
+                if arg not in self:
+                    self.append(arg)
+
+
+def run(sizes=SIZES, number=NUMBER):
+    rows = []
+    for size in sizes:
+        options = make_options_class('Bench%d' % size, size).all
+        last = options[-1]
+        repeat = 1 if size > 1000 else 3
+
+        build_list = measure(lambda: ListOptionGroup(*options), repeat=repeat)
+        build_set = measure(lambda: OptionGroup(*options), repeat=repeat)
+        list_group = ListOptionGroup(*options)
+        set_group = OptionGroup(*options)
+        in_list = measure(lambda: last in list_group, number=number)
+        in_set = measure(lambda: last in set_group, number=number)
+        rows.append((size, fmt_seconds(build_list), fmt_seconds(build_set), fmt_seconds(in_list),
+                     fmt_seconds(in_set)))
+
+    print_table('OptionGroup', ('options', 'build (list)', 'build (set)', 'in (list)', 'in (set)'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,38 @@
+"""
+Cost of instrumentation. Lookups before `enable()`, while enabled and after `disable()`.
+
+    python -m benchmarks.bench_instrument
+"""
+from __future__ import print_function
+
+from optenum import instrument
+from benchmarks.common import measure_auto, make_options_class, fmt_seconds, print_table
+
+OPTIONS = 1000
+
+
+def run():
+    cls = make_options_class('Bench', OPTIONS)
+    code = OPTIONS // 2
+    name = 'OPT_%d' % code
+    cases = (('from_code', lambda: cls.from_code(code)), ('[name]', lambda: cls[name]),
+             ('in', lambda: code in cls), ('get_list', lambda: cls.get_list('code', 'name')))
+
+    rows = []
+    for label, func in cases:
+        before = measure_auto(func)
+        instrument.enable()
+        try:
+            enabled = measure_auto(func)
+        finally:
+            instrument.disable()
+            instrument.reset()
+        after = measure_auto(func)
+        rows.append((label, fmt_seconds(before), fmt_seconds(enabled), fmt_seconds(after)))
+
+    print_table('Instrumentation cost', ('operation', 'never enabled', 'enabled', 'disabled'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,53 @@
+"""
+Load throughput (rows/s) of CSV and JSON Lines loaders, with and without mmap.
+
+    python -m benchmarks.bench_loaders
+"""
+from __future__ import print_function
+
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from optenum.loaders import load_csv, load_jsonl
+from benchmarks.common import measure, fmt_seconds, fmt_bytes, print_table
+
+ROWS = 100000
+
+
+def write_files(path, count):
+    csv_path = os.path.join(path, 'codes.csv')
+    jsonl_path = os.path.join(path, 'codes.jsonl')
+    with io.open(csv_path, 'w', encoding='utf-8') as f:
+        f.write(u'name,code,text,tags\n')
+        for i in range(count):
+            f.write(u'OPT_%d,%d,Option %d,TAG_%d\n' % (i, i, i, i % 10))
+    with io.open(jsonl_path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            f.write(u'%s\n' % json.dumps({'name': 'OPT_%d' % i, 'code': i, 'text': 'Option %d' % i,
+                                          'tags': ['TAG_%d' % (i % 10)]}))
+    return csv_path, jsonl_path
+
+
+def run(count=ROWS):
+    path = tempfile.mkdtemp()
+    rows = []
+    try:
+        csv_path, jsonl_path = write_files(path, count)
+        for label, file_path, load in (('csv', csv_path, lambda **kw: load_csv(csv_path, 'Bench', code_type=int, **kw)),
+                                       ('jsonl', jsonl_path, lambda **kw: load_jsonl(jsonl_path, 'Bench', **kw))):
+            for use_mmap in (False, True):
+                seconds = measure(lambda: load(use_mmap=use_mmap), repeat=3)
+                rows.append((label, use_mmap, fmt_bytes(os.path.getsize(file_path)), fmt_seconds(seconds),
+                             '%.0f' % (count / seconds)))
+    finally:
+        shutil.rmtree(path)
+
+    print_table('Load %d rows' % count, ('format', 'mmap', 'size', 'time', 'rows/s'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
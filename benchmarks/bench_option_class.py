@@ -0,0 +1,58 @@
+"""
+Import time and memory of a module with 10k options.
+"before" creates one Option class per option (as optenum <= 1.1.9 did), "after" shares one class per code type.
+
+    python -m benchmarks.bench_option_class
+"""
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+
+from optenum import option as option_module
+from benchmarks.common import measure, measure_memory, make_options_source, fmt_seconds, fmt_bytes, print_table
+
+COUNT = 10000
+
+get_option_class = option_module.get_option_class
+
+
+def import_module(path, module_name):
+    sys.modules.pop(module_name, None)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return __import__(module_name)
+
+
+def run(count=COUNT):
+    path = tempfile.mkdtemp()
+    rows = []
+    try:
+        for code_type in (int, str):
+            module_name = 'bench_options_%s' % code_type.__name__
+            with open(os.path.join(path, module_name + '.py'), 'w') as f:
+                f.write(make_options_source('BenchOptions', count, code_type=code_type))
+            import_module(path, module_name)     # compile to .pyc first
+
+            for label, factory in (('before', option_module._make_option_class),
+                                   ('after', option_module.get_option_class)):
+                option_module.get_option_class = factory
+                try:
+                    seconds = measure(lambda: import_module(path, module_name), repeat=3)
+                    _, allocated = measure_memory(lambda: import_module(path, module_name))
+                finally:
+                    option_module.get_option_class = get_option_class
+                rows.append((code_type.__name__, label, fmt_seconds(seconds), fmt_bytes(allocated),
+                             fmt_bytes(allocated / count if allocated else None)))
+            sys.modules.pop(module_name, None)
+    finally:
+        shutil.rmtree(path)
+
+    print_table('Import module of %d options' % count, ('code', 'mode', 'import', 'memory', 'per option'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,52 @@
+"""
+Per-option data: dict keyed by options against `OptionMap`. Get and set of one option, iteration in declaration
+order, fill and reset, and memory.
+
+    python -m benchmarks.bench_option_map
+"""
+from __future__ import print_function
+
+from optenum import OptionMap
+from benchmarks.common import measure, measure_auto, measure_memory, make_options_class, fmt_seconds, fmt_bytes, \
+    print_table
+
+SIZES = (10, 1000, 100000)
+
+
+def run(sizes=SIZES):
+    rows = []
+    for size in sizes:
+        cls = make_options_class('Bench%d' % size, size)
+        options = cls.all
+        opt = options[size // 2]
+        d = dict.fromkeys(options, 0)
+        m = OptionMap(cls, d)
+        repeat = 3
+
+        def dict_fill():
+            d.update(dict.fromkeys(options, 0))
+
+        def map_filled():
+            filled = OptionMap(cls)
+            filled.fill(0)
+            return filled
+
+        rows.extend([
+            (size, 'get', fmt_seconds(measure_auto(lambda: d[opt])), fmt_seconds(measure_auto(lambda: m[opt]))),
+            (size, 'set', fmt_seconds(measure_auto(lambda: d.__setitem__(opt, 1))),
+             fmt_seconds(measure_auto(lambda: m.__setitem__(opt, 1)))),
+            (size, 'items in order', fmt_seconds(measure(lambda: [(o, d[o]) for o in options if o in d], repeat)),
+             fmt_seconds(measure(m.items, repeat))),
+            (size, 'fill', fmt_seconds(measure(dict_fill, repeat)), fmt_seconds(measure(lambda: m.fill(0), repeat))),
+            (size, 'reset', fmt_seconds(measure(lambda: dict(d).clear(), repeat)),
+             fmt_seconds(measure(lambda: m.copy().reset(), repeat))),
+            (size, 'memory', fmt_bytes(measure_memory(lambda: dict.fromkeys(options, 0))[1]),
+             fmt_bytes(measure_memory(map_filled)[1])),
+        ])
+
+    print_table('Per-option data', ('options', 'operation', 'dict', 'OptionMap'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
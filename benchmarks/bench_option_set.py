@@ -0,0 +1,54 @@
+"""
+Sets of options per record (e.g. permissions of users): python `set` of options against `OptionSet` and its int mask.
+Intersection and union with a set, `in`, serialization and memory of many records.
+
+    python -m benchmarks.bench_option_set [records]
+"""
+from __future__ import print_function
+
+import random
+import sys
+
+from optenum import OptionSet
+from benchmarks.common import measure, measure_memory, make_options_class, fmt_seconds, fmt_bytes, print_table
+
+RECORDS = 100000
+OPTIONS = 64
+PER_RECORD = 8
+
+
+def run(records=RECORDS):
+    cls = make_options_class('Permission', OPTIONS)
+    options = cls.all
+    rnd = random.Random(0)
+    samples = [rnd.sample(options, PER_RECORD) for _ in range(records)]
+    sets = [set(s) for s in samples]
+    option_sets = [OptionSet(cls, s) for s in samples]
+    masks = [int(s) for s in option_sets]
+    required = options[:OPTIONS // 2]
+    required_set, required_option_set = set(required), OptionSet(cls, required)
+    required_mask = int(required_option_set)
+    probe = options[1]
+
+    rows = [
+        ('intersection', fmt_seconds(measure(lambda: [s & required_set for s in sets], 3)),
+         fmt_seconds(measure(lambda: [s & required_option_set for s in option_sets], 3)),
+         fmt_seconds(measure(lambda: [m & required_mask for m in masks], 3))),
+        ('union', fmt_seconds(measure(lambda: [s | required_set for s in sets], 3)),
+         fmt_seconds(measure(lambda: [s | required_option_set for s in option_sets], 3)),
+         fmt_seconds(measure(lambda: [m | required_mask for m in masks], 3))),
+        ('in', fmt_seconds(measure(lambda: [probe in s for s in sets], 3)),
+         fmt_seconds(measure(lambda: [probe in s for s in option_sets], 3)), '-'),
+        ('serialize', fmt_seconds(measure(lambda: [','.join(o.name for o in s) for s in sets], 3)),
+         fmt_seconds(measure(lambda: [s.to_bytes() for s in option_sets], 3)), '-'),
+        ('memory', fmt_bytes(measure_memory(lambda: [set(s) for s in samples])[1]),
+         fmt_bytes(measure_memory(lambda: [OptionSet(cls, s) for s in samples])[1]),
+         fmt_bytes(measure_memory(lambda: [int(OptionSet(cls, s)) for s in samples])[1])),
+    ]
+    print_table('%d records of %d in %d options' % (records, PER_RECORD, OPTIONS),
+                ('operation', 'set', 'OptionSet', 'int mask'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS)
@@ -0,0 +1,51 @@
+"""
+Pickle size and speed of options against raw codes.
+
+    python -m benchmarks.bench_pickle
+"""
+from __future__ import print_function
+
+import pickle
+import random
+
+from optenum import Options
+from benchmarks.common import measure, fmt_seconds, fmt_bytes, print_table
+
+
+class Status(Options):
+    NEW = 0, 'New'
+    RUNNING = 1, 'Running'
+    STOPPED = 2, 'Stopped'
+    FAILED = 3, 'Failed'
+
+
+class Color(Options):
+    RED = 'r', 'Red'
+    GREEN = 'g', 'Green'
+    BLUE = 'b', 'Blue'
+
+
+COUNT = 100000
+
+
+def run(count=COUNT):
+    random.seed(0)
+    rows = []
+    for cls in (Status, Color):
+        options = [random.choice(cls.all) for _ in range(count)]
+        codes = [o.code for o in options]
+        for label, data in (('codes', codes), ('options', options)):
+            dumped = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+            dumps = measure(lambda: pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+            loads = measure(lambda: pickle.loads(dumped))
+            rows.append((cls.__name__, label, fmt_bytes(len(dumped)), fmt_seconds(dumps), fmt_seconds(loads)))
+
+        single = pickle.dumps(cls.all[0], pickle.HIGHEST_PROTOCOL)
+        rows.append((cls.__name__, 'one option', fmt_bytes(len(single)), '-', '-'))
+
+    print_table('Pickle list of %d items' % count, ('class', 'items', 'size', 'dumps', 'loads'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,47 @@
+"""
+Tag query `Options.query('TAG_1 & TAG_2 & ~TAG_3')` against filtering options by tags in a loop. The first query of a
+class builds bitmasks of its tags (cold). Repeated queries are cached.
+
+    python -m benchmarks.bench_query
+"""
+from __future__ import print_function
+
+from collections import OrderedDict
+from optenum import Options
+from benchmarks.common import measure, measure_auto, fmt_seconds, print_table
+
+SIZES = (100, 10000, 100000)
+TAGS = 8
+QUERY = 'TAG_1 & TAG_2 & ~TAG_3'
+
+
+def make_tagged_class(size):
+    namespace = OrderedDict()
+    for i in range(size):
+        namespace['OPT_%d' % i] = (i, None, tuple('TAG_%d' % t for t in range(TAGS) if i >> t & 1))
+    return type(Options)('Tagged%d' % size, (Options, ), namespace)
+
+
+def run(sizes=SIZES):
+    rows = []
+    for size in sizes:
+        cls = make_tagged_class(size)
+
+        def loop():
+            return tuple(o for o in cls.all if 'TAG_1' in o.tags and 'TAG_2' in o.tags and 'TAG_3' not in o.tags)
+
+        def cold():
+            cls.__tag_index__ = None
+            return cls.query(QUERY)
+
+        assert loop() == cold()
+        repeat = 1 if size > 10000 else 3
+        rows.append((size, fmt_seconds(measure(loop, repeat=repeat)), fmt_seconds(measure(cold, repeat=repeat)),
+                     fmt_seconds(measure_auto(lambda: cls.query(QUERY)))))
+
+    print_table('Tag query "%s"' % QUERY, ('options', 'loop', 'query (cold)', 'query (cached)'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
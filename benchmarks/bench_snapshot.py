@@ -0,0 +1,47 @@
+"""
+Cold start of an Options class: load CSV, build from rows and restore snapshot.
+
+    python -m benchmarks.bench_snapshot
+"""
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+
+from optenum import Options
+from optenum.loaders import load_csv
+from optenum.snapshot import dump_snapshot, load_snapshot, file_hash
+from benchmarks.common import measure, fmt_seconds, fmt_bytes, print_table
+from benchmarks.bench_from_rows import make_rows
+from benchmarks.bench_loaders import write_files
+
+SIZES = (1000, 10000, 100000)
+
+
+def run(sizes=SIZES):
+    path = tempfile.mkdtemp()
+    rows = []
+    try:
+        for size in sizes:
+            data = make_rows(size)
+            csv_path = write_files(path, size)[0]
+            snapshot = os.path.join(path, 'codes.snapshot')
+            source_hash = file_hash(csv_path)
+            dump_snapshot(load_csv(csv_path, 'Bench', code_type=int), snapshot, source_hash)
+
+            loaded = measure(lambda: load_csv(csv_path, 'Bench', code_type=int), repeat=3)
+            built = measure(lambda: Options.from_rows('Bench', data), repeat=3)
+            restored = measure(lambda: load_snapshot(snapshot, file_hash(csv_path)), repeat=3)
+            rows.append((size, fmt_bytes(os.path.getsize(snapshot)), fmt_seconds(loaded), fmt_seconds(built),
+                         fmt_seconds(restored), '%.1fx' % (loaded / restored)))
+    finally:
+        shutil.rmtree(path)
+
+    print_table('Options class cold start', ('options', 'snapshot', 'load_csv', 'from_rows', 'snapshot+hash',
+                                             'speedup'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
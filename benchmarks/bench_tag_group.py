@@ -0,0 +1,33 @@
+"""
+`in` of tag attributes (e.g. `status in OrderState.IN_PROGRESS`): plain tuple of optenum <= 1.1.9 against `TagGroup`,
+which is looked up by hash if it has `TagGroup.HASH_MIN_SIZE` or more options.
+
+    python -m benchmarks.bench_tag_group
+"""
+from __future__ import print_function
+
+from optenum import TagGroup
+from benchmarks.common import measure_auto, make_options_class, fmt_seconds, print_table
+
+SIZES = (3, 8, 20, 100, 1000)
+
+
+def run(sizes=SIZES):
+    rows = []
+    for size in sizes:
+        options = make_options_class('Bench%d' % size, size).all
+        plain = tuple(options)
+        group = TagGroup(options)
+        last, missing = size - 1, -1
+        rows.append((size, fmt_seconds(measure_auto(lambda: last in plain)),
+                     fmt_seconds(measure_auto(lambda: last in group)),
+                     fmt_seconds(measure_auto(lambda: missing in plain)),
+                     fmt_seconds(measure_auto(lambda: missing in group))))
+
+    print_table('Tag group `in`', ('options', 'last (tuple)', 'last (TagGroup)', 'missing (tuple)',
+                                   'missing (TagGroup)'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
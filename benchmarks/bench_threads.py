@@ -0,0 +1,79 @@
+"""
+Stress of tags under threads: throughput of readers (tag attribute `in`, `Option.tags`, `Options.query()`) with and
+without writers changing tags at the same time. Readers take no lock, so their throughput should not fall while
+writers are active, except for the CPU the writers use. Reader threads only scale on free-threaded python.
+
+    python -m benchmarks.bench_threads [seconds]
+"""
+from __future__ import print_function
+
+import sys
+import threading
+import time
+
+from benchmarks.common import make_options_class, print_table
+
+SIZE = 1000
+READERS = (1, 2, 4)
+WRITERS = (0, 1, 2)
+SECONDS = 0.5
+WRITE_INTERVAL = 0.0005
+"""Writers sleep between tag changes, so that they take a small part of CPU as in real workloads."""
+
+
+def _stress(cls, readers, writers, seconds):
+    stop = []
+    reads = [0] * readers
+    writes = [0] * writers
+    options = cls.all
+    codes = list(range(0, SIZE, 7))
+
+    def read(n):
+        count = 0
+        while not stop:
+            group = cls.TAG_0
+            for code in codes:
+                if code in group:
+                    options[code].tags
+            cls.query('TAG_0 & ~TAG_1')
+            count += len(codes) + 1
+        reads[n] = count
+
+    def write(n):
+        count = 0
+        opt = options[n]
+        while not stop:
+            opt.add_tag('WRITER')
+            opt.remove_tag('WRITER')
+            count += 2
+            time.sleep(WRITE_INTERVAL)
+        writes[n] = count
+
+    threads = ([threading.Thread(target=read, args=(n, )) for n in range(readers)] +
+               [threading.Thread(target=write, args=(n, )) for n in range(writers)])
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.append(True)
+    for t in threads:
+        t.join()
+    return sum(reads) / seconds, sum(writes) / seconds
+
+
+def run(seconds=SECONDS):
+    cls = make_options_class('Stress', SIZE, tags=True)
+    rows = []
+    for readers in READERS:
+        base = None
+        for writers in WRITERS:
+            read_rate, write_rate = _stress(cls, readers, writers, seconds)
+            base = base or read_rate
+            rows.append((readers, writers, '%.0f' % read_rate, '%.0f' % write_rate, '%.2f' % (read_rate / base)))
+
+    print_table('Tags under threads (%d options, %.1f s each)' % (SIZE, seconds),
+                ('readers', 'writers', 'reads/s', 'writes/s', 'reads vs no writer'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else SECONDS)
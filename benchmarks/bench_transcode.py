@@ -0,0 +1,62 @@
+"""
+Throughput of `optenum.transcode` from 1 to N processes.
+
+    python -m benchmarks.bench_transcode [rows] [max processes]
+"""
+from __future__ import print_function
+
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks.common import make_options_class, fmt_seconds, print_table
+from optenum.transcode import transcode
+
+ROWS = 2000000
+OPTIONS = 200
+
+Codes = make_options_class('Codes', OPTIONS)
+Codes.__module__ = __name__     # importable by workers
+
+
+def write_file(path, rows):
+    rnd = random.Random(0)
+    with open(path, 'w') as f:
+        f.write('id,status,amount\n')
+        for i in range(rows):
+            f.write('%d,%d,%d.%02d\n' % (i, rnd.randrange(OPTIONS), rnd.randrange(10000), rnd.randrange(100)))
+
+
+def run(rows=ROWS, max_processes=None):
+    max_processes = max_processes or multiprocessing.cpu_count()
+    directory = tempfile.mkdtemp()
+    try:
+        src = os.path.join(directory, 'src.csv')
+        dst = os.path.join(directory, 'dst.csv')
+        write_file(src, rows)
+        size = os.path.getsize(src)
+
+        counts = sorted(set([2 ** i for i in range(max_processes.bit_length()) if 2 ** i < max_processes] +
+                            [max_processes]))
+        results = []
+        for processes in counts:
+            started = time.time()
+            transcode(src, dst, Codes, ['status'], processes=processes, chunk_size=4 * 1024 * 1024)
+            elapsed = time.time() - started
+            base = results[0][1] if results else elapsed
+            results.append((processes, elapsed, '%.1f MB/s' % (size / elapsed / 1024 / 1024),
+                            '%.2fx' % (base / elapsed)))
+        rows_ = [(p, fmt_seconds(e), t, s) for p, e, t, s in results]
+        print_table('Transcode %d rows (%.1f MB), %d CPUs' % (rows, size / 1024.0 / 1024, multiprocessing.cpu_count()),
+                    ('processes', 'time', 'throughput', 'speedup'), rows_)
+        return rows_
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS, int(sys.argv[2]) if len(sys.argv) > 2 else None)
@@ -0,0 +1,55 @@
+"""
+Validating a stream of codes: `value in MyOptions` per value against `validate_many()`, `filter_valid()` and
+`valid_mask()`.
+
+    python -m benchmarks.bench_validate [size]
+"""
+from __future__ import print_function
+
+import random
+import sys
+
+from optenum import InvalidValues
+from benchmarks.common import measure, make_options_class, fmt_seconds, print_table
+
+SIZE = 1000000
+OPTIONS = 200
+INVALID_RATIO = 0.01
+
+
+def run(size=SIZE):
+    cls = make_options_class('Codes', OPTIONS)
+    rnd = random.Random(0)
+    values = [rnd.randrange(OPTIONS) if rnd.random() >= INVALID_RATIO else -1 for _ in range(size)]
+
+    def loop_invalid():
+        return [(i, v) for i, v in enumerate(values) if v not in cls]
+
+    def loop_filter():
+        return [v for v in values if v in cls]
+
+    baseline_invalid = measure(loop_invalid, repeat=3)
+    baseline_filter = measure(loop_filter, repeat=3)
+    baseline_mask = measure(lambda: [v in cls for v in values], repeat=3)
+    rows = [
+        ('invalid (index, value)', fmt_seconds(baseline_invalid),
+         fmt_seconds(measure(lambda: list(cls.validate_many(values, InvalidValues())), repeat=3))),
+        ('filter valid', fmt_seconds(baseline_filter),
+         fmt_seconds(measure(lambda: list(cls.filter_valid(values, InvalidValues())), repeat=3))),
+        ('mask', fmt_seconds(baseline_mask), fmt_seconds(measure(lambda: cls.valid_mask(values), repeat=3))),
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        array = np.array(values)
+        rows.append(('mask of ndarray', '-', fmt_seconds(measure(lambda: cls.valid_mask(array), repeat=3))))
+
+    print_table('Validate %d codes (%.0f%% invalid)' % (size, INVALID_RATIO * 100),
+                ('operation', '`in` loop', 'batch'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
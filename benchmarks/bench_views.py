@@ -0,0 +1,40 @@
+"""
+Cached `codes`/`names`/`all`/`tuples`/`items` views against building them on every access and a plain attribute read.
+
+    python -m benchmarks.bench_views
+"""
+from __future__ import print_function
+
+from benchmarks.common import measure, make_options_class, fmt_seconds, print_table
+
+SIZES = (10, 1000)
+NUMBER = 100000
+
+# views of optenum <= 1.1.9
+REBUILD = {
+    'codes': lambda cls: list(cls.__code_options_mapping__.keys()),
+    'names': lambda cls: list(cls.__name_options_mapping__.keys()),
+    'all': lambda cls: list(cls.__name_options_mapping__.values()),
+    'tuples': lambda cls: [(o.name, o.code, o.text) for o in cls.__name_options_mapping__.values()],
+    'items': lambda cls: {o.name: o for o in cls.__name_options_mapping__.values()},
+}
+
+
+def run(sizes=SIZES, number=NUMBER):
+    rows = []
+    for size in sizes:
+        cls = make_options_class('Bench%d' % size, size)
+        attribute = measure(lambda: cls.OPT_0, number=number)
+        rows.append((size, 'attribute', fmt_seconds(attribute), '-'))
+        for name in ('codes', 'names', 'all', 'tuples', 'items'):
+            rebuild = REBUILD[name]
+            rebuilt = measure(lambda: rebuild(cls), number=max(1, number // size))
+            cached = measure(lambda: getattr(cls, name), number=number)
+            rows.append((size, name, fmt_seconds(cached), fmt_seconds(rebuilt)))
+
+    print_table('Options views', ('options', 'view', 'cached', 'rebuilt'), rows)
+    return rows
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,128 @@
+"""
+Helpers shared by benchmarks.
+"""
+from __future__ import print_function
+
+import gc
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:     # python 2.7
+    tracemalloc = None
+
+timer = getattr(time, 'perf_counter', time.time)
+
+
+def measure(func, repeat=5, number=1):
+    """
+    Run `func` `number` times per round for `repeat` rounds.
+    :return: best seconds per call
+    """
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = timer()
+        for _ in range(number):
+            func()
+        elapsed = (timer() - start) / number
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def measure_auto(func, repeat=5, min_time=0.02):
+    """
+    Run `func` in rounds of at least `min_time` seconds. The number of calls per round is calibrated.
+    :return: best seconds per call
+    """
+    number = 1
+    while True:
+        start = timer()
+        for _ in range(number):
+            func()
+        elapsed = timer() - start
+        if elapsed >= min_time or number >= 10 ** 7:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    return measure(func, repeat=repeat, number=number)
+
+
+def measure_memory(func):
+    """
+    Run `func` once and trace memory allocated by it. The result of `func` is kept alive while tracing.
+    :return: (result, allocated bytes) or (result, None) if `tracemalloc` is not available.
+    """
+    if tracemalloc is None:
+        return func(), None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return result, allocated
+
+
+def make_options_source(name, count, code_type=int, tags=False):
+    """Python source of an Options class with `count` options."""
+    lines = ['from optenum import Options', '', '', 'class %s(Options):' % name]
+    for i in range(count):
+        code = i if code_type is int else repr('c%d' % i)
+        if tags:
+            lines.append("    OPT_%d = %s, 'Option %d', ('TAG_%d', )" % (i, code, i, i % 10))
+        else:
+            lines.append("    OPT_%d = %s, 'Option %d'" % (i, code, i))
+    return '\n'.join(lines) + '\n'
+
+
+def make_options_class(name, count, code_type=int, tags=False):
+    """Options class with `count` options. Options are declared as `make_options_source()` does."""
+    from collections import OrderedDict
+    from optenum import Options
+
+    namespace = OrderedDict()
+    for i in range(count):
+        code = i if code_type is int else 'c%d' % i
+        if tags:
+            namespace['OPT_%d' % i] = (code, 'Option %d' % i, ('TAG_%d' % (i % 10), ))
+        else:
+            namespace['OPT_%d' % i] = (code, 'Option %d' % i)
+    return type(Options)(name, (Options, ), namespace)
+
+
+def fmt_seconds(seconds):
+    if seconds is None:
+        return '-'
+    if seconds < 1e-6:
+        return '%.1f ns' % (seconds * 1e9)
+    if seconds < 1e-3:
+        return '%.2f us' % (seconds * 1e6)
+    if seconds < 1:
+        return '%.2f ms' % (seconds * 1e3)
+    return '%.2f s' % seconds
+
+
+def fmt_bytes(size):
+    if size is None:
+        return '-'
+    for unit in ('B', 'KB', 'MB'):
+        if abs(size) < 1024:
+            return '%.1f %s' % (size, unit)
+        size /= 1024.0
+    return '%.1f GB' % size
+
+
+def print_table(title, headers, rows):
+    print(title)
+    widths = [max(len(str(c)) for c in col) for col in zip(headers, *rows)]
+    line = '  '.join('%%-%ds' % w for w in widths)
+    print(line % tuple(headers))
+    print(line % tuple('-' * w for w in widths))
+    for row in rows:
+        print(line % tuple(row))
+    print()
+    sys.stdout.flush()
@@ -0,0 +1,198 @@
+"""
+Benchmark suite of common operations of optenum, side by side with stdlib `enum`.
+
+    python -m benchmarks                                # run and print results
+    python -m benchmarks --json results.json           # save results
+    python -m benchmarks --baseline results.json       # compare with saved results. Exit 1 if any regression.
+    python -m benchmarks --quick --filter lookup       # skip big classes, run cases matching regex
+
+Results are best seconds per call.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import platform
+import re
+import sys
+from collections import OrderedDict
+
+from benchmarks.common import measure, measure_auto, make_options_class, fmt_seconds, print_table
+
+try:
+    import enum
+except ImportError:     # python 2.7 without enum34
+    enum = None
+
+SIZES = (10, 1000, 100000)
+QUICK_SIZES = (10, 1000)
+LOOKUP_SIZE = 1000
+THRESHOLD = 1.25
+"""A case regresses if it is slower than baseline by this ratio."""
+
+
+def make_int_enum(name, count):
+    return enum.IntEnum(name, [('OPT_%d' % i, i) for i in range(count)])
+
+
+def _creation_cases(sizes):
+    from optenum import Option
+    cases = [('option.construct', lambda: Option(1, 'FOO', 'Foo text'), None, False)]
+    for size in sizes:
+        cases.append(('class.create[%d]' % size,
+                      lambda size=size: make_options_class('Bench', size),
+                      (lambda size=size: make_int_enum('Bench', size)) if enum else None,
+                      size >= 100000))
+    return cases
+
+
+def _lookup_cases():
+    cls = make_options_class('Bench', LOOKUP_SIZE)
+    e = make_int_enum('Bench', LOOKUP_SIZE) if enum else None
+    name = 'OPT_%d' % (LOOKUP_SIZE // 2)
+    code = LOOKUP_SIZE // 2
+    opt = cls[name]
+    member = e[name] if e else None
+    return [
+        ('lookup.attribute', lambda: cls.OPT_500, (lambda: e.OPT_500) if e else None, False),
+        ('lookup.name', lambda: cls[name], (lambda: e[name]) if e else None, False),
+        ('lookup.code', lambda: cls.from_code(code), (lambda: e(code)) if e else None, False),
+        ('contains.option', lambda: opt in cls, (lambda: member in e) if e else None, False),
+        ('contains.code', lambda: code in cls, (lambda: code in e._value2member_map_) if e else None, False),
+    ]
+
+
+def _collection_cases():
+    cls = make_options_class('Bench', LOOKUP_SIZE)
+    e = make_int_enum('Bench', LOOKUP_SIZE) if enum else None
+
+    def cold_get_list():
+        cls._invalidate_views()
+        return cls.get_list('code', 'name')
+
+    return [
+        ('get_list', lambda: cls.get_list('code', 'name'),
+         (lambda: [(m.value, m.name) for m in e]) if e else None, False),
+        ('get_list.cold', cold_get_list, None, False),
+        ('get_dict', lambda: cls.get_dict('code', 'name'),
+         (lambda: dict((m.value, m.name) for m in e)) if e else None, False),
+        ('choices', lambda: cls.choices(), (lambda: [(m.value, m.name) for m in e]) if e else None, False),
+    ]
+
+
+def _tag_cases():
+    cls = make_options_class('Bench', LOOKUP_SIZE, tags=True)
+    opt = cls.all[LOOKUP_SIZE // 2]
+
+    def regroup():
+        opt.add_tag('BENCH')
+        opt.remove_tag('BENCH')
+
+    def regroup_and_read():
+        regroup()
+        return cls.get_list('code')
+
+    def regroup_all():
+        with cls.batch_tags():
+            for o in cls.all:
+                o.add_tag('BENCH')
+        cls.set_tags(dict((o, o.tags[:-1]) for o in cls.all))
+
+    return [
+        ('tags.add_remove', regroup, None, False),
+        ('tags.add_remove+get_list', regroup_and_read, None, False),
+        ('tags.batch[%d]' % LOOKUP_SIZE, regroup_all, None, False),
+        ('contains.tag_group', lambda: opt in cls.TAG_0, None, False),
+    ]
+
+
+def collect_cases(quick=False):
+    """
+    :return: list of (name, optenum func, enum func or None, heavy). Heavy cases are measured once.
+    """
+    return (_creation_cases(QUICK_SIZES if quick else SIZES) + _lookup_cases() + _collection_cases() +
+            _tag_cases())
+
+
+def run_cases(cases, pattern=None):
+    """
+    :return: OrderedDict of {name: {'optenum': seconds, 'enum': seconds or None}}
+    """
+    results = OrderedDict()
+    for name, func, enum_func, heavy in cases:
+        if pattern and not re.search(pattern, name):
+            continue
+        if heavy:
+            measured = measure(func, repeat=1)
+            enum_measured = measure(enum_func, repeat=1) if enum_func else None
+        else:
+            measured = measure_auto(func)
+            enum_measured = measure_auto(enum_func) if enum_func else None
+        results[name] = {'optenum': measured, 'enum': enum_measured}
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Compare results with baseline.
+    :return: (rows of table, names of regressed cases)
+    """
+    rows = []
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, '-', fmt_seconds(result['optenum']), '-', 'new'))
+            continue
+        ratio = result['optenum'] / base['optenum']
+        status = 'REGRESSED' if ratio > threshold else ('improved' if ratio < 1 / threshold else '')
+        if status == 'REGRESSED':
+            regressions.append(name)
+        rows.append((name, fmt_seconds(base['optenum']), fmt_seconds(result['optenum']), '%.2fx' % ratio, status))
+    return rows, regressions
+
+
+def environment():
+    from optenum import __version__
+    return OrderedDict([('optenum', __version__), ('python', platform.python_version()),
+                        ('implementation', platform.python_implementation()), ('machine', platform.machine())])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark suite of optenum')
+    parser.add_argument('--json', help='save results to JSON file')
+    parser.add_argument('--baseline', help='compare with results saved by --json')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='slowdown ratio regarded as regression (default: %s)' % THRESHOLD)
+    parser.add_argument('--filter', help='run cases whose names match this regex')
+    parser.add_argument('--quick', action='store_true', help='skip classes of %d members' % SIZES[-1])
+    args = parser.parse_args(argv)
+
+    results = run_cases(collect_cases(args.quick), args.filter)
+    env = environment()
+    rows = []
+    for name, result in results.items():
+        ratio = '%.2fx' % (result['optenum'] / result['enum']) if result['enum'] else '-'
+        rows.append((name, fmt_seconds(result['optenum']), fmt_seconds(result['enum']), ratio))
+    print_table('optenum %(optenum)s on %(implementation)s %(python)s' % env,
+                ('case', 'optenum', 'enum', 'optenum/enum'), rows)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(OrderedDict([('environment', env), ('results', results)]), f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows, regressions = compare(results, baseline['results'], args.threshold)
+        print_table('Compared with %s (optenum %s on %s)' % (args.baseline, baseline['environment']['optenum'],
+                                                             baseline['environment']['python']),
+                    ('case', 'baseline', 'current', 'ratio', ''), rows)
+        if regressions:
+            print('%d cases regressed: %s' % (len(regressions), ', '.join(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -21,11 +21,18 @@ Features:
 """
 
 from __future__ import absolute_import
+import os
 from .version import __version__
 from .option import Option
-from .options import Options, OptionGroup
+from .options import Options, OptionGroup, TagGroup, InvalidValues
+from .query import Tag
+from .containers import OptionMap, OptionSet
 
-__all__ = ('Option', 'Options', 'OptionGroup' '__version__')
+if os.environ.get('OPTENUM_PROFILE'):
+    from .profiler import enable_from_environ
+    enable_from_environ()
+
+__all__ = ('Option', 'Options', 'OptionGroup', 'TagGroup', 'InvalidValues', 'Tag', 'OptionMap', 'OptionSet', '__version__')
 
 __copyright__ = "Copyright (c) 2019 Samuel Chen (Chen Wei)"
 __license__ = "MIT"
@@ -0,0 +1,73 @@
+"""
+Command line tools of optenum.
+
+    python -m optenum transcode SRC DST --options package.module:ClassName --columns COLUMN [COLUMN ...]
+"""
+from __future__ import print_function
+
+import argparse
+import sys
+import time
+
+
+def _unescape(s):
+    return s.encode('latin-1').decode('unicode_escape') if '\\' in s else s
+
+
+def transcode_command(args):
+    from .transcode import transcode, CHUNK_SIZE
+    from .options import _missing
+
+    columns = [int(c) if c.isdigit() and args.no_header else c for c in args.columns]
+    default = _missing
+    if args.keep_unknown:
+        default = None
+    elif args.default is not None:
+        default = args.default
+
+    started = time.time()
+    chunks = transcode(args.src, args.dst, args.options, columns, from_field=args.from_field,
+                       to_field=args.to_field, delimiter=_unescape(args.delimiter), header=not args.no_header,
+                       encoding=args.encoding, default=default, processes=args.processes,
+                       chunk_size=args.chunk_size or CHUNK_SIZE)
+    if args.verbose:
+        print('%d chunks transcoded in %.2f seconds' % (chunks, time.time() - started), file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m optenum')
+    commands = parser.add_subparsers(dest='command')
+
+    p = commands.add_parser('transcode', help='transcode columns of a CSV/TSV file through an Options class')
+    p.add_argument('src', help='source file')
+    p.add_argument('dst', help='output file')
+    p.add_argument('--options', required=True, help='Options class as "package.module:ClassName"')
+    p.add_argument('--columns', required=True, nargs='+', help='column names, or indexes with --no-header')
+    p.add_argument('--from', dest='from_field', default='code', choices=('code', 'name'),
+                   help='field of values in the columns (default: code)')
+    p.add_argument('--to', dest='to_field', default='name', choices=('code', 'name', 'text'),
+                   help='field to write (default: name)')
+    p.add_argument('--delimiter', default=',', help='delimiter. "\\t" for TSV (default: ",")')
+    p.add_argument('--no-header', action='store_true', help='the first line is not header')
+    p.add_argument('--encoding', default='utf-8', help='file encoding (default: utf-8)')
+    p.add_argument('--default', help='written for unknown values. Unknown values are errors if not given')
+    p.add_argument('--keep-unknown', action='store_true', help='keep unknown values as they are')
+    p.add_argument('--processes', type=int, help='number of worker processes (default: CPU count)')
+    p.add_argument('--chunk-size', type=int, help='bytes of a chunk')
+    p.add_argument('-v', '--verbose', action='store_true')
+    p.set_defaults(func=transcode_command)
+
+    args = parser.parse_args(argv)
+    if getattr(args, 'func', None) is None:
+        parser.print_help()
+        return 2
+    try:
+        args.func(args)
+    except (KeyError, ValueError, NameError, ImportError, IOError, OSError) as e:
+        print('error: %s' % e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Vectorized conversion between arrays of codes, names, texts and ordinals of options. Requires numpy.
+
+Ordinal is the index of option in declaration order (`Options.all`).
+Integer codes in a small range are looked up in a table indexed by code. Others are looked up by `np.searchsorted`
+over sorted keys.
+"""
+
+import numpy as np
+from .options import _missing
+
+FIELDS = ('code', 'name', 'text', 'ordinal')
+KEY_FIELDS = ('code', 'name')
+
+MAX_TABLE_SPAN = 1 << 20
+"""Integer codes are looked up in a table if `max(codes) - min(codes)` is less than it and 4 times of options."""
+
+
+class _Lookup(object):
+    """Precomputed arrays of an Options class."""
+
+    def __init__(self, cls):
+        options = cls.all
+        self.values = {
+            'code': _array([o.code for o in options]),
+            'name': np.array([o.name for o in options], dtype=np.str_),
+            'text': _array([o.text for o in options], dtype=object),
+            'ordinal': np.arange(len(options), dtype=np.intp),
+        }
+        self.indexes = {}
+
+    def index(self, field):
+        index = self.indexes.get(field, None)
+        if index is None:
+            index = self.indexes[field] = _Index(self.values[field])
+        return index
+
+
+class _Index(object):
+    """Find ordinals of keys."""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.table = None
+        self.sorted_keys = None
+        self.order = None
+        self.mapping = None
+
+        if keys.dtype.kind in 'iu' and len(keys):
+            low, high = int(keys.min()), int(keys.max())
+            span = high - low + 1
+            if span <= MAX_TABLE_SPAN and span <= 4 * len(keys) + 1024:
+                self.low, self.high = low, high
+                self.table = np.full(span, -1, dtype=np.intp)
+                self.table[keys - low] = np.arange(len(keys), dtype=np.intp)
+                return
+
+        if keys.dtype.kind != 'O':
+            self.order = np.argsort(keys, kind='stable')
+            self.sorted_keys = keys[self.order]
+        else:
+            # mixed types of codes can not be sorted
+            self.mapping = dict((k, i) for i, k in enumerate(keys.tolist()))
+
+    def ordinals(self, values):
+        """
+        :param values: ndarray of keys
+        :return: ndarray of ordinals. -1 if not found.
+        """
+        if self.table is not None and values.dtype.kind in 'iu':
+            ordinals = np.full(values.shape, -1, dtype=np.intp)
+            # compare and subtract in int64, small dtypes would overflow. uint64 above int64 max is never in table.
+            ints = values.astype(np.int64)
+            in_range = (ints >= self.low) & (ints <= self.high)
+            if values.dtype == np.uint64:
+                in_range &= values <= np.iinfo(np.int64).max
+            ordinals[in_range] = self.table[ints[in_range] - self.low]
+            return ordinals
+
+        if self.sorted_keys is not None and values.dtype.kind != 'O':
+            try:
+                positions = np.searchsorted(self.sorted_keys, values)
+            except TypeError:   # e.g. search strings in integers
+                return np.full(values.shape, -1, dtype=np.intp)
+            if len(self.sorted_keys) == 0:
+                return np.full(values.shape, -1, dtype=np.intp)
+            np.minimum(positions, len(self.sorted_keys) - 1, out=positions)
+            found = self.sorted_keys[positions] == values
+            return np.where(found, self.order[positions], -1)
+
+        mapping = self.mapping
+        if mapping is None:
+            mapping = self.mapping = dict((k, i) for i, k in enumerate(self.keys.tolist()))
+        get = mapping.get
+        return np.fromiter((_get(get, v) for v in values.ravel().tolist()),
+                           dtype=np.intp, count=values.size).reshape(values.shape)
+
+
+def _get(get, value):
+    try:
+        return get(value, -1)
+    except TypeError:   # unhashable
+        return -1
+
+
+def _array(values, dtype=None):
+    """ndarray of values. Object array unless values are all int, float or str."""
+    if dtype is None and len(set(type(v) for v in values)) == 1 and type(values[0]) in (int, float, str):
+        try:
+            return np.array(values)
+        except OverflowError:   # int out of int64
+            pass
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+
+def lookup(cls):
+    """Precomputed arrays of Options class. Cached in views of the class."""
+    views = cls.__views__
+    lookup_ = views.get('arrays', None)
+    if lookup_ is None:
+        lookup_ = views['arrays'] = _Lookup(cls)
+    return lookup_
+
+
+def _check_field(field):
+    if field not in FIELDS:
+        raise NameError("'%s' is incorrect field. Only %s are available." % (str(field), ', '.join(FIELDS)))
+
+
+def take(cls, ordinals, field, default=None, found=None):
+    """
+    Values of `field` of options at `ordinals`.
+    :param cls: Options class
+    :param ordinals: ndarray of ordinals. Negative means not found.
+    :param field: `code`, `name`, `text` or `ordinal`
+    :param default: value for not found ordinals
+    :param found: bool ndarray `ordinals >= 0` if already computed
+    :return: ndarray
+    """
+    _check_field(field)
+    if found is None:
+        found = ordinals >= 0
+    all_found = bool(found.all())
+
+    target = lookup(cls).values[field]
+    if len(target) == 0:
+        result = np.empty(ordinals.shape, dtype=target.dtype)
+    else:
+        result = target[ordinals if all_found else np.where(found, ordinals, 0)]
+
+    if not all_found:
+        default_dtype = np.asarray(default).dtype
+        if (result.dtype.kind in 'iuf' and default_dtype.kind in 'iuf') or \
+                result.dtype.kind == default_dtype.kind == 'U':
+            dtype = np.result_type(result.dtype, default_dtype)
+        else:
+            dtype = np.dtype(object)
+        result = result.astype(dtype, copy=False)
+        result[~found] = default
+    return result
+
+
+def convert(cls, values, from_field, to_field, default=_missing, mask=False):
+    """
+    Convert array of `from_field` values to array of `to_field` values.
+    :param cls: Options class
+    :param values: array-like of codes or names
+    :param from_field: `code` or `name`
+    :param to_field: `code`, `name`, `text` or `ordinal`
+    :param default: value for unknown values. Raise KeyError if unknown value found and default not given.
+    :param mask: return (result, mask) if True. mask is a bool ndarray. True means the value is found.
+    :return: ndarray. Or (ndarray, mask) if `mask` is True.
+    """
+    if from_field not in KEY_FIELDS:
+        raise NameError("'%s' is not correct key field. Only 'code' and 'name' can be key field." % str(from_field))
+    _check_field(to_field)
+
+    lookup_ = lookup(cls)
+    index = lookup_.index(from_field)
+    if not isinstance(values, np.ndarray):
+        # keep types of mixed codes. e.g. [1, 'a'] is not ['1', 'a']
+        values = np.asarray(values, dtype=object if index.keys.dtype.kind == 'O' else None)
+    ordinals = index.ordinals(values)
+    found = ordinals >= 0
+    all_found = bool(found.all())
+
+    if not all_found and default is _missing:
+        raise KeyError('"%s" is not a %s of %s' % (values[~found].flat[0], from_field, cls.__name__))
+    result = take(cls, ordinals, to_field, default, found)
+
+    return (result, found) if mask else result
@@ -0,0 +1,206 @@
+"""
+Columns of codes as pandas Categorical or Arrow dictionary arrays. Requires numpy, and pandas or pyarrow.
+
+Categories (dictionary) of a column are codes of the Options class in declaration order (`Options.codes`), so the
+category codes (dictionary indices) of a column are ordinals of options. Conversions go through arrays of ordinals
+and never create Option objects.
+"""
+
+import numpy as np
+from .arrays import convert, lookup, take
+from .options import _missing
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+def _require(module, name):
+    if module is None:
+        raise ImportError('%s is required. Install it with `pip install %s`.' % (name, name))
+
+
+def _isnull(values):
+    if pd is not None:
+        return np.asarray(pd.isna(values), dtype=bool)
+    if values.dtype.kind == 'f':
+        return np.isnan(values)
+    if values.dtype.kind == 'O':
+        return np.fromiter((v is None or v != v for v in values.tolist()), dtype=bool, count=values.size)
+    return np.zeros(values.shape, dtype=bool)
+
+
+def _to_numpy(values):
+    if pd is not None and isinstance(values, (pd.Series, pd.Index)):
+        return values.to_numpy()
+    if pa is not None and isinstance(values, (pa.Array, pa.ChunkedArray)):
+        return values.to_numpy(zero_copy_only=False)
+    return values
+
+
+def _ordinals(cls, codes, strict=True):
+    """
+    Ordinals of codes. Null codes are -1.
+    :param strict: raise KeyError for unknown codes if True. Unknown codes are -1 if False.
+    :return: ndarray of ordinals
+    """
+    codes = _to_numpy(codes)
+    if not isinstance(codes, np.ndarray):
+        codes = np.asarray(codes, dtype=object if lookup(cls).values['code'].dtype.kind == 'O' else None)
+
+    null = _isnull(codes)
+    has_null = bool(null.any())
+    if has_null:
+        codes = codes[~null]
+    if codes.dtype.kind in 'fO' and lookup(cls).values['code'].dtype.kind in 'iu':
+        # integer codes with nulls are floats or objects
+        try:
+            ints = codes.astype(np.int64)
+            if (ints == codes).all():
+                codes = ints
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    ordinals = convert(cls, codes, 'code', 'ordinal', default=_missing if strict else -1)
+    if has_null:
+        result = np.full(null.shape, -1, dtype=ordinals.dtype)
+        result[~null] = ordinals
+        ordinals = result
+    return ordinals
+
+
+def _recode(cls, categories, indices):
+    """Ordinals of a column of `indices` into `categories`. Null (negative) indices and unknown categories are -1."""
+    category_ordinals = np.append(_ordinals(cls, categories, strict=False), -1)
+    indices = np.asarray(indices)
+    return category_ordinals[np.where(indices >= 0, indices, -1)]
+
+
+def categorical_dtype(cls, ordered=False):
+    """
+    `pandas.CategoricalDtype` of an Options class. Categories are codes in declaration order.
+    :param cls: Options class
+    :param ordered: if categories are ordered (by declaration order)
+    :return: `pandas.CategoricalDtype`
+    """
+    _require(pd, 'pandas')
+    key = ('categorical_dtype', bool(ordered))
+    views = cls.__views__
+    dtype = views.get(key, None)
+    if dtype is None:
+        dtype = views[key] = pd.CategoricalDtype(categories=list(cls.codes), ordered=ordered)
+    return dtype
+
+
+def to_categorical(cls, codes, ordered=False, strict=True):
+    """
+    Convert codes to `pandas.Categorical` of `categorical_dtype(cls)`. Null codes are missing values.
+    :param cls: Options class
+    :param codes: array-like or `pandas.Series` of codes
+    :param ordered: if categories are ordered (by declaration order)
+    :param strict: raise KeyError for unknown codes if True. Unknown codes are missing values if False.
+    :return: `pandas.Categorical`. `pandas.Series` if `codes` is a Series.
+    """
+    _require(pd, 'pandas')
+    categorical = pd.Categorical.from_codes(_ordinals(cls, codes, strict), dtype=categorical_dtype(cls, ordered))
+    if isinstance(codes, pd.Series):
+        return pd.Series(categorical, index=codes.index, name=codes.name)
+    return categorical
+
+
+def from_categorical(cls, values, field='name', default=None):
+    """
+    Convert `pandas.Categorical` of codes to ndarray of names, texts, codes or ordinals.
+    Categories do not need to be `categorical_dtype(cls)`.
+    :param cls: Options class
+    :param values: `pandas.Categorical` or categorical `pandas.Series`
+    :param field: `name`, `text`, `code` or `ordinal`
+    :param default: value for missing values and unknown categories
+    :return: ndarray. `pandas.Series` if `values` is a Series.
+    """
+    _require(pd, 'pandas')
+    categorical = values.array if isinstance(values, pd.Series) else values
+    if not isinstance(categorical, pd.Categorical):
+        raise TypeError('pandas.Categorical is required. Got %s.' % type(values).__name__)
+
+    if categorical.categories.equals(categorical_dtype(cls).categories):
+        ordinals = categorical.codes.astype(np.intp)
+    else:
+        ordinals = _recode(cls, categorical.categories, categorical.codes)
+    result = take(cls, ordinals, field, default)
+
+    if isinstance(values, pd.Series):
+        return pd.Series(result, index=values.index, name=values.name)
+    return result
+
+
+def arrow_type(cls, index_type=None):
+    """
+    Arrow dictionary type of an Options class. Codes must be in one type.
+    :param cls: Options class
+    :param index_type: Arrow integer type of indices. Default is `pyarrow.int32()`.
+    :return: `pyarrow.DictionaryType`
+    """
+    _require(pa, 'pyarrow')
+    return pa.dictionary(index_type or pa.int32(), _arrow_dictionary(cls).type)
+
+
+def _arrow_dictionary(cls):
+    views = cls.__views__
+    dictionary = views.get('arrow_dictionary', None)
+    if dictionary is None:
+        dictionary = views['arrow_dictionary'] = pa.array(list(cls.codes))
+    return dictionary
+
+
+def to_arrow(cls, codes, index_type=None, strict=True):
+    """
+    Convert codes to Arrow dictionary array. Dictionary is codes in declaration order. Null codes are nulls.
+    :param cls: Options class
+    :param codes: array-like, `pandas.Series` or Arrow array of codes
+    :param index_type: Arrow integer type of indices. Default is `pyarrow.int32()`.
+    :param strict: raise KeyError for unknown codes if True. Unknown codes are nulls if False.
+    :return: `pyarrow.DictionaryArray`
+    """
+    _require(pa, 'pyarrow')
+    index_type = index_type or pa.int32()
+    ordinals = _ordinals(cls, codes, strict)
+    indices = pa.array(ordinals.astype(index_type.to_pandas_dtype()), mask=ordinals < 0, type=index_type)
+    return pa.DictionaryArray.from_arrays(indices, _arrow_dictionary(cls))
+
+
+def from_arrow(cls, array, field='name', default=None):
+    """
+    Convert Arrow dictionary array of codes to ndarray of names, texts, codes or ordinals.
+    Dictionary does not need to be the one of `to_arrow`.
+    :param cls: Options class
+    :param array: `pyarrow.DictionaryArray` or `pyarrow.ChunkedArray` of dictionary type
+    :param field: `name`, `text`, `code` or `ordinal`
+    :param default: value for nulls and unknown codes
+    :return: ndarray
+    """
+    _require(pa, 'pyarrow')
+    chunks = array.chunks if isinstance(array, pa.ChunkedArray) else [array]
+    dictionary = _arrow_dictionary(cls)
+    parts = []
+    for chunk in chunks:
+        if not isinstance(chunk, pa.DictionaryArray):
+            raise TypeError('pyarrow.DictionaryArray is required. Got %s.' % type(chunk).__name__)
+        valid = ~np.asarray(chunk.indices.is_null().to_numpy(zero_copy_only=False), dtype=bool)
+        indices = np.where(valid, chunk.indices.to_numpy(zero_copy_only=False), -1).astype(np.intp)
+        if chunk.dictionary.equals(dictionary):
+            parts.append(indices)
+        else:
+            parts.append(_recode(cls, chunk.dictionary, indices))
+
+    ordinals = np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+    return take(cls, ordinals, field, default)
+
+
+__all__ = ('categorical_dtype', 'to_categorical', 'from_categorical', 'arrow_type', 'to_arrow', 'from_arrow')
@@ -0,0 +1,379 @@
+"""
+Containers of options of an Options class, indexed by ordinals of options (`Option.ordinal`, index in `all`)
+instead of hashing option objects.
+
+    prices = OptionMap(Fruit, {Fruit.APPLE: 1.5})
+    prices[Fruit.BANANA] = 0.5
+    prices['ORANGE'] = 2        # name or code is coerced to option
+    list(prices.items())        # in declaration order
+
+    allowed = OptionSet(Permission, [Permission.READ, 'WRITE'])
+    allowed & OptionSet.from_int(Permission, 5)
+    allowed.to_bytes()          # store in a DB column
+"""
+
+import binascii
+try:
+    from collections.abc import MutableMapping, MutableSet, Set
+except ImportError:     # python 2.7
+    from collections import MutableMapping, MutableSet, Set
+from .options import _missing
+from .query import positions
+
+
+class OptionMap(MutableMapping):
+    """
+    Mapping of {option: value} for options of an Options class, like Java `EnumMap`.
+    Values are kept in a list of fixed size indexed by ordinals of options. Iteration is in declaration order.
+    Keys are options of the class. Codes and names are coerced to options (see `Options.coerce()`).
+    """
+
+    __slots__ = ('options_class', '_options', '_ordinals', '_values', '_size')
+
+    def __init__(self, options_class, items=()):
+        """
+        :param options_class: Options class
+        :param items: dict or iterable of (option, value) pairs
+        """
+        self.options_class = options_class
+        self._options = options_class.all
+        self._ordinals = options_class.__option_ordinals__
+        self._values = [_missing] * len(self._options)
+        self._size = 0
+        if items:
+            self.update(items)
+
+    def _ordinal(self, key):
+        ordinal = self._ordinals.get(id(key), None)
+        if ordinal is None:
+            ordinal = self._ordinals[id(self.options_class.coerce(key))]
+        return ordinal
+
+    def __getitem__(self, key):
+        value = self._values[self._ordinal(key)]
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        ordinal = self._ordinal(key)
+        if self._values[ordinal] is _missing:
+            self._size += 1
+        self._values[ordinal] = value
+
+    def __delitem__(self, key):
+        ordinal = self._ordinal(key)
+        if self._values[ordinal] is _missing:
+            raise KeyError(key)
+        self._values[ordinal] = _missing
+        self._size -= 1
+
+    def __contains__(self, key):
+        try:
+            return self._values[self._ordinal(key)] is not _missing
+        except (KeyError, TypeError):
+            return False
+
+    def get(self, key, default=None):
+        try:
+            value = self._values[self._ordinal(key)]
+        except (KeyError, TypeError):
+            return default
+        return default if value is _missing else value
+
+    def __iter__(self):
+        return (o for o, v in zip(self._options, self._values) if v is not _missing)
+
+    def __len__(self):
+        return self._size
+
+    def keys(self):
+        """:return: list of options in declaration order"""
+        return list(self)
+
+    def values(self):
+        """:return: list of values in declaration order"""
+        return [v for v in self._values if v is not _missing]
+
+    def items(self):
+        """:return: list of (option, value) in declaration order"""
+        return [(o, v) for o, v in zip(self._options, self._values) if v is not _missing]
+
+    def fill(self, value, keys=None):
+        """
+        Set all options (or options of `keys`) to `value`.
+        :param value: value
+        :param keys: options, codes or names. All options if None.
+        :return:
+        """
+        if keys is None:
+            self._values = [value] * len(self._options)
+            self._size = len(self._options)
+        else:
+            for key in keys:
+                self[key] = value
+
+    def clear(self):
+        """Remove all options."""
+        self._values = [_missing] * len(self._options)
+        self._size = 0
+
+    reset = clear
+
+    def copy(self):
+        other = OptionMap(self.options_class)
+        other._values = list(self._values)
+        other._size = self._size
+        return other
+
+    __copy__ = copy
+
+    def __eq__(self, other):
+        if isinstance(other, OptionMap):
+            return self.options_class is other.options_class and self._values == other._values
+        return super(OptionMap, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return OptionMap, (self.options_class, self.items())
+
+    def __repr__(self):
+        return 'OptionMap(%s, {%s})' % (self.options_class.__name__,
+                                        ', '.join('%s: %r' % (o.name, v) for o, v in self.items()))
+
+
+class OptionSet(MutableSet):
+    """
+    Set of options of an Options class, like Java `EnumSet`. Membership is a bitmask (an int) of ordinals of options.
+    Iteration is in declaration order. Set algebra of OptionSets of the same class is bitwise.
+    Items are options of the class. Codes and names are coerced to options (see `Options.coerce()`).
+    """
+
+    __slots__ = ('options_class', '_options', '_ordinals', 'mask')
+
+    def __init__(self, options_class, items=(), mask=0):
+        """
+        :param options_class: Options class
+        :param items: iterable of options, codes or names
+        :param mask: bitmask of ordinals. Bit `i` is `options_class.all[i]`.
+        """
+        self.options_class = options_class
+        self._options = options_class.all
+        self._ordinals = options_class.__option_ordinals__
+        if mask >> len(self._options) or mask < 0:
+            raise ValueError('%s is not a mask of options of %s' % (mask, options_class.__name__))
+        for item in items:
+            mask |= self._bit(item)
+        self.mask = mask
+
+    @classmethod
+    def from_int(cls, options_class, mask):
+        """
+        :param options_class: Options class
+        :param mask: int returned by `int(option_set)`
+        :return: OptionSet
+        """
+        return cls(options_class, mask=mask)
+
+    @classmethod
+    def from_bytes(cls, options_class, data):
+        """
+        :param options_class: Options class
+        :param data: bytes returned by `to_bytes()`
+        :return: OptionSet
+        """
+        return cls(options_class, mask=int(binascii.hexlify(bytes(bytearray(data)[::-1])) or b'0', 16))
+
+    @classmethod
+    def all_of(cls, options_class):
+        """:return: OptionSet of all options of `options_class`"""
+        return cls(options_class, mask=(1 << len(options_class.all)) - 1)
+
+    def to_bytes(self):
+        """
+        :return: bytes of the mask in little endian. Length is fixed for the Options class (1 byte per 8 options).
+        """
+        length = (len(self._options) + 7) // 8
+        return binascii.unhexlify('%0*x' % (length * 2, self.mask))[::-1] if length else b''
+
+    def __int__(self):
+        return self.mask
+
+    def _bit(self, item):
+        ordinal = self._ordinals.get(id(item), None)
+        if ordinal is None:
+            ordinal = self._ordinals[id(self.options_class.coerce(item))]
+        return 1 << ordinal
+
+    def _new(self, mask):
+        other = OptionSet.__new__(OptionSet)
+        other.options_class = self.options_class
+        other._options = self._options
+        other._ordinals = self._ordinals
+        other.mask = mask
+        return other
+
+    def _mask_of(self, other, strict=True):
+        """
+        Mask of OptionSet of the same class, or of a set, list or tuple of items.
+        :param strict: raise KeyError for items not of the class. They are skipped if False.
+        :return: mask, or None if `other` is not supported
+        """
+        if type(other) is OptionSet and other.options_class is self.options_class:
+            return other.mask
+        if isinstance(other, OptionSet):
+            if other.options_class is not self.options_class:
+                raise TypeError('OptionSet of %s and %s can not be operated together.'
+                                % (self.options_class.__name__, other.options_class.__name__))
+            return other.mask
+        if not isinstance(other, (Set, list, tuple)):
+            return None
+        if strict:
+            return OptionSet(self.options_class, other).mask
+        mask = 0
+        for item in other:
+            try:
+                mask |= self._bit(item)
+            except (KeyError, TypeError):
+                pass
+        return mask
+
+    def add(self, item):
+        self.mask |= self._bit(item)
+
+    def discard(self, item):
+        try:
+            self.mask &= ~self._bit(item)
+        except (KeyError, TypeError):
+            pass
+
+    def remove(self, item):
+        bit = self._bit(item)
+        if not self.mask & bit:
+            raise KeyError(item)
+        self.mask &= ~bit
+
+    def clear(self):
+        self.mask = 0
+
+    def copy(self):
+        return self._new(self.mask)
+
+    __copy__ = copy
+
+    def __contains__(self, item):
+        ordinal = self._ordinals.get(id(item), None)
+        if ordinal is None:
+            try:
+                ordinal = self._ordinals[id(self.options_class.coerce(item))]
+            except KeyError:
+                return False
+        return self.mask >> ordinal & 1 == 1
+
+    def __iter__(self):
+        options = self._options
+        return (options[i] for i in positions(self.mask))
+
+    def __len__(self):
+        return bin(self.mask).count('1')
+
+    def __bool__(self):
+        return self.mask != 0
+
+    __nonzero__ = __bool__
+
+    def __or__(self, other):
+        mask = self._mask_of(other)
+        return NotImplemented if mask is None else self._new(self.mask | mask)
+
+    def __and__(self, other):
+        mask = self._mask_of(other, strict=False)
+        return NotImplemented if mask is None else self._new(self.mask & mask)
+
+    def __sub__(self, other):
+        mask = self._mask_of(other, strict=False)
+        return NotImplemented if mask is None else self._new(self.mask & ~mask)
+
+    def __xor__(self, other):
+        mask = self._mask_of(other)
+        return NotImplemented if mask is None else self._new(self.mask ^ mask)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __rsub__(self, other):
+        mask = self._mask_of(other)
+        return NotImplemented if mask is None else self._new(mask & ~self.mask)
+
+    def __ior__(self, other):
+        self.mask |= self._mask_of(other)
+        return self
+
+    def __iand__(self, other):
+        self.mask &= self._mask_of(other, strict=False)
+        return self
+
+    def __isub__(self, other):
+        self.mask &= ~self._mask_of(other, strict=False)
+        return self
+
+    def __ixor__(self, other):
+        self.mask ^= self._mask_of(other)
+        return self
+
+    def __invert__(self):
+        """:return: OptionSet of the other options of the class"""
+        return self._new(self.mask ^ ((1 << len(self._options)) - 1))
+
+    def __eq__(self, other):
+        if isinstance(other, OptionSet):
+            return self.options_class is other.options_class and self.mask == other.mask
+        return Set.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __le__(self, other):
+        if isinstance(other, OptionSet) and other.options_class is self.options_class:
+            return self.mask & ~other.mask == 0
+        return Set.__le__(self, other)
+
+    def __ge__(self, other):
+        if isinstance(other, OptionSet) and other.options_class is self.options_class:
+            return other.mask & ~self.mask == 0
+        return Set.__ge__(self, other)
+
+    def __lt__(self, other):
+        return self != other and self <= other
+
+    def __gt__(self, other):
+        return self != other and self >= other
+
+    def issubset(self, other):
+        """:param other: iterable of options, codes or names"""
+        return self.mask & ~self._mask_of(other if isinstance(other, OptionSet) else list(other), False) == 0
+
+    def issuperset(self, other):
+        """:param other: iterable of options, codes or names"""
+        return all(item in self for item in other)
+
+    def isdisjoint(self, other):
+        """:param other: iterable of options, codes or names"""
+        return not self.mask & self._mask_of(other if isinstance(other, OptionSet) else list(other), False)
+
+    def __reduce__(self):
+        return OptionSet, (self.options_class, (), self.mask)
+
+    def __repr__(self):
+        return 'OptionSet(%s, {%s})' % (self.options_class.__name__, ', '.join(o.name for o in self))
+
+
+__all__ = ('OptionMap', 'OptionSet')
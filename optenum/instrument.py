@@ -0,0 +1,188 @@
+"""
+Runtime instrumentation of Options classes. It counts per class:
+
+  * `name_lookups` - `MyOptions['NAME']` and `MyOptions.get()`
+  * `code_lookups` - `from_code()`, `from_codes()` (one per code) and `coerce()`
+  * `text_lookups` - `from_text()`
+  * `misses` - lookups above which found no option of the class
+  * `contains` / `contains_misses` - `x in MyOptions` and how many were False
+  * `projections` / `projection_seconds` - calls of `get_list()`, `get_dict()` (and `choices()`) and time spent
+  * `tag_mutations` - `add_tag()` and `remove_tag()` of options of the class
+
+    from optenum import instrument
+
+    instrument.enable(hook=send_metrics, every=100000)   # hook(snapshot) is called every 100000 counted events
+    ...
+    instrument.snapshot()       # {'myapp.enums.Fruit': {'code_lookups': 1024, 'misses': 3, ...}, ...}
+    instrument.disable()
+
+Instrumented methods are swapped into `OptionsMeta` by `enable()` and the originals are restored by `disable()`,
+so there is no cost when disabled. Attribute access such as `MyOptions.NAME` is not counted.
+Counters are not locked. They may be slightly off if several threads lookup at the same time.
+"""
+
+import time
+from collections import defaultdict
+from .options import OptionsMeta
+
+timer = getattr(time, 'perf_counter', time.time)
+
+COUNTERS = ('name_lookups', 'code_lookups', 'text_lookups', 'misses', 'contains', 'contains_misses',
+            'projections', 'projection_seconds', 'tag_mutations')
+
+_counters = {}     # {Options class: {counter: value}}. Classes are kept until `reset()`.
+_originals = {}
+_hook = {'func': None, 'every': 0, 'countdown': 0}
+
+
+def _class_counters(cls):
+    try:
+        return _counters[cls]
+    except KeyError:
+        counters = _counters[cls] = defaultdict(int)
+        return counters
+
+
+def _event(counters, key, count=1):
+    counters[key] += count
+    hook = _hook
+    if hook['func'] is not None:
+        hook['countdown'] -= count
+        if hook['countdown'] <= 0:
+            hook['countdown'] = hook['every']
+            hook['func'](snapshot())
+
+
+def _lookup(func, key):
+    def wrapper(cls, *args, **kwargs):
+        counters = _class_counters(cls)
+        try:
+            result = func(cls, *args, **kwargs)
+        except KeyError:
+            counters['misses'] += 1
+            raise
+        finally:
+            _event(counters, key)
+        if id(result) not in cls.__option_ids__:
+            counters['misses'] += 1
+        return result
+    return wrapper
+
+
+def _from_codes(func):
+    def wrapper(cls, codes, *args, **kwargs):
+        counters = _class_counters(cls)
+        try:
+            result = func(cls, codes, *args, **kwargs)
+        except KeyError:
+            counters['misses'] += 1
+            _event(counters, 'code_lookups')
+            raise
+        ids = cls.__option_ids__
+        misses = sum(1 for o in result if id(o) not in ids)
+        if misses:
+            counters['misses'] += misses
+        _event(counters, 'code_lookups', len(result))
+        return result
+    return wrapper
+
+
+def _contains(func):
+    def wrapper(cls, item):
+        counters = _class_counters(cls)
+        result = func(cls, item)
+        if not result:
+            counters['contains_misses'] += 1
+        _event(counters, 'contains')
+        return result
+    return wrapper
+
+
+def _projection(func):
+    def wrapper(cls, *args, **kwargs):
+        counters = _class_counters(cls)
+        started = timer()
+        try:
+            return func(cls, *args, **kwargs)
+        finally:
+            counters['projection_seconds'] += timer() - started
+            _event(counters, 'projections')
+    return wrapper
+
+
+def _tag_mutation(func):
+    def wrapper(cls, *args, **kwargs):
+        try:
+            return func(cls, *args, **kwargs)
+        finally:
+            _event(_class_counters(cls), 'tag_mutations')
+    return wrapper
+
+
+_INSTRUMENTS = (
+    ('__getitem__', lambda f: _lookup(f, 'name_lookups')),
+    ('get', lambda f: _lookup(f, 'name_lookups')),
+    ('from_code', lambda f: _lookup(f, 'code_lookups')),
+    ('coerce', lambda f: _lookup(f, 'code_lookups')),
+    ('from_text', lambda f: _lookup(f, 'text_lookups')),
+    ('from_codes', _from_codes),
+    ('__contains__', _contains),
+    ('get_list', _projection),
+    ('get_dict', _projection),
+    ('_add_option_to_group', _tag_mutation),
+    ('_remove_option_from_group', _tag_mutation),
+)
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def enable(hook=None, every=100000):
+    """
+    Swap instrumented methods into `OptionsMeta`. Counting starts from current counters. Call `reset()` to clear.
+    :param hook: callable `hook(snapshot)` called every `every` counted events. Optional.
+    :param every: events between two calls of `hook`.
+    :return:
+    """
+    _hook.update(func=hook, every=every, countdown=every)
+    if _originals:
+        return
+    for name, instrument in _INSTRUMENTS:
+        original = OptionsMeta.__dict__[name]
+        _originals[name] = original
+        setattr(OptionsMeta, name, instrument(original))
+
+
+def disable():
+    """
+    Restore original methods of `OptionsMeta`. Counters are kept.
+    :return:
+    """
+    for name, original in _originals.items():
+        setattr(OptionsMeta, name, original)
+    _originals.clear()
+    _hook.update(func=None, every=0, countdown=0)
+
+
+def snapshot(reset_counters=False):
+    """
+    Counters of all instrumented Options classes.
+    :param reset_counters: clear counters after taken
+    :return: dict of {"module.ClassName": {counter: value}}. Only non-zero counters are included.
+    """
+    result = {}
+    for cls, counters in list(_counters.items()):
+        name = '%s.%s' % (cls.__module__, getattr(cls, '__qualname__', cls.__name__))
+        result[name] = dict((k, v) for k, v in counters.items() if v)
+    if reset_counters:
+        reset()
+    return result
+
+
+def reset():
+    """Clear all counters."""
+    _counters.clear()
+
+
+__all__ = ('enable', 'disable', 'is_enabled', 'snapshot', 'reset', 'COUNTERS')
@@ -0,0 +1,211 @@
+"""
+Loaders stream code table files (CSV, JSON Lines) into an Options class.
+
+Rows are read line by line and converted to `Option` objects one at a time. Big files are memory-mapped.
+Invalid rows are reported and skipped so that a load is never stopped by a bad row.
+"""
+
+import csv
+import json
+import logging
+import mmap
+import os
+import sys
+import six
+from .option import Option
+from .options import Options
+
+log = logging.getLogger(__name__)
+
+FIELDS = ('name', 'code', 'text', 'tags')
+"""Fields of a row. Also the column order of CSV file without header."""
+
+MMAP_THRESHOLD = 64 * 1024 * 1024
+"""Files not smaller than this (bytes) are memory-mapped."""
+
+PROGRESS_EVERY = 10000
+"""Rows between two progress reports."""
+
+
+class _Reader(object):
+    """Iterate lines of a file. Keeps line number and position for reporting."""
+
+    def __init__(self, path, use_mmap=None):
+        self.path = path
+        self.use_mmap = use_mmap
+        self.position = 0
+
+    def __iter__(self):
+        with open(self.path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            use_mmap = self.use_mmap if self.use_mmap is not None else size >= MMAP_THRESHOLD
+            if use_mmap and size > 0:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    for line in iter(mm.readline, b''):
+                        self.position += len(line)
+                        yield line
+                finally:
+                    mm.close()
+            else:
+                for line in f:
+                    self.position += len(line)
+                    yield line
+
+
+def _caller_module(depth=2):
+    try:
+        return sys._getframe(depth).f_globals.get('__name__', '__main__')
+    except (AttributeError, ValueError):
+        return __name__
+
+
+def _report_error(on_error, line_num, row, error):
+    if on_error is None:
+        log.warning('Line %s %r is skipped. %s', line_num, row, error)
+    else:
+        on_error(line_num, row, error)
+
+
+def _iter_options(records, reader, code_type, progress, progress_every, on_error):
+    """
+    Convert records to Option objects. Invalid records are reported and skipped.
+    :param records: iterable of (line number, (name, code, text, tags) or exception)
+    :return: generator of Option objects
+    """
+    names = set()
+    codes = set()
+    count = 0
+    for line_num, record in records:
+        count += 1
+        try:
+            if isinstance(record, Exception):
+                raise record
+            name, code, text, tags = record
+            if code_type is not None and code is not None:
+                code = code_type(code)
+            if name in names:
+                raise AttributeError('Duplicated attribute "%s" found' % name)
+            if code in codes:
+                raise ValueError('Duplicated code "%s" found' % code)
+            opt = Option(code, name, text, tags)
+        except (ValueError, TypeError, AttributeError) as e:
+            _report_error(on_error, line_num, record, e)
+        else:
+            names.add(name)
+            codes.add(code)
+            yield opt
+
+        if progress is not None and count % progress_every == 0:
+            progress(count, reader.position)
+
+    if progress is not None and count % progress_every != 0:
+        progress(count, reader.position)
+
+
+def _csv_records(reader, header, delimiter, encoding, tags_separator):
+    if six.PY2:
+        csv_reader = csv.reader(reader, delimiter=delimiter)
+        rows = ([c.decode(encoding) for c in row] for row in csv_reader)
+    else:
+        csv_reader = csv.reader((line.decode(encoding) for line in reader), delimiter=delimiter)
+        rows = csv_reader
+
+    columns = [FIELDS.index(f) for f in FIELDS]
+    end = 0
+    for row in rows:
+        # a record may span lines in quoted fields. report the line it starts at.
+        line_num, end = end + 1, csv_reader.line_num
+        if header and line_num == 1:
+            columns = [row.index(f) if f in row else None for f in FIELDS]
+            if columns[0] is None or columns[1] is None:
+                raise ValueError('CSV header must have "name" and "code" columns. Got %s' % row)
+            continue
+        if not row:
+            continue
+
+        record = [row[i] if i is not None and i < len(row) else None for i in columns]
+        name, code, text, tags = record
+        if text == '':
+            text = None
+        tags = [t for t in tags.split(tags_separator) if t] if tags else None
+        yield line_num, (name, code, text, tags)
+
+
+def _jsonl_records(reader, encoding):
+    line_num = 0
+    for line in reader:
+        line_num += 1
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line.decode(encoding))
+            if isinstance(row, dict):
+                record = tuple(row.get(f) for f in FIELDS)
+            elif isinstance(row, list) and 2 <= len(row) <= len(FIELDS):
+                record = tuple(row) + (None, ) * (len(FIELDS) - len(row))
+            else:
+                raise ValueError('A row must be an object or an array of (name, code, text, tags).')
+        except ValueError as e:
+            record = e
+        yield line_num, record
+
+
+def load_csv(path, name, base=Options, header=True, delimiter=',', encoding='utf-8', tags_separator='|',
+             code_type=None, use_mmap=None, progress=None, progress_every=PROGRESS_EVERY, on_error=None, module=None):
+    """
+    Load a CSV file into an Options class. e.g.
+
+        name,code,text,tags
+        APPLE,1,Apple,FRUITS|RED
+        BANANA,2,Banana,FRUITS
+
+    :param path: path of CSV file.
+    :param name: name of the Options class.
+    :param base: base class of the Options class.
+    :param header: If the first line is header. Columns are in order of `FIELDS` if no header.
+    :param delimiter: CSV delimiter.
+    :param encoding: file encoding.
+    :param tags_separator: separator of tags in "tags" column.
+    :param code_type: callable to convert code. e.g. `int`. Codes are strings if not given.
+    :param use_mmap: memory-map the file. Default is True for files not smaller than `MMAP_THRESHOLD`.
+    :param progress: callback `progress(rows, bytes)` called every `progress_every` rows and at the end.
+    :param progress_every: rows between two progress reports.
+    :param on_error: callback `on_error(line_number, row, error)` for invalid rows. Logged as warning if not given.
+    :param module: `__module__` of the Options class. Default is the module of caller.
+    :return: Options class derived from `base`
+    """
+    reader = _Reader(path, use_mmap)
+    records = _csv_records(reader, header, delimiter, encoding, tags_separator)
+    options = _iter_options(records, reader, code_type, progress, progress_every, on_error)
+    return base.from_rows(name, options, module=module or _caller_module())
+
+
+def load_jsonl(path, name, base=Options, encoding='utf-8', code_type=None, use_mmap=None,
+               progress=None, progress_every=PROGRESS_EVERY, on_error=None, module=None):
+    """
+    Load a JSON Lines file into an Options class. Each line is an object or an array of (name, code, text, tags). e.g.
+
+        {"name": "APPLE", "code": 1, "text": "Apple", "tags": ["FRUITS", "RED"]}
+        ["BANANA", 2, "Banana", ["FRUITS"]]
+
+    :param path: path of JSON Lines file.
+    :param name: name of the Options class.
+    :param base: base class of the Options class.
+    :param encoding: file encoding.
+    :param code_type: callable to convert code. e.g. `int`.
+    :param use_mmap: memory-map the file. Default is True for files not smaller than `MMAP_THRESHOLD`.
+    :param progress: callback `progress(rows, bytes)` called every `progress_every` rows and at the end.
+    :param progress_every: rows between two progress reports.
+    :param on_error: callback `on_error(line_number, row, error)` for invalid rows. Logged as warning if not given.
+    :param module: `__module__` of the Options class. Default is the module of caller.
+    :return: Options class derived from `base`
+    """
+    reader = _Reader(path, use_mmap)
+    records = _jsonl_records(reader, encoding)
+    options = _iter_options(records, reader, code_type, progress, progress_every, on_error)
+    return base.from_rows(name, options, module=module or _caller_module())
+
+
+__all__ = ('load_csv', 'load_jsonl')
@@ -18,3 +18,32 @@ def is_identifier(s):
         return bool(m)
     else:
         return s.isidentifier()
+
+
+try:
+    from types import MappingProxyType
+except ImportError:     # python 2.7
+    import collections
+
+    class MappingProxyType(collections.Mapping):
+        """Read-only proxy of a mapping."""
+
+        __slots__ = ('_mapping', )
+
+        def __init__(self, mapping):
+            self._mapping = mapping
+
+        def __getitem__(self, key):
+            return self._mapping[key]
+
+        def __iter__(self):
+            return iter(self._mapping)
+
+        def __len__(self):
+            return len(self._mapping)
+
+        def __contains__(self, key):
+            return key in self._mapping
+
+        def __repr__(self):
+            return 'mappingproxy(%r)' % (self._mapping, )
@@ -2,6 +2,7 @@
 Option class represents a single option in a list of options/enum
 """
 import six
+from collections import OrderedDict
 from .mysix import is_identifier
 
 NUMBER_TYPES = six.integer_types + (float,)
@@ -10,32 +11,122 @@ DATE_TYPES = ()  # (datetime, date, time)
 AVAILABLE_CODE_TYPES = six.string_types + NUMBER_TYPES + DATE_TYPES
 AVAILABLE_CODE_TYPES_STR = ', '.join(t.__name__ for t in AVAILABLE_CODE_TYPES)
 
+OPTION_CLASS_CACHE_SIZE = 64
+"""Max number of Option classes kept for code types other than `AVAILABLE_CODE_TYPES` (e.g. subclass of int)."""
+
+_option_classes = {}
+_option_classes_cache = OrderedDict()
+
+
+EMPTY_TAGS = ()
+"""Shared tags of options without tag."""
+
+OPTION_SLOTS = ('code', 'name', 'text', '_tags', '_owner')
+"""Storage of an Option object. Used as `__slots__` if the code type supports it (int does not)."""
+
 
 class OptionPseudo(object):
 
-    def __init__(self, o):
-        self.__tags = set()
-        self.tag_added = None
-        self.tag_removed = None
+    __slots__ = ()
 
     @property
     def tags(self):
-        """Generator of tags"""
-        return (tag for tag in self.__tags)
+        """Tuple of tags"""
+        return self._tags
+
+    @property
+    def ordinal(self):
+        """Index of the option in `all` of its Options class (0..n-1). None if it belongs to no Options class."""
+        owner = self._owner
+        return None if owner is None else owner.__option_ordinals__[id(self)]
 
     def add_tag(self, tag):
-        self.__tags.add(tag)
-        if callable(self.tag_added):
-            self.tag_added(tag)
+        owner = self._owner
+        if owner is None:
+            if tag not in self._tags:
+                self._tags = self._tags + (tag, )
+            return
+        with owner.__tag_lock__:
+            if tag in self._tags:
+                return
+            self._tags = self._tags + (tag, )
+            owner._add_option_to_group(self, tag)
 
     def remove_tag(self, tag):
-        self.__tags.remove(tag)
-        if callable(self.tag_removed):
-            self.tag_removed(tag)
+        owner = self._owner
+        if owner is None:
+            self._tags = self.__without_tag(tag)
+            return
+        with owner.__tag_lock__:
+            self._tags = self.__without_tag(tag)
+            owner._remove_option_from_group(self, tag)
+
+    def __without_tag(self, tag):
+        if tag not in self._tags:
+            raise KeyError(tag)
+        return tuple(t for t in self._tags if t != tag) or EMPTY_TAGS
 
     def get_text(self):
         return self.text if self.text is not None else self.name
 
+    def __reduce__(self):
+        # option of Options class is pickled as reference (Options class, name) and restored as the same object.
+        owner = self._owner
+        if owner is not None and getattr(owner, self.name, None) is self:
+            return getattr, (owner, self.name)
+        return Option, (self.code, self.name, self.text, self._tags)
+
+
+def _make_option_class(cls_code):
+    name = 'Option(%s)' % cls_code.__name__
+    try:
+        return type(name, (cls_code, OptionPseudo), {'__slots__': OPTION_SLOTS})
+    except TypeError:
+        # "nonempty __slots__ not supported for subtype of 'int'". Instances fall back to a (key-sharing) __dict__.
+        return type(name, (cls_code, OptionPseudo), {})
+
+
+def get_option_class(cls_code):
+    """
+    Get the Option class for a code type. All options with same code type share one class.
+    Classes for `AVAILABLE_CODE_TYPES` are kept forever. Others (subclass of them) are kept in a bounded LRU cache.
+    :param cls_code: type of option code. e.g. `int`, `str`
+    :return: Option class derived from `cls_code` and `OptionPseudo`
+    """
+    cls_option = _option_classes.get(cls_code, None)
+    if cls_option is not None:
+        return cls_option
+
+    if cls_code in AVAILABLE_CODE_TYPES:
+        return _option_classes.setdefault(cls_code, _make_option_class(cls_code))
+
+    cls_option = _option_classes_cache.pop(cls_code, None)
+    if cls_option is None:
+        cls_option = _make_option_class(cls_code)
+        while len(_option_classes_cache) >= OPTION_CLASS_CACHE_SIZE:
+            _option_classes_cache.popitem(last=False)
+    _option_classes_cache[cls_code] = cls_option
+    return cls_option
+
+
+def new_option(code, name, text, tags):
+    """
+    Create Option object WITHOUT validation. Use `Option(code, name, text, tags)` unless arguments are validated.
+    :param code: code of option
+    :param name: name of option
+    :param text: text of option
+    :param tags: tuple of unique tags
+    :return: Option object
+    """
+    cls_code = type(code)
+    obj_option = cls_code.__new__(get_option_class(cls_code), code)
+    obj_option.code = code
+    obj_option.name = name
+    obj_option.text = text
+    obj_option._tags = tags or EMPTY_TAGS
+    obj_option._owner = None
+    return obj_option
+
 
 class OptionMeta(type):
 
@@ -65,7 +156,7 @@ class OptionMeta(type):
             if not isinstance(name, six.string_types):
                 raise ValueError('Option name must be string type.')
 
-            if not (name[0].isalpha() and is_identifier(name) and name.isupper()):
+            if not (name[:1].isalpha() and is_identifier(name) and name.isupper()):
                 raise ValueError('Option name must be alphanumeric or "_"  in uppercase and start with alphabet.')
 
         if not ((code is None and name is None and text is None) or (code is not None and name is not None)):
@@ -74,14 +165,7 @@ class OptionMeta(type):
         if tags is not None and not isinstance(tags, (tuple, list)):
             raise ValueError('"tags" must be a tuple or list of strings.')
 
-        cls_code = type(code)
-        cls_option = type('Option(%s)' % cls_code.__name__, (cls_code, OptionPseudo), {})
-        obj_option = cls_option(code)
-        obj_option.code = code
-        obj_option.name = name
-        obj_option.text = text
-
-        if tags is not None:
+        if tags:
             for tag in tags:
                 if not isinstance(tag, six.string_types):
                     raise ValueError('"tags" must be a tuple or list of strings. "%s" is not a string object.' % tag)
@@ -89,9 +173,11 @@ class OptionMeta(type):
                     raise ValueError('A tag can not be empty')
                 if not is_identifier(tag) or tag.startswith('_') or not tag.isupper():
                     raise ValueError('Tags must be uppercase alphanumeric or "_" and must starts with alphabet.')
-                obj_option.add_tag(tag)
+            tags = tuple(OrderedDict.fromkeys(tags))
+        else:
+            tags = EMPTY_TAGS
 
-        return obj_option
+        return new_option(code, name, text, tags)
 
     def __subclasscheck__(cls, subclass):
         if issubclass(subclass, OptionPseudo):
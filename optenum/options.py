@@ -2,15 +2,29 @@
 Options represents an set of option items (enumerations). It can also represent as a collection of options/enum entries.
 """
 
+import sys
+import threading
 import six
 from collections import OrderedDict
+from contextlib import contextmanager
+from operator import attrgetter
 from .option import Option
+from .mysix import MappingProxyType
 import logging
 
 log = logging.getLogger(__name__)
 
+_missing = object()
+
 
 class OptionGroup(list):
+    """
+    Ordered set of options. It is a list in declaration order without duplicates, indexed by a set so that `in` is
+    O(1). Supports set algebra `|`, `&`, `-`, `^` and `issubset()`, `issuperset()`, `isdisjoint()`.
+    Members are compared by equality as in a list. e.g. code `1` is in a group of option `1`.
+    """
+
+    __slots__ = ('_members', '_unhashable')
 
     def __init__(self, *args):
 
@@ -25,36 +39,295 @@ class OptionGroup(list):
         #
 
         super(OptionGroup, self).__init__()
+        self._members = set()
+        self._unhashable = []   # raw values in class body may be unhashable. e.g. ('C', 'C is letter', ['FOO'])
         for arg in args:
             if isinstance(arg, OptionGroup):
-                for a in arg:
-                    if a not in self:
-                        self.append(a)
+                self._extend(arg)
             else:
-                if arg not in self:
-                    self.append(arg)
+                self._append(arg)
+
+    def _append(self, item):
+        """Append item if not in the group. :return: True if appended."""
+        try:
+            if item in self._members:
+                return False
+            self._members.add(item)
+        except TypeError:   # unhashable
+            if item in self._unhashable:
+                return False
+            self._unhashable.append(item)
+        super(OptionGroup, self).append(item)
+        return True
+
+    def _extend(self, items):
+        members = self._members
+        append = super(OptionGroup, self).append
+        for item in items:
+            try:
+                if item in members:
+                    continue
+                members.add(item)
+            except TypeError:   # unhashable
+                if item in self._unhashable:
+                    continue
+                self._unhashable.append(item)
+            append(item)
+
+    def _reindex(self):
+        """Rebuild index and drop duplicates after the list is changed in place."""
+        items = list(self)
+        super(OptionGroup, self).__delitem__(slice(None))
+        self._members = set()
+        self._unhashable = []
+        self._extend(items)
 
     def add(self, opt):
         if isinstance(opt, Option):
-            super(OptionGroup, self).append(opt)
+            self._append(opt)
         else:
             raise TypeError('Only "%s" can be added into "%s". "%s" is "%s".'
                             % (Option.__name__, OptionGroup.__name__, opt, type(opt)))
 
+    def append(self, item):
+        self._append(item)
+
+    def extend(self, items):
+        self._extend(items)
+
+    def insert(self, index, item):
+        if item not in self:
+            super(OptionGroup, self).insert(index, item)
+            self._reindex()
+
     def remove(self, opt):
         super(OptionGroup, self).remove(opt)
+        self._discard(opt)
+
+    def pop(self, index=-1):
+        item = super(OptionGroup, self).pop(index)
+        self._discard(item)
+        return item
+
+    def clear(self):
+        super(OptionGroup, self).__delitem__(slice(None))
+        self._members = set()
+        self._unhashable = []
+
+    def _discard(self, item):
+        try:
+            self._members.discard(item)
+        except TypeError:   # unhashable
+            self._unhashable.remove(item)
+
+    def __setitem__(self, index, value):
+        super(OptionGroup, self).__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        super(OptionGroup, self).__delitem__(index)
+        self._reindex()
+
+    def __iadd__(self, other):
+        self._extend(other)
+        return self
+
+    def __imul__(self, n):
+        if n <= 0:
+            self.clear()
+        return self
+
+    if six.PY2:
+        def __setslice__(self, i, j, sequence):
+            self.__setitem__(slice(i, j), sequence)
+
+        def __delslice__(self, i, j):
+            self.__delitem__(slice(i, j))
+
+    def __contains__(self, item):
+        try:
+            return item in self._members
+        except TypeError:   # unhashable
+            return item in self._unhashable
+
+    def __reduce__(self):
+        return OptionGroup, tuple(self)
+
+    def __copy__(self):
+        group = OptionGroup()
+        super(OptionGroup, group).extend(self)
+        group._members = set(self._members)
+        group._unhashable = list(self._unhashable)
+        return group
 
     def __add__(self, other):
         if isinstance(other, OptionGroup):
-            r = OptionGroup(*super(OptionGroup, self).__add__(other))
+            r = OptionGroup(self, other)
             return r
         elif isinstance(other, Option):
-            r = OptionGroup(*super(OptionGroup, self).__add__([other]))
+            r = OptionGroup(self, other)
             return r
         else:
             raise TypeError('Can not add "%s"<%s> to %s. Please explicitly convert it to "%s" or "%s"'
                             % (other, type(other).__name__, OptionGroup.__name__, Option.__name__, OptionGroup.__name__))
 
+    @staticmethod
+    def _as_group(other):
+        if isinstance(other, OptionGroup):
+            return other
+        if isinstance(other, Option):
+            return OptionGroup(other)
+        if isinstance(other, (set, frozenset)):
+            return OptionGroup(*other)
+        return None
+
+    def __or__(self, other):
+        other = self._as_group(other)
+        if other is None:
+            return NotImplemented
+        return OptionGroup(self, other)
+
+    def __and__(self, other):
+        other = self._as_group(other)
+        if other is None:
+            return NotImplemented
+        return OptionGroup(*[item for item in self if item in other])
+
+    def __sub__(self, other):
+        other = self._as_group(other)
+        if other is None:
+            return NotImplemented
+        return OptionGroup(*[item for item in self if item not in other])
+
+    def __xor__(self, other):
+        other = self._as_group(other)
+        if other is None:
+            return NotImplemented
+        return OptionGroup(*([item for item in self if item not in other] +
+                             [item for item in other if item not in self]))
+
+    __ror__ = __or__
+
+    def __rand__(self, other):
+        other = self._as_group(other)
+        if other is None:
+            return NotImplemented
+        return other & self
+
+    def __rsub__(self, other):
+        other = self._as_group(other)
+        if other is None:
+            return NotImplemented
+        return other - self
+
+    def __rxor__(self, other):
+        other = self._as_group(other)
+        if other is None:
+            return NotImplemented
+        return other ^ self
+
+    def issubset(self, other):
+        """If all members are in `other`. :param other: iterable of options"""
+        if not isinstance(other, (OptionGroup, set, frozenset, dict)):
+            other = OptionGroup(*other)
+        return all(item in other for item in self)
+
+    def issuperset(self, other):
+        """If all of `other` are members. :param other: iterable of options"""
+        return all(item in self for item in other)
+
+    def isdisjoint(self, other):
+        """If no member is in `other`. :param other: iterable of options"""
+        return not any(item in self for item in other)
+
+
+class TagGroup(tuple):
+    """
+    Frozen view of options of a tag, published as the tag attribute of Options class (e.g. `Fruit.RED`).
+    It is a tuple, while `in` of a group with `HASH_MIN_SIZE` or more options is looked up by hash.
+    It is replaced by a new one when tags change, never changed in place.
+    """
+
+    HASH_MIN_SIZE = 8
+    """Smaller groups are scanned as tuple, which is faster than hashing."""
+
+    def __new__(cls, options=()):
+        if not hasattr(options, '__len__'):
+            options = tuple(options)
+        if cls is TagGroup and len(options) >= TagGroup.HASH_MIN_SIZE:
+            cls = _HashedTagGroup
+        return super(TagGroup, cls).__new__(cls, options)
+
+    def __reduce__(self):
+        return TagGroup, (tuple(self), )
+
+
+class _HashedTagGroup(TagGroup):
+
+    def __contains__(self, item):
+        try:
+            return item in self._members
+        except AttributeError:  # indexed on first use
+            self._members = self._index()
+            return self.__contains__(item)
+        except TypeError:   # unhashable item or members
+            return tuple.__contains__(self, item)
+
+    def _index(self):
+        try:
+            return frozenset(self)
+        except TypeError:   # unhashable member. e.g. raw tuple in class body.
+            return None
+
+
+def _published_tag_group(group):
+    """
+    TagGroup of a published OptionGroup. It shares index of the group as published groups are never changed.
+    """
+    tag_group = TagGroup(group)
+    if isinstance(tag_group, _HashedTagGroup) and not group._unhashable:
+        tag_group._members = group._members
+    return tag_group
+
+
+def _safe_contains(contains, value):
+    try:
+        return contains(value)
+    except TypeError:   # unhashable
+        return False
+
+
+class InvalidValues(object):
+    """
+    Collects invalid values found by `Options.validate_many()` and `Options.filter_valid()`.
+    All invalid values are counted. Only the first `sample_size` distinct values are kept for error reports.
+    """
+
+    def __init__(self, sample_size=10):
+        self.sample_size = sample_size
+        self.count = 0
+        self.sample = []        # [(index, value), ...]
+        self._seen = set()
+
+    def add(self, index, value):
+        self.count += 1
+        if len(self.sample) < self.sample_size:
+            try:
+                if value in self._seen:
+                    return
+                self._seen.add(value)
+            except TypeError:   # unhashable
+                pass
+            self.sample.append((index, value))
+
+    def __bool__(self):
+        return self.count > 0
+
+    __nonzero__ = __bool__
+
+    def __str__(self):
+        return '%d invalid values. e.g. %s' % (self.count, ', '.join('%r at %d' % (v, i) for i, v in self.sample))
+
 
 class OptionsMeta(type):
 
@@ -69,6 +342,7 @@ class OptionsMeta(type):
         name_options_mapping = {}
         code_options_mapping = {}
         groups = {}
+        tag_groups = OrderedDict()
 
         ignore_invalid_name = namespace.get('__IGNORE_INVALID_NAME__', False)
         order_by = namespace.get('__ORDER_BY__', None)
@@ -80,6 +354,7 @@ class OptionsMeta(type):
             raise ValueError("'__ORDER_BY__' only supported on `code` and `name` field")
 
         if name != 'Options':
+            reserved_names = frozenset(dir(mcs))
             for attr, val in namespace.items():
                 if attr.startswith('_'):
                     continue
@@ -90,7 +365,7 @@ class OptionsMeta(type):
                         if not ignore_invalid_name:
                             raise AttributeError('Option name must be uppercase. Attribute "%s" is not.' % attr)
                 else:
-                    if attr in name_options_mapping.keys() or hasattr(mcs, attr):
+                    if attr in name_options_mapping or attr in reserved_names:
                         raise AttributeError('Duplicated attribute "%s" found' % attr)
 
                     if isinstance(val, OptionGroup):
@@ -119,91 +394,293 @@ class OptionsMeta(type):
                         else:
                             raise TypeError('"%s" can not be converted to Option.' % attr)
 
-                        if opt.code in code_options_mapping.keys():
+                        if opt.code in code_options_mapping:
                             raise ValueError('Duplicated code "%s" found' % opt.code)
 
-                        setattr(instance, attr, opt)
+                        opt._owner = None   # not regrouping until all groups are built
                         name_options_mapping[attr] = opt
                         code_options_mapping[opt.code] = opt
-                        mcs.__scan_option_tags_for_group(instance, opt)
+
+            for opt in name_options_mapping.values():
+                for tag in opt.tags:
+                    tag_groups.setdefault(tag, []).append(opt)
 
             for attr, val in groups.items():
                 # grouping options
+                members = tag_groups.setdefault(attr, [])
                 for code in val:
                     if isinstance(code, (tuple, list)):
                         code = code[0]
                     opt = code_options_mapping.get(code, None)
                     if opt is None or not isinstance(opt, Option):
                         raise SyntaxError('"%s" is not available Option of %s' % (code, instance.__name__))
-                    assert callable(opt.tag_added)
-                    assert callable(opt.tag_removed)
-                    opt.add_tag(attr)
+                    if attr not in opt.tags:
+                        opt.add_tag(attr)
+                        members.append(opt)
 
-        instance.__name_options_mapping__ = name_options_mapping
-        instance.__code_options_mapping__ = code_options_mapping
+        mcs._setup_options(instance, name_options_mapping, code_options_mapping, tag_groups)
 
         return instance
 
-    def __scan_option_tags_for_group(cls, opt):
+    def _setup_options(cls, name_options_mapping, code_options_mapping, tag_groups):
+        """
+        Set options, groups and indexes of an Options class. They are NOT validated.
+        :param name_options_mapping: dict of {name: Option object} in declaration order
+        :param code_options_mapping: dict of {code: Option object}
+        :param tag_groups: dict of {tag: list of Option objects} in order of groups
+        :return:
+        """
+        for attr, opt in name_options_mapping.items():
+            setattr(cls, attr, opt)
+
+        cls.__name_options_mapping__ = name_options_mapping
+        cls.__code_options_mapping__ = code_options_mapping
+        cls.__name_options_proxy__ = MappingProxyType(name_options_mapping)
+        cls.__code_options_proxy__ = MappingProxyType(code_options_mapping)
+        cls.__views__ = {}
+        cls.__tag_lock__ = threading.RLock()
+        cls.__tag_batch__ = None
+        cls.__tag_version__ = 0
+        cls.__tag_index__ = None    # masks of tags for queries. built on first query.
+
+        cls.__build_groups(tag_groups)
+        for opt in name_options_mapping.values():
+            opt._owner = cls
+
+        # codes take precedence over names which are same as other option's code.
+        coerce_options_mapping = dict(name_options_mapping)
+        coerce_options_mapping.update(code_options_mapping)
+
+        cls.__coerce_options_mapping__ = coerce_options_mapping
+        cls.__option_ids__ = frozenset(id(o) for o in name_options_mapping.values())
+        cls.__option_ordinals__ = dict((id(o), i) for i, o in enumerate(name_options_mapping.values()))
+        cls.__text_options_mapping__ = None    # built on first use. text may be lazy translation.
+
+    def __build_groups(cls, tag_groups):
+        """
+        Build group of each tag in one batch.
+        :param tag_groups: dict of {tag: list of Option objects}
+        :return:
+        """
+        groups = {}
+        for tag, options in tag_groups.items():
+            __group = '__%s' % tag
+            if __group in cls.__dict__:
+                raise ValueError('Tag "%s" is duplicated as attribute of "%s"' % (tag, cls.__name__))
+            group = OptionGroup()
+            group.extend(options)
+            groups[tag] = group
+            setattr(cls, __group, group)
+            setattr(cls, tag, _published_tag_group(group))
+        cls.__groups__ = groups
+
+    def from_rows(cls, name, rows, module=None):
+        """
+        Create an Options class from rows in one pass. e.g.
+
+            Fruit = Options.from_rows('Fruit', [('APPLE', 1, 'Apple', ['RED']), ('BANANA', 2)])
+
+        :param name: name of the Options class.
+        :param rows: iterable of (name, code, text, tags) tuples or Option objects. `text` and `tags` are optional.
+        :param module: `__module__` of the Options class. Default is the module of caller.
+        :return: Options class derived from `cls`
+        """
+        namespace = OrderedDict()
+        for row in rows:
+            if isinstance(row, Option):
+                if row.name in namespace:
+                    raise AttributeError('Duplicated attribute "%s" found' % row.name)
+                namespace[row.name] = row
+                continue
+            attr = row[0]
+            if not isinstance(attr, six.string_types):
+                raise ValueError('Option name must be string type.')
+            if attr.startswith('_') or not attr.isupper():
+                raise ValueError('Option name must be alphanumeric or "_"  in uppercase and start with alphabet.')
+            if attr in namespace:
+                raise AttributeError('Duplicated attribute "%s" found' % attr)
+            namespace[attr] = tuple(row[1:])
+
+        if module is None:
+            try:
+                module = sys._getframe(1).f_globals.get('__name__', '__main__')
+            except (AttributeError, ValueError):
+                module = __name__
+        namespace['__module__'] = module
+
+        return type(cls)(name, (cls, ), namespace)
+
+    def _add_option_to_group(cls, opt, tag):
+        """
+        Add Option object to the group of tag. Called when a tag is added to the Option object,
+        with `__tag_lock__` of the class held.
+        :param opt: Option object
+        :param tag: tag name
+        :return:
+        """
+        __group = '__%s' % tag
+        group = getattr(cls, __group, None)
+        if group is not None and not isinstance(group, OptionGroup):
+            raise ValueError('Tag "%s" is duplicated as attribute of "%s"' % (tag, cls.__name__))
+        batch = cls.__tag_batch__
+        if batch is not None:
+            batch['added'].setdefault(tag, []).append(opt)
+            return
+        group = group.__copy__() if group is not None else OptionGroup()
+        group.add(opt)
+        cls.__publish_groups({tag: group})
+
+    def _remove_option_from_group(cls, opt, tag):
         """
-        Scan all tags in a given Option object and add the object to appropriate group of the tag.
+        Remove Option object from the group of tag. Called when a tag is removed from the Option object,
+        with `__tag_lock__` of the class held.
         :param opt: Option object
+        :param tag: tag name
         :return:
         """
+        __group = '__%s' % tag
+        group = getattr(cls, __group, None)
+        batch = cls.__tag_batch__
+        if batch is not None and tag in batch['added']:
+            batch['added'][tag].append(opt)     # dropped on regrouping as it has no such tag
+            return
+        if group is None:
+            raise ValueError('Option group for tag "%s" is not existing in "%s"' % (tag, cls.__name__))
+        if not isinstance(group, OptionGroup):
+            raise ValueError('No options are grouped in with "%s" in "%s"' % (tag, cls.__name__))
+        if batch is not None:
+            batch['added'][tag] = []
+            return
+        group = group.__copy__()
+        group.remove(opt)
+        cls.__publish_groups({tag: group})
+
+    def __publish_groups(cls, changed):
+        """
+        Publish new groups of tags and drop views, and masks and query results of changed tags. Published groups
+        are never changed (copy-on-write), so readers of tag attributes, `__groups__` and views need no lock.
+        :param changed: dict of {tag: new OptionGroup}
+        :return:
+        """
+        groups = dict(cls.__groups__)
+        for tag, group in changed.items():
+            setattr(cls, '__%s' % tag, group)
+            setattr(cls, tag, _published_tag_group(group))
+            groups[tag] = group
+        cls.__groups__ = groups
+        index = cls.__tag_index__
+        if index is not None:
+            cls.__tag_index__ = index.updated(changed)
+        cls.__tag_version__ += 1
+        cls._invalidate_views()
+
+    @contextmanager
+    def batch_tags(cls):
+        """
+        Defer regrouping while tags of options are changed in the block. Each changed group is rebuilt once (and
+        views are invalidated once) when the block exits, even if an exception is raised. Blocks can be nested.
+        Groups and views are out of date inside the block. Tags of the class are locked for other threads
+        until the block exits.
 
-        def add_option_to_group(atag):
-            __group = '__%s' % atag
-            group = getattr(cls, __group, None)
-            if group is not None:
-                if isinstance(group, OptionGroup):
-                    group.add(opt)
-                else:
-                    raise ValueError('Tag "%s" is duplicated as attribute of "%s"'
-                                     % (atag, cls.__name__))
-            else:
-                group = OptionGroup()
-                group.add(opt)
-                setattr(cls, __group, group)
-            setattr(cls, atag, tuple(group))
-
-        def remove_option_from_group(atag):
-            __group = '__%s' % atag
-            group = getattr(cls, __group, None)
-            if group is not None:
-                if isinstance(group, OptionGroup):
-                    group.remove(opt)
-                else:
-                    raise ValueError('No options are grouped in with "%s" in "%s"' % (atag, cls.__name__))
-            else:
-                raise ValueError('Option group for tag "%s" is not existing in "%s"' % (atag, cls.__name__))
-            setattr(cls, atag, tuple(group))
+            with Fruit.batch_tags():
+                for opt in Fruit.all:
+                    opt.add_tag('SEASONAL')
 
-        for tag in opt.tags:
-            add_option_to_group(tag)
+        :return: context manager
+        """
+        with cls.__tag_lock__:
+            outermost = cls.__tag_batch__ is None
+            if outermost:
+                cls.__tag_batch__ = {'added': OrderedDict()}
+            try:
+                yield cls
+            finally:
+                if outermost:
+                    batch = cls.__tag_batch__
+                    cls.__tag_batch__ = None
+                    cls.__regroup(batch['added'])
+
+    def __regroup(cls, changes):
+        """
+        Rebuild groups of changed tags. Members keep their positions. New members are appended in order of changes.
+        :param changes: dict of {tag: list of Option objects whose tag is changed}
+        :return:
+        """
+        if not changes:
+            return
+        changed = {}
+        for tag, options in changes.items():
+            group = cls.__groups__.get(tag)
+            members = [o for o in group if tag in o._tags] if group is not None else []
+            members.extend(o for o in options if tag in o._tags)
+            if group is not None or members:
+                changed[tag] = OptionGroup()
+                changed[tag].extend(members)
+        cls.__publish_groups(changed)
+
+    def set_tags(cls, mapping):
+        """
+        Replace tags of options in one batch. See `batch_tags()`.
+        :param mapping: dict (or iterable of pairs) of {Option object or name: iterable of tags}
+        :return:
+        """
+        items = mapping.items() if hasattr(mapping, 'items') else mapping
+        with cls.batch_tags():
+            for key, tags in items:
+                opt = key if id(key) in cls.__option_ids__ else cls[key]
+                tags = tuple(OrderedDict.fromkeys(tags))
+                for tag in opt._tags:
+                    if tag not in tags:
+                        opt.remove_tag(tag)
+                for tag in tags:
+                    opt.add_tag(tag)
+                if tags:
+                    opt._tags = tags    # in given order
+
+    def _invalidate_views(cls):
+        """
+        Drop cached views (`codes`, `all`, `get_list()` ...) and the text index of `from_text()`.
+        Options are immutable except tags, so it's called on re-grouping. Call it if `Option.text` is changed.
+        :return:
+        """
+        if cls.__views__:
+            cls.__views__ = {}
+        cls.__text_options_mapping__ = None
 
-        opt.tag_added = add_option_to_group
-        opt.tag_removed = remove_option_from_group
+    def __build_views(cls):
+        """
+        Build views of options. They are cached until `_invalidate_views` is called.
+        :return: dict of views
+        """
+        options = tuple(cls.__name_options_mapping__.values())
+        views = cls.__views__
+        views.update({
+            'codes': tuple(cls.__code_options_mapping__),
+            'names': tuple(cls.__name_options_mapping__),
+            'all': options,
+            'tuples': tuple((o.name, o.code, o.text) for o in options),
+        })
+        return views
 
     # Options class methods or properties
     def __get_name_options_mapping(cls):
         """
-        Dict of {'name': option} mapping.
-        DO NOT change this dict. TODO: make it immutable.
+        Read-only dict of {'name': option} mapping.
 
-        :return: dict {"name": option}
+        :return: mappingproxy {"name": option}
         """
-        return cls.__name_options_mapping__
+        return cls.__name_options_proxy__
 
     def __get_code_options_mapping(cls):
         """
-        Dict of {'code': option} mapping
-        DO NOT change this dict. TODO: make it immutable.
-        :return: dict {"name": option}
+        Read-only dict of {'code': option} mapping
+
+        :return: mappingproxy {"code": option}
         """
-        return cls.__code_options_mapping__
+        return cls.__code_options_proxy__
 
     def __getitem__(cls, item):
-        return cls.__get_name_options_mapping()[item]
+        return cls.__name_options_mapping__[item]
 
     def __setitem__(cls, key, value):
         raise TypeError("'%s' class does not support item assignment" % cls.__name__)
@@ -213,45 +690,228 @@ class OptionsMeta(type):
 
     def __contains__(cls, item):
         if isinstance(item, Option):
-            return item in cls.__get_name_options_mapping().values()
+            # identity check. Option of other Options class with same code is not in.
+            return id(item) in cls.__option_ids__
         else:
-            return item in cls.__get_code_options_mapping().keys()
+            return item in cls.__code_options_mapping__
 
     def get(cls, key, default=None):
-        return cls.__get_name_options_mapping().get(key, default)
+        return cls.__name_options_mapping__.get(key, default)
+
+    def from_code(cls, code, default=_missing):
+        """
+        Lookup option by code.
+        :param code: code of option
+        :param default: returned if option not found. Raise KeyError if not given.
+        :return: Option object
+        """
+        try:
+            return cls.__code_options_mapping__[code]
+        except (KeyError, TypeError):
+            if default is _missing:
+                raise KeyError('"%s" is not a code of %s' % (code, cls.__name__))
+            return default
+
+    def from_codes(cls, codes, default=_missing):
+        """
+        Lookup options of a batch of codes. Much faster than calling `from_code()` for each code.
+        :param codes: iterable of codes
+        :param default: used for codes not found. Raise KeyError if not given.
+        :return: list of Option objects
+        """
+        if not isinstance(codes, (list, tuple)):
+            codes = list(codes)
+        mapping = cls.__code_options_mapping__
+        try:
+            return [mapping[c] for c in codes]
+        except (KeyError, TypeError):
+            pass
+
+        options = []
+        for code in codes:
+            try:
+                options.append(mapping[code])
+            except (KeyError, TypeError):
+                if default is _missing:
+                    raise KeyError('"%s" is not a code of %s' % (code, cls.__name__))
+                options.append(default)
+        return options
+
+    def from_text(cls, text, default=_missing):
+        """
+        Lookup option by text. The first declared option is returned if several options have same text.
+        The text index is built on first call so that lazy translations are not evaluated on class creation.
+        :param text: text of option
+        :param default: returned if option not found. Raise KeyError if not given.
+        :return: Option object
+        """
+        mapping = cls.__text_options_mapping__
+        if mapping is None:
+            mapping = {}
+            for o in cls.__get_name_options_mapping().values():
+                if o.text is not None and o.text not in mapping:
+                    mapping[o.text] = o
+            cls.__text_options_mapping__ = mapping
+        try:
+            return mapping[text]
+        except (KeyError, TypeError):
+            if default is _missing:
+                raise KeyError('"%s" is not a text of %s' % (text, cls.__name__))
+            return default
+
+    def coerce(cls, value, default=_missing):
+        """
+        Lookup option by code, name or Option object. Code takes precedence if a name equals to another code.
+        Option objects of other Options class are not accepted.
+        :param value: code, name or Option object
+        :param default: returned if option not found. Raise KeyError if not given.
+        :return: Option object
+        """
+        try:
+            opt = cls.__coerce_options_mapping__[value]
+        except (KeyError, TypeError):
+            pass
+        else:
+            if opt is value or not isinstance(value, Option):
+                return opt
+        if default is _missing:
+            raise KeyError('"%s" can not be coerced to option of %s' % (value, cls.__name__))
+        return default
+
+    def validate_many(cls, values, errors=None):
+        """
+        Validate a stream of codes lazily. e.g.
+
+            errors = InvalidValues()
+            for index, value in Fruit.validate_many(rows, errors):
+                log.warning('Row %d has unknown fruit %r', index, value)
+            if errors:
+                raise ValueError(str(errors))
+
+        Values are checked as codes. An Option object is valid if its code is.
+        :param values: iterable of codes
+        :param errors: `InvalidValues` to collect invalid values. Optional.
+        :return: generator of (index, value) of invalid values
+        """
+        contains = cls.__code_options_mapping__.__contains__
+        for index, value in enumerate(values):
+            try:
+                if contains(value):
+                    continue
+            except TypeError:   # unhashable
+                pass
+            if errors is not None:
+                errors.add(index, value)
+            yield index, value
+
+    def filter_valid(cls, values, errors=None):
+        """
+        Filter a stream of codes lazily. Only valid codes are yielded.
+        :param values: iterable of codes
+        :param errors: `InvalidValues` to collect invalid values. Optional.
+        :return: generator of valid codes
+        """
+        contains = cls.__code_options_mapping__.__contains__
+        for index, value in enumerate(values):
+            try:
+                if contains(value):
+                    yield value
+                    continue
+            except TypeError:   # unhashable
+                pass
+            if errors is not None:
+                errors.add(index, value)
+
+    def valid_mask(cls, values):
+        """
+        Check codes in batch.
+        :param values: numpy ndarray or iterable of codes
+        :return: bool ndarray if `values` is ndarray. Otherwise list of bool. True means the code is valid.
+        """
+        if type(values).__module__ == 'numpy':
+            from .arrays import lookup
+            return lookup(cls).index('code').ordinals(values) >= 0
+
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        contains = cls.__code_options_mapping__.__contains__
+        try:
+            return list(map(contains, values))
+        except TypeError:   # unhashable
+            return [_safe_contains(contains, v) for v in values]
 
     @property
     def codes(cls):
-        """List of `code`s"""
-        return list(cls.__get_code_options_mapping().keys())
+        """Tuple of `code`s"""
+        try:
+            return cls.__views__['codes']
+        except KeyError:
+            return cls.__build_views()['codes']
 
     @property
     def names(cls):
-        """List of `name`s"""
-        return list(cls.__get_name_options_mapping().keys())
+        """Tuple of `name`s"""
+        try:
+            return cls.__views__['names']
+        except KeyError:
+            return cls.__build_views()['names']
 
     @property
     def all(cls):
-        """List of `Option` objects"""
-        return list(cls.__get_name_options_mapping().values())
+        """Tuple of `Option` objects"""
+        try:
+            return cls.__views__['all']
+        except KeyError:
+            return cls.__build_views()['all']
 
     @property
     def tuples(cls):
-        """List of (`name`, `code`, `text`) tuples"""
-        return [(o.name, o.code, o.text) for o in cls.__get_name_options_mapping().values()]
+        """Tuple of (`name`, `code`, `text`) tuples"""
+        try:
+            return cls.__views__['tuples']
+        except KeyError:
+            return cls.__build_views()['tuples']
 
     @property
     def items(cls):
-        """Dict of {`name`: Option} mapping"""
-        return {o.name: o for o in cls.__get_name_options_mapping().values()}
+        """Read-only dict of {`name`: Option} mapping"""
+        return cls.__name_options_proxy__
 
-    def get_list(cls, *fields):
+    def encode(cls, names, default=_missing, mask=False):
         """
-        List of *fields.
-        :param fields: Field name of `Option`. Such as `code`, (`name`, `code`), [`code`, `name`, `text`] or etc.
-        :return: List of *fields tuple or single value.
+        Convert array of names to ndarray of codes. Requires numpy.
+        :param names: array-like of option names
+        :param default: code for unknown names. Raise KeyError if unknown name found and default not given.
+        :param mask: return (codes, mask) if True. mask is a bool ndarray, True means the name is found.
+        :return: ndarray of codes. Or (ndarray, mask) if `mask` is True.
+        """
+        from .arrays import convert
+        return convert(cls, names, 'name', 'code', default, mask)
+
+    def decode(cls, codes, field='name', default=_missing, mask=False):
+        """
+        Convert array of codes to ndarray of names, texts or ordinals (index in `all`). Requires numpy.
+        :param codes: array-like of option codes
+        :param field: `name`, `text`, `ordinal` or `code`
+        :param default: value for unknown codes. Raise KeyError if unknown code found and default not given.
+        :param mask: return (values, mask) if True. mask is a bool ndarray, True means the code is found.
+        :return: ndarray of `field`. Or (ndarray, mask) if `mask` is True.
         """
+        from .arrays import convert
+        return convert(cls, codes, 'code', field, default, mask)
 
+    def query(cls, query):
+        """
+        Options matching boolean expression of tags. Results are cached until tags in the query changed.
+        e.g. `Fruit.query('RED & FRUITS & ~BAD')` or `Fruit.query(Tag('RED') & Tag('FRUITS') - Tag('BAD'))`.
+        :param query: string expression of tags with operators `~`, `&`, `^`, `|` and parentheses, or `Tag` expression
+        :return: tuple of options in declaration order
+        """
+        from .query import select
+        return select(cls, query)
+
+    @staticmethod
+    def __check_fields(fields):
         if len(fields) == 0:
             raise ValueError("No fields argument found.")
 
@@ -264,45 +924,49 @@ class OptionsMeta(type):
                 raise ValueError("Duplicated fields '%s' found." % str(f))
             found_fields.add(f)
 
-        lst = []
-        for o in cls.__get_name_options_mapping().values():
-            value = []
-            for f in fields:
-                value.append(getattr(o, f))
-            lst.append(value[0] if len(value) == 1 else tuple(value))
+    def get_list(cls, *fields):
+        """
+        Tuple of *fields. The result is cached (see `_invalidate_views`).
+        :param fields: Field name of `Option`. Such as `code`, (`name`, `code`), [`code`, `name`, `text`] or etc.
+        :return: Tuple of *fields tuple or single value.
+        """
+        # projections are cached with views. There are at most 15 combinations of fields.
+        key = ('list', ) + fields
+        try:
+            return cls.__views__[key]
+        except (KeyError, TypeError):
+            pass
+
+        cls.__check_fields(fields)
+
+        lst = tuple(map(attrgetter(*fields), cls.all))
+        cls.__views__[key] = lst
         return lst
 
     def get_dict(cls, key_field, *fields):
         """
         Retrieve as dict of {key_field: *fields} mapping. If `fields` is single value, returns `{key:value}` mapping.
                 If `fields` is **tuple**, returns `{key: (tuple of fields value)}` mapping.
+                The result is read-only and cached (see `_invalidate_views`).
         :param key_field: name of Option field for dict key. Only `code` and `name` are available.
         :param fields: Names of Option field for values. Can be tuple or single value. Impact value part of return dict.
-        :return: dict of {key_field: *fields} mapping.
+        :return: read-only dict of {key_field: *fields} mapping.
         """
+        # projections are cached with views. There are at most 30 combinations of key field and fields.
+        key = ('dict', key_field) + fields
+        try:
+            return cls.__views__[key]
+        except (KeyError, TypeError):
+            pass
+
         if key_field not in ['code', 'name']:
             raise NameError("'%s' is not correct key field. Only 'code' and 'name' can be key field." % str(key_field))
 
-        if len(fields) == 0:
-            raise ValueError("No fields argument found.")
-
-        found_fields = set()
-        for f in fields:
-            if f not in ['code', 'name', 'text']:
-                raise NameError(
-                    "'%s' is incorrect Option field. Only 'code', 'name' and 'text' are available." % str(f))
-            if f in found_fields:
-                raise ValueError("Duplicated fields '%s' found." % str(f))
-            found_fields.add(f)
-
-        items = {}
-        for o in cls.__get_name_options_mapping().values():
-            key = getattr(o, key_field)
-            value = []
-            for f in fields:
-                value.append(getattr(o, f))
-            items[key] = value[0] if len(value) == 1 else tuple(value)
+        cls.__check_fields(fields)
 
+        options = cls.all
+        items = MappingProxyType(dict(zip(map(attrgetter(key_field), options), map(attrgetter(*fields), options))))
+        cls.__views__[key] = items
         return items
 
 
@@ -333,5 +997,5 @@ class Options(object):
         return cls.get_list('code', 'text')
 
 
-__all__ = ('Options', 'OptionGroup')
+__all__ = ('Options', 'OptionGroup', 'TagGroup', 'InvalidValues')
 
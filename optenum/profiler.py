@@ -0,0 +1,157 @@
+"""
+Profile creation of Options classes. It records wall time, number of options, number of tags and allocated bytes
+of every Options class built, and reports them ranked by time when the process exits.
+
+Enable it before the modules defining Options classes are imported, by environment variable
+
+    OPTENUM_PROFILE=1 python app.py                    # report to stderr
+    OPTENUM_PROFILE=profile.txt python app.py          # report to file
+
+or by API
+
+    from optenum import profiler
+    profiler.enable()
+
+Allocated bytes are traced by `tracemalloc` (python 3.4+), which slows down the whole process while profiling.
+Set `OPTENUM_PROFILE_MEMORY=0` or call `enable(trace_memory=False)` to record time only.
+"""
+
+from __future__ import print_function
+
+import atexit
+import os
+import sys
+import time
+import six
+from .options import OptionsMeta
+
+try:
+    import tracemalloc
+except ImportError:     # python 2.7
+    tracemalloc = None
+
+timer = getattr(time, 'perf_counter', time.time)
+
+ENV_PROFILE = 'OPTENUM_PROFILE'
+ENV_PROFILE_MEMORY = 'OPTENUM_PROFILE_MEMORY'
+
+_records = []
+_state = {'original': None, 'tracing': False, 'report_to': None, 'registered': False}
+
+
+def _profiled_new(mcs, name, bases, namespace):
+    original = _state['original'].__func__
+    tracing = tracemalloc is not None and tracemalloc.is_tracing()
+    before = tracemalloc.get_traced_memory()[0] if tracing else None
+    started = timer()
+    cls = original(mcs, name, bases, namespace)
+    seconds = timer() - started
+    allocated = tracemalloc.get_traced_memory()[0] - before if tracing else None
+
+    _records.append({
+        'class': '%s.%s' % (cls.__module__, getattr(cls, '__qualname__', name)),
+        'seconds': seconds,
+        'options': len(cls.__name_options_mapping__),
+        'tags': len(cls.__groups__),
+        'allocated': allocated,
+    })
+    return cls
+
+
+def is_enabled():
+    return _state['original'] is not None
+
+
+def enable(trace_memory=True, report_to='stderr'):
+    """
+    Start profiling creation of Options classes.
+    :param trace_memory: trace allocated bytes by `tracemalloc`. It slows down the process.
+    :param report_to: 'stderr', file object or path to write report at exit. No report at exit if None.
+    :return:
+    """
+    if _state['original'] is None:
+        _state['original'] = OptionsMeta.__dict__['__new__']
+        OptionsMeta.__new__ = staticmethod(_profiled_new)
+    if trace_memory and tracemalloc is not None and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _state['tracing'] = True
+    _state['report_to'] = report_to
+    if not _state['registered']:
+        atexit.register(_report_at_exit)
+        _state['registered'] = True
+
+
+def disable():
+    """
+    Stop profiling. Records are kept.
+    :return:
+    """
+    if _state['original'] is not None:
+        OptionsMeta.__new__ = _state['original']
+        _state['original'] = None
+    if _state['tracing']:
+        tracemalloc.stop()
+        _state['tracing'] = False
+    _state['report_to'] = None
+
+
+def records():
+    """
+    Records of Options classes created while profiling, in order of creation.
+    :return: list of dict with keys `class`, `seconds`, `options`, `tags` and `allocated` (bytes or None)
+    """
+    return list(_records)
+
+
+def reset():
+    """Clear records."""
+    del _records[:]
+
+
+def report(file=None, limit=None):
+    """
+    Write Options classes ranked by creation time.
+    :param file: file object. Default is stderr.
+    :param limit: write only the top `limit` classes.
+    :return:
+    """
+    file = file or sys.stderr
+    ranked = sorted(_records, key=lambda r: r['seconds'], reverse=True)
+    total_seconds = sum(r['seconds'] for r in ranked)
+    total_options = sum(r['options'] for r in ranked)
+    allocated = [r['allocated'] for r in ranked if r['allocated'] is not None]
+
+    print('optenum: %d Options classes (%d options) created in %.3f ms%s' % (
+        len(ranked), total_options, total_seconds * 1000,
+        ', %.1f KB allocated' % (sum(allocated) / 1024.0) if allocated else ''), file=file)
+    print('%4s  %10s  %6s  %8s  %5s  %10s  %s' % ('rank', 'ms', '%', 'options', 'tags', 'KB', 'class'), file=file)
+    for rank, r in enumerate(ranked[:limit] if limit else ranked, 1):
+        print('%4d  %10.3f  %6.1f  %8d  %5d  %10s  %s' % (
+            rank, r['seconds'] * 1000, r['seconds'] * 100 / total_seconds if total_seconds else 0,
+            r['options'], r['tags'], '-' if r['allocated'] is None else '%.1f' % (r['allocated'] / 1024.0),
+            r['class']), file=file)
+
+
+def _report_at_exit():
+    report_to = _state['report_to']
+    if report_to is None or not _records:
+        return
+    if report_to == 'stderr':
+        report(sys.stderr)
+    elif isinstance(report_to, six.string_types):
+        with open(report_to, 'w') as f:
+            report(f)
+    else:
+        report(report_to)
+
+
+def enable_from_environ(environ=os.environ):
+    """Enable profiler if environment variable `OPTENUM_PROFILE` is set. Called on import of `optenum`."""
+    value = environ.get(ENV_PROFILE, '')
+    if value in ('', '0'):
+        return
+    trace_memory = environ.get(ENV_PROFILE_MEMORY, '1') != '0'
+    enable(trace_memory=trace_memory, report_to='stderr' if value == '1' else value)
+
+
+__all__ = ('enable', 'disable', 'is_enabled', 'records', 'reset', 'report')
@@ -0,0 +1,283 @@
+"""
+Query options by tags with boolean expressions.
+
+    Fruit.query('RED & FRUITS & ~BAD')
+    Fruit.query(Tag('RED') & Tag('FRUITS') - Tag('BAD'))        # same query as expression object
+
+Operators are `~` (not), `&` (and), `^` (xor) and `|` (or) in order of precedence, as in python. Parentheses group.
+Expression objects also support `-` (`a - b` is `a & ~b`). A tag not used by any option matches nothing.
+
+Options of each tag are interned as a bitmask (bit `i` is the `i`th option in declaration order), so a query is a few
+integer operations over the whole class. Masks are built on first use of the tag from its group. Masks and results are
+cached in the `TagIndex` of the class, apart from views. Up to `_MAX_RESULTS` results are kept. Masks and results of a
+tag are dropped when its group changes. Others are kept.
+"""
+
+import re
+import six
+
+_TOKEN = re.compile(r'\s*(?:([A-Za-z_][A-Za-z0-9_]*)|(.))')
+_PRECEDENCE = (('|', ), ('^', ), ('&', ))
+_MAX_PARSED = 1024
+_MAX_RESULTS = 1024     # per Options class
+
+_parsed = {}     # {string: TagQuery}
+
+
+class TagQuery(object):
+    """
+    Boolean expression of tags. Build it by `Tag('NAME')` and operators `&`, `|`, `^`, `~` and `-`,
+    or by `parse()` from string.
+    """
+
+    __slots__ = ('op', 'operands')
+
+    def __init__(self, op, operands):
+        self.op = op
+        self.operands = operands
+
+    def __and__(self, other):
+        return TagQuery('&', (self, _as_query(other)))
+
+    def __or__(self, other):
+        return TagQuery('|', (self, _as_query(other)))
+
+    def __xor__(self, other):
+        return TagQuery('^', (self, _as_query(other)))
+
+    def __sub__(self, other):
+        return TagQuery('&', (self, ~_as_query(other)))
+
+    def __rand__(self, other):
+        return _as_query(other) & self
+
+    def __ror__(self, other):
+        return _as_query(other) | self
+
+    def __rxor__(self, other):
+        return _as_query(other) ^ self
+
+    def __rsub__(self, other):
+        return _as_query(other) - self
+
+    def __invert__(self):
+        return TagQuery('~', (self, ))
+
+    def __eq__(self, other):
+        return isinstance(other, TagQuery) and self.op == other.op and self.operands == other.operands
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.op, self.operands))
+
+    def tags(self):
+        """
+        :return: set of tag names in the expression
+        """
+        if self.op == 'tag':
+            return set(self.operands)
+        return set().union(*(q.tags() for q in self.operands))
+
+    def evaluate(self, masks):
+        """
+        :param masks: TagIndex of an Options class
+        :return: bitmask of matched options
+        """
+        op = self.op
+        if op == 'tag':
+            return masks[self.operands[0]]
+        if op == '~':
+            return masks.everything ^ self.operands[0].evaluate(masks)
+        left, right = self.operands
+        left, right = left.evaluate(masks), right.evaluate(masks)
+        if op == '&':
+            return left & right
+        if op == '|':
+            return left | right
+        return left ^ right
+
+    def __str__(self):
+        if self.op == 'tag':
+            return self.operands[0]
+        if self.op == '~':
+            return '~%s' % _quoted(self.operands[0])
+        return '%s %s %s' % (_quoted(self.operands[0]), self.op, _quoted(self.operands[1]))
+
+    def __repr__(self):
+        return 'TagQuery(%r)' % str(self)
+
+
+class Tag(TagQuery):
+    """Tag as expression. e.g. `Tag('RED') & ~Tag('BAD')`"""
+
+    __slots__ = ()
+
+    def __init__(self, name):
+        super(Tag, self).__init__('tag', (name, ))
+
+
+def _quoted(query):
+    return str(query) if query.op in ('tag', '~') else '(%s)' % query
+
+
+def _as_query(value):
+    if isinstance(value, TagQuery):
+        return value
+    if isinstance(value, six.string_types):
+        return parse(value)
+    raise TypeError('"%s" is not a tag query.' % (value, ))
+
+
+def parse(text):
+    """
+    Parse string expression of tags. Results are cached.
+    :param text: e.g. "RED & FRUITS & ~BAD", "(RED | YELLOW) & ~BAD"
+    :return: TagQuery
+    """
+    query = _parsed.get(text, None)
+    if query is not None:
+        return query
+
+    tokens = []
+    for name, char in _TOKEN.findall(text):
+        if char and not char.isspace():
+            if char not in '&|^~()':
+                raise ValueError('Invalid tag query "%s": unexpected "%s"' % (text, char))
+            tokens.append(char)
+        elif name:
+            tokens.append(Tag(name))
+    tokens.append(None)
+
+    pos = [0]
+
+    def peek():
+        return tokens[pos[0]]
+
+    def take():
+        token = tokens[pos[0]]
+        pos[0] += 1
+        return token
+
+    def binary(level):
+        if level == len(_PRECEDENCE):
+            return unary()
+        query = binary(level + 1)
+        while peek() in _PRECEDENCE[level]:
+            query = TagQuery(take(), (query, binary(level + 1)))
+        return query
+
+    def unary():
+        token = take()
+        if token == '~':
+            return ~unary()
+        if token == '(':
+            query = binary(0)
+            if take() != ')':
+                raise ValueError('Invalid tag query "%s": ")" expected' % text)
+            return query
+        if isinstance(token, TagQuery):
+            return token
+        raise ValueError('Invalid tag query "%s": tag expected' % text)
+
+    query = binary(0)
+    if peek() is not None:
+        raise ValueError('Invalid tag query "%s": unexpected "%s"' % (text, peek()))
+
+    if len(_parsed) >= _MAX_PARSED:
+        _parsed.clear()
+    _parsed[text] = query
+    return query
+
+
+class TagIndex(object):
+    """
+    Bitmasks of tags and cached query results of an Options class. Mask of a tag is built on first use from its group.
+    Masks of tags not grouped are 0 and not cached. The index is never changed but replaced on publishing groups
+    (see `updated()`), so it needs no lock to read.
+    """
+
+    __slots__ = ('options_class', 'options', 'everything', 'masks', 'results')
+
+    def __init__(self, options_class, masks=None, results=None):
+        self.options_class = options_class
+        self.options = tuple(options_class.__name_options_mapping__.values())
+        self.everything = (1 << len(self.options)) - 1
+        self.masks = masks or {}        # {tag: bitmask}
+        self.results = results or {}    # {TagQuery: (tags, tuple of options)}
+
+    def __getitem__(self, tag):
+        mask = self.masks.get(tag, None)
+        if mask is None:
+            group = self.options_class.__groups__.get(tag, None)
+            if group is None:
+                return 0
+            ordinals = self.options_class.__option_ordinals__
+            bits = bytearray(b'0') * len(self.options)
+            for i in map(ordinals.__getitem__, map(id, group)):
+                bits[i] = 0x31      # '1'
+            bits.reverse()
+            mask = self.masks[tag] = int(bytes(bits) or b'0', 2)
+        return mask
+
+    def select(self, query):
+        """
+        :param query: TagQuery
+        :return: tuple of matched options in declaration order
+        """
+        result = self.results.get(query, None)
+        if result is None:
+            options = self.options
+            result = (frozenset(query.tags()), tuple(options[i] for i in positions(query.evaluate(self))))
+            if len(self.results) >= _MAX_RESULTS:
+                self.results.clear()
+            self.results[query] = result
+        return result[1]
+
+    def updated(self, tags):
+        """
+        :param tags: changed tags
+        :return: new TagIndex without masks of `tags` and results of queries using them
+        """
+        masks = dict((t, m) for t, m in list(self.masks.items()) if t not in tags)
+        results = dict((q, r) for q, r in list(self.results.items()) if r[0].isdisjoint(tags))
+        return TagIndex(self.options_class, masks, results)
+
+
+def tag_index(cls):
+    """TagIndex of an Options class. Created on first use."""
+    index = cls.__tag_index__
+    if index is None:
+        with cls.__tag_lock__:      # not to miss groups published meanwhile
+            index = cls.__tag_index__
+            if index is None:
+                index = cls.__tag_index__ = TagIndex(cls)
+    return index
+
+
+def positions(mask):
+    """
+    :param mask: bitmask
+    :return: list of positions of set bits in ascending order
+    """
+    bits = bin(mask)[:1:-1]
+    result = []
+    i = bits.find('1')
+    while i >= 0:
+        result.append(i)
+        i = bits.find('1', i + 1)
+    return result
+
+
+def select(cls, query):
+    """
+    Options matching tag query. Results are cached in the TagIndex of the class.
+    :param cls: Options class
+    :param query: string or TagQuery
+    :return: tuple of options in declaration order
+    """
+    return tag_index(cls).select(_as_query(query))
+
+
+__all__ = ('Tag', 'TagQuery', 'parse', 'select')
@@ -0,0 +1,158 @@
+"""
+Snapshots of Options classes.
+
+A snapshot keeps options (name, code, text, tags) and groups of an Options class in a compact binary file.
+Restoring a snapshot does not validate options again, so it is much faster than building the class from its source
+(CSV file, database rows and so on). A snapshot carries the hash of its source and of its own content.
+Stale or broken snapshots are ignored and rebuilt by `load_or_build`.
+
+Only options and groups are kept. Methods and other attributes of the Options class are not.
+"""
+
+import gc
+import hashlib
+import importlib
+import marshal
+import os
+import tempfile
+from collections import OrderedDict
+from .option import new_option
+from .options import Options
+
+MAGIC = b'OPTENUM\x01'
+FORMAT_VERSION = 1
+
+_DIGEST_SIZE = hashlib.sha1().digest_size
+_HEADER_SIZE = len(MAGIC) + _DIGEST_SIZE
+
+
+def file_hash(*paths):
+    """
+    Hash of content of files. Use it as `source_hash` of snapshot of Options class loaded from files.
+    :param paths: paths of files
+    :return: hex digest string
+    """
+    h = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _class_ref(cls):
+    qualname = getattr(cls, '__qualname__', cls.__name__)
+    if _resolve_class((cls.__module__, qualname)) is not cls:
+        raise ValueError('Base class %s must be importable as "%s.%s".' % (cls, cls.__module__, qualname))
+    return cls.__module__, qualname
+
+
+def _resolve_class(ref):
+    module, qualname = ref
+    try:
+        obj = importlib.import_module(module)
+        for attr in qualname.split('.'):
+            obj = getattr(obj, attr)
+    except (ImportError, AttributeError):
+        return None
+    return obj
+
+
+def dump_snapshot(cls, path, source_hash=None):
+    """
+    Save snapshot of an Options class.
+    :param cls: Options class
+    :param path: path of snapshot file
+    :param source_hash: hash of the source of the class. e.g. `file_hash('codes.csv')`
+    :return:
+    """
+    base = cls.__bases__[0]
+    rows = tuple((o.name, o.code, o.text, o.tags) for o in cls.all)
+    groups = tuple((tag, tuple(o.name for o in group)) for tag, group in cls.__groups__.items())
+    payload = (FORMAT_VERSION, source_hash, cls.__name__, cls.__module__, _class_ref(base), rows, groups)
+    try:
+        data = marshal.dumps(payload)
+    except ValueError:
+        raise ValueError('Snapshot supports only code and text in built-in types. %s has others.' % cls.__name__)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.optenum-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC)
+            f.write(hashlib.sha1(data).digest())
+            f.write(data)
+        if os.name == 'nt' and os.path.exists(path):
+            os.remove(path)
+        os.rename(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_snapshot(path, source_hash=None):
+    """
+    Restore an Options class from snapshot.
+    :param path: path of snapshot file
+    :param source_hash: expected hash of the source of the class. Not checked if None.
+    :return: Options class. None if snapshot is missing, broken or stale.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except (IOError, OSError):
+        return None
+
+    if data[:len(MAGIC)] != MAGIC or hashlib.sha1(data[_HEADER_SIZE:]).digest() != data[len(MAGIC):_HEADER_SIZE]:
+        return None
+    try:
+        version, snapshot_hash, name, module, base_ref, rows, groups = marshal.loads(data[_HEADER_SIZE:])
+    except (ValueError, EOFError, TypeError):
+        return None
+    if version != FORMAT_VERSION or (source_hash is not None and snapshot_hash != source_hash):
+        return None
+
+    base = _resolve_class(base_ref)
+    if base is None or not issubclass(base, Options):
+        return None
+
+    # lots of objects are created without garbage. Do not let gc scan them again and again.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        name_options_mapping = {}
+        code_options_mapping = {}
+        for opt_name, code, text, tags in rows:
+            opt = new_option(code, opt_name, text, tags)
+            name_options_mapping[opt_name] = opt
+            code_options_mapping[code] = opt
+        tag_groups = OrderedDict((tag, [name_options_mapping[n] for n in names]) for tag, names in groups)
+
+        cls = type.__new__(type(base), name, (base, ), {'__module__': module})
+        cls._setup_options(name_options_mapping, code_options_mapping, tag_groups)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return cls
+
+
+def load_or_build(path, build, source_hash):
+    """
+    Restore an Options class from snapshot. Build it and save snapshot if the snapshot is missing or stale. e.g.
+
+        Codes = load_or_build('codes.snapshot', lambda: load_csv('codes.csv', 'Codes'), file_hash('codes.csv'))
+
+    :param path: path of snapshot file
+    :param build: function returns the Options class.
+    :param source_hash: hash of the source of the class.
+    :return: Options class
+    """
+    cls = load_snapshot(path, source_hash)
+    if cls is None:
+        cls = build()
+        dump_snapshot(cls, path, source_hash)
+    return cls
+
+
+__all__ = ('dump_snapshot', 'load_snapshot', 'load_or_build', 'file_hash')
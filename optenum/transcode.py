@@ -0,0 +1,199 @@
+"""
+Transcode columns of big CSV/TSV files through an Options class. e.g. codes to names or texts, or names to codes.
+
+A file is split into byte-range chunks at line boundaries. Chunks are transcoded in a process pool and written out in
+order. Workers get the Options class by reference (its module and name) and build their own indexes, so the class
+must be importable by its `__module__` and `__qualname__` (or the pool must use `fork`).
+Records must not contain line breaks in quoted fields.
+
+    python -m optenum transcode codes.csv names.csv --options myapp.enums:Fruit --columns fruit --to name
+"""
+
+import csv
+import importlib
+import io
+import multiprocessing
+import os
+import six
+from .options import OptionsMeta, _missing
+
+CHUNK_SIZE = 8 * 1024 * 1024
+"""Bytes of a chunk. A chunk ends at the end of the line crossing this size."""
+
+FIELDS = ('code', 'name', 'text')
+
+_worker = {}     # state of worker process. See `_init_worker`.
+
+
+def resolve_options(ref):
+    """
+    Import an Options class by reference.
+    :param ref: Options class, or string "package.module:ClassName"
+    :return: Options class
+    """
+    if isinstance(ref, OptionsMeta):
+        return ref
+    module, _, qualname = ref.partition(':')
+    if not qualname:
+        module, _, qualname = ref.rpartition('.')
+    obj = importlib.import_module(module)
+    for attr in qualname.split('.'):
+        obj = getattr(obj, attr)
+    if not isinstance(obj, OptionsMeta):
+        raise TypeError('"%s" is not an Options class.' % ref)
+    return obj
+
+
+def _mapping(cls, from_field, to_field):
+    """dict of {string of `from_field`: string of `to_field`}. Values in files are strings."""
+    if from_field not in ('code', 'name'):
+        raise NameError("'%s' is not correct key field. Only 'code' and 'name' can be key field." % from_field)
+    if to_field not in FIELDS:
+        raise NameError("'%s' is incorrect field. Only %s are available." % (to_field, ', '.join(FIELDS)))
+    return dict((six.text_type(k), u'' if v is None else six.text_type(v))
+                for k, v in cls.get_dict(from_field, to_field).items())
+
+
+def split_chunks(path, start=0, chunk_size=CHUNK_SIZE):
+    """
+    Split a file into byte ranges ending at line boundaries.
+    :param path: path of file
+    :param start: byte offset of the first chunk. e.g. end of header line.
+    :param chunk_size: bytes of a chunk
+    :return: list of (start, end)
+    """
+    size = os.path.getsize(path)
+    chunks = []
+    with open(path, 'rb') as f:
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()
+            end = min(f.tell(), size)
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def _init_worker(options, path, column_indexes, from_field, to_field, delimiter, encoding, strict, default,
+                 lineterminator='\n'):
+    cls = resolve_options(options)
+    _worker.update(path=path, mapping=_mapping(cls, from_field, to_field), columns=column_indexes,
+                   delimiter=delimiter, encoding=encoding, strict=strict, default=default, name=cls.__name__,
+                   field=from_field, lineterminator=lineterminator)
+
+
+def _transcode_chunk(chunk):
+    """Transcode bytes of `chunk` (start, end) of the file. Runs in worker."""
+    w = _worker
+    start, end = chunk
+    with open(w['path'], 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    mapping, columns, strict, default = w['mapping'], w['columns'], w['strict'], w['default']
+    out = io.BytesIO() if six.PY2 else io.StringIO()
+    writer = csv.writer(out, delimiter=w['delimiter'], lineterminator=w['lineterminator'])
+    if six.PY2:
+        rows = ([c.decode(w['encoding']) for c in row] for row in
+                csv.reader(io.BytesIO(data), delimiter=w['delimiter']))
+    else:
+        rows = csv.reader(io.StringIO(data.decode(w['encoding']), newline=''), delimiter=w['delimiter'])
+
+    for row in rows:
+        for i in columns:
+            if i < len(row):
+                value = row[i]
+                try:
+                    row[i] = mapping[value]
+                except KeyError:
+                    if strict:
+                        raise KeyError('"%s" is not a %s of %s (chunk at byte %d)'
+                                       % (value, w['field'], w['name'], start))
+                    if default is not None:
+                        row[i] = default
+        if six.PY2:
+            row = [c.encode(w['encoding']) for c in row]
+        writer.writerow(row)
+
+    result = out.getvalue()
+    return result if six.PY2 else result.encode(w['encoding'])
+
+
+def _column_indexes(header, columns):
+    indexes = []
+    for c in columns:
+        if isinstance(c, six.integer_types):
+            indexes.append(c)
+        elif header is not None and c in header:
+            indexes.append(header.index(c))
+        else:
+            raise ValueError('Column "%s" is not found in header %s' % (c, header))
+    return indexes
+
+
+def transcode(src, dst, options, columns, from_field='code', to_field='name', delimiter=',', header=True,
+              encoding='utf-8', default=_missing, processes=None, chunk_size=CHUNK_SIZE):
+    """
+    Transcode columns of a CSV/TSV file through an Options class.
+    :param src: path of source file
+    :param dst: path of output file
+    :param options: Options class, or string "package.module:ClassName". Workers import it by reference.
+    :param columns: column names (needs header) or indexes to transcode
+    :param from_field: `code` or `name`. Field of values in the columns.
+    :param to_field: `code`, `name` or `text`. Field to write.
+    :param delimiter: `,` for CSV. `\\t` for TSV.
+    :param header: If the first line is header. It is written out as is.
+        Rows are written with the line terminator (`\r\n` or `\n`) of the first line.
+    :param encoding: file encoding.
+    :param default: written for unknown values. None keeps the value. Raise KeyError if not given.
+    :param processes: number of worker processes. Default is CPU count. Transcode in this process if 1.
+    :param chunk_size: bytes of a chunk.
+    :return: number of chunks
+    """
+    cls = resolve_options(options)
+    _mapping(cls, from_field, to_field)     # check fields before starting workers
+
+    header_line = b''
+    header_row = None
+    with open(src, 'rb') as f:
+        first_line = f.readline()
+    lineterminator = '\r\n' if first_line.endswith(b'\r\n') else '\n'
+    if header:
+        header_line = first_line
+        line = header_line.decode(encoding)
+        header_row = next(csv.reader([line.rstrip('\r\n')], delimiter=delimiter), [])
+    column_indexes = _column_indexes(header_row, columns)
+    chunks = split_chunks(src, len(header_line), chunk_size)
+
+    # pass the reference of class so that workers never unpickle its mappings.
+    ref = '%s:%s' % (cls.__module__, getattr(cls, '__qualname__', cls.__name__))
+    try:
+        worker_options = ref if resolve_options(ref) is cls else cls
+    except (ImportError, AttributeError, TypeError):
+        worker_options = cls    # not importable. Works with `fork` start method only.
+    strict = default is _missing    # the sentinel is not the same object after pickled to workers
+    initargs = (worker_options, src, column_indexes, from_field, to_field, delimiter, encoding, strict,
+                None if strict else default, lineterminator)
+
+    processes = processes or multiprocessing.cpu_count()
+    with open(dst, 'wb') as out:
+        out.write(header_line)
+        if processes == 1 or len(chunks) <= 1:
+            _init_worker(cls, *initargs[1:])
+            for chunk in chunks:
+                out.write(_transcode_chunk(chunk))
+        else:
+            pool = multiprocessing.Pool(min(processes, len(chunks)), _init_worker, initargs)
+            try:
+                for data in pool.imap(_transcode_chunk, chunks):
+                    out.write(data)
+                pool.close()
+            except BaseException:
+                pool.terminate()
+                raise
+            finally:
+                pool.join()
+    return len(chunks)
+
+
+__all__ = ('transcode', 'split_chunks', 'resolve_options')
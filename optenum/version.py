@@ -1,3 +1,3 @@
 """ version file """
 
-__version__ = '1.1.9'
+__version__ = '1.2.0'
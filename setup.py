@@ -145,7 +145,7 @@ setup(
     #
     #   py_modules=["my_module"],
     #
-    packages=find_packages(exclude=['contrib', 'docs', 'tests', 'samples']),  # Required
+    packages=find_packages(exclude=['contrib', 'docs', 'tests', 'samples', 'benchmarks', 'benchmarks.*']),  # Required
 
     # Specify which Python versions you support. In contrast to the
     # 'Programming Language' classifiers above, 'pip install' will check this
@@ -173,6 +173,9 @@ setup(
     extras_require={  # Optional
         'dev': ['check-manifest'],
         'test': ['coverage'],
+        'numpy': ['numpy'],
+        'pandas': ['numpy', 'pandas'],
+        'arrow': ['numpy', 'pyarrow'],
     },
 
     # If there are data files included in your packages that need to be
@@ -0,0 +1,104 @@
+import unittest
+from optenum import Options
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Status(Options):
+    NEW = 0, 'New'
+    RUNNING = 1, 'Running'
+    STOPPED = 5, 'Stopped'
+    FAILED = -1
+
+
+class Sparse(Options):
+    SMALL = -10 ** 12
+    BIG = 10 ** 12, 'Big'
+
+
+class Color(Options):
+    RED = 'r', 'Red'
+    GREEN = 'g', 'Green'
+    BLUE = 'b'
+
+
+class Mixed(Options):
+    ONE = 1, 'One'
+    TWO = 'two', 'Two'
+
+
+class Level(Options):
+    LOWEST = -100
+    LOW = -2
+    ZERO = 0
+    HIGH = 45
+    HIGHEST = 100
+
+
+class Offset(Options):
+    FIRST = 200
+    SECOND = 201
+    LAST = 255
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestArrays(unittest.TestCase):
+
+    def test_decode(self):
+        codes = np.array([5, 0, -1, 1, 5])
+        self.assertEqual(Status.decode(codes).tolist(), ['STOPPED', 'NEW', 'FAILED', 'RUNNING', 'STOPPED'])
+        self.assertEqual(Status.decode(codes, 'text').tolist(), ['Stopped', 'New', None, 'Running', 'Stopped'])
+        self.assertEqual(Status.decode(codes, 'ordinal').tolist(), [2, 0, 3, 1, 2])
+        self.assertEqual(Status.decode([[0, 1], [5, -1]]).tolist(), [['NEW', 'RUNNING'], ['STOPPED', 'FAILED']])
+
+        self.assertEqual(Sparse.decode([10 ** 12, -10 ** 12]).tolist(), ['BIG', 'SMALL'])
+        self.assertEqual(Color.decode(['b', 'r', 'g']).tolist(), ['BLUE', 'RED', 'GREEN'])
+        self.assertEqual(Color.decode(np.array(['g']), 'text').tolist(), ['Green'])
+        self.assertEqual(Mixed.decode([1, 'two'], 'text').tolist(), ['One', 'Two'])
+        self.assertEqual(Status.decode([]).tolist(), [])
+
+    def test_small_dtypes(self):
+        self.assertEqual(Level.decode(np.array([100, -100, 45, -2], dtype=np.int8)).tolist(),
+                         ['HIGHEST', 'LOWEST', 'HIGH', 'LOW'])
+        self.assertEqual(Level.decode(np.array([0, 100], dtype=np.uint8)).tolist(), ['ZERO', 'HIGHEST'])
+        self.assertEqual(Level.decode(np.array([0, 3], dtype=np.uint8), default=None).tolist(), ['ZERO', None])
+        self.assertEqual(Level.valid_mask(np.array([254, 0, 100], dtype=np.uint8)).tolist(), [False, True, True])
+        self.assertEqual(Offset.decode(np.array([255, 200, -56], dtype=np.int16), default=None).tolist(),
+                         ['LAST', 'FIRST', None])
+        self.assertEqual(Offset.valid_mask(np.array([-56, 100], dtype=np.int8)).tolist(), [False, False])
+        self.assertEqual(Offset.decode(np.array([201, 255], dtype=np.uint8)).tolist(), ['SECOND', 'LAST'])
+
+        big = np.array([2 ** 64 - 2, 100, 2 ** 63 + 100], dtype=np.uint64)
+        self.assertEqual(Level.valid_mask(big).tolist(), [False, True, False])
+        self.assertEqual(Level.decode(big, default=None).tolist(), [None, 'HIGHEST', None])
+
+    def test_encode(self):
+        self.assertEqual(Status.encode(['STOPPED', 'NEW']).tolist(), [5, 0])
+        self.assertEqual(Status.encode(np.array(['FAILED'])).dtype.kind, 'i')
+        self.assertEqual(Color.encode(['GREEN', 'BLUE']).tolist(), ['g', 'b'])
+        self.assertEqual(Mixed.encode(['TWO', 'ONE']).tolist(), ['two', 1])
+
+    def test_unknown(self):
+        self.assertRaises(KeyError, Status.decode, [0, 2])
+        self.assertRaises(KeyError, Status.decode, [0, 100])
+        self.assertRaises(KeyError, Status.decode, ['r'])
+        self.assertRaises(KeyError, Color.decode, [1])
+        self.assertRaises(KeyError, Status.encode, ['NEW', 'FOO'])
+        self.assertRaises(NameError, Status.decode, [0], 'foo')
+
+        names, found = Status.decode([0, 2, 100], default='UNKNOWN', mask=True)
+        self.assertEqual(names.tolist(), ['NEW', 'UNKNOWN', 'UNKNOWN'])
+        self.assertEqual(found.tolist(), [True, False, False])
+
+        self.assertEqual(Status.decode([0, 2], default=None).tolist(), ['NEW', None])
+        self.assertEqual(Status.decode([1, 2], 'ordinal', default=-1).tolist(), [1, -1])
+        self.assertEqual(Status.encode(['NEW', 'FOO'], default=-100).tolist(), [0, -100])
+        self.assertEqual(Color.decode(['r', 'x'], default=None).tolist(), ['RED', None])
+        self.assertEqual(Mixed.decode([1, 2, None], default='').tolist(), ['ONE', '', ''])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from optenum import Options
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+if pd is not None or pa is not None:
+    from optenum import columns
+
+
+class Status(Options):
+    NEW = 0, 'New'
+    RUNNING = 1, 'Running'
+    STOPPED = 5, 'Stopped'
+    FAILED = -1
+
+
+class Color(Options):
+    RED = 'r', 'Red'
+    GREEN = 'g', 'Green'
+
+
+@unittest.skipIf(pd is None, 'pandas is not installed')
+class TestCategorical(unittest.TestCase):
+
+    def test_dtype(self):
+        dtype = columns.categorical_dtype(Status)
+        self.assertEqual(list(dtype.categories), [0, 1, 5, -1])
+        self.assertFalse(dtype.ordered)
+        self.assertIs(dtype, columns.categorical_dtype(Status))
+        self.assertTrue(columns.categorical_dtype(Status, ordered=True).ordered)
+        self.assertEqual(list(columns.categorical_dtype(Color).categories), ['r', 'g'])
+
+    def test_to_categorical(self):
+        categorical = columns.to_categorical(Status, [5, 0, -1, 5])
+        self.assertIsInstance(categorical, pd.Categorical)
+        self.assertEqual(categorical.codes.tolist(), [2, 0, 3, 2])
+        self.assertEqual(categorical.dtype, columns.categorical_dtype(Status))
+
+        categorical = columns.to_categorical(Color, np.array(['g', 'r']))
+        self.assertEqual(categorical.codes.tolist(), [1, 0])
+
+        # Option objects are codes
+        categorical = columns.to_categorical(Status, [Status.RUNNING, Status.FAILED])
+        self.assertEqual(categorical.codes.tolist(), [1, 3])
+
+    def test_to_categorical_series(self):
+        series = pd.Series([5, None, 1], index=['a', 'b', 'c'], name='status')
+        result = columns.to_categorical(Status, series)
+        self.assertIsInstance(result, pd.Series)
+        self.assertEqual(result.name, 'status')
+        self.assertEqual(list(result.index), ['a', 'b', 'c'])
+        self.assertEqual(result.cat.codes.tolist(), [2, -1, 1])
+
+        result = columns.to_categorical(Status, pd.Series([0, None], dtype='Int64'))
+        self.assertEqual(result.cat.codes.tolist(), [0, -1])
+
+    def test_to_categorical_unknown(self):
+        self.assertRaises(KeyError, columns.to_categorical, Status, [0, 9])
+        categorical = columns.to_categorical(Status, [0, 9], strict=False)
+        self.assertEqual(categorical.codes.tolist(), [0, -1])
+
+    def test_from_categorical(self):
+        categorical = columns.to_categorical(Status, [5, 0, None])
+        self.assertEqual(columns.from_categorical(Status, categorical).tolist(), ['STOPPED', 'NEW', None])
+        self.assertEqual(columns.from_categorical(Status, categorical, 'text', default='').tolist(),
+                         ['Stopped', 'New', ''])
+        self.assertEqual(columns.from_categorical(Status, categorical, 'ordinal', default=-1).tolist(), [2, 0, -1])
+
+        series = columns.from_categorical(Status, pd.Series(categorical, name='status'))
+        self.assertIsInstance(series, pd.Series)
+        self.assertEqual(series.name, 'status')
+
+    def test_from_other_categorical(self):
+        categorical = pd.Categorical([1, 5, 7, 1])
+        self.assertEqual(columns.from_categorical(Status, categorical).tolist(), ['RUNNING', 'STOPPED', None, 'RUNNING'])
+        self.assertRaises(TypeError, columns.from_categorical, Status, [1, 5])
+
+
+@unittest.skipIf(pa is None, 'pyarrow is not installed')
+class TestArrow(unittest.TestCase):
+
+    def test_type(self):
+        self.assertEqual(columns.arrow_type(Status), pa.dictionary(pa.int32(), pa.int64()))
+        self.assertEqual(columns.arrow_type(Color, pa.int8()), pa.dictionary(pa.int8(), pa.string()))
+
+    def test_to_arrow(self):
+        array = columns.to_arrow(Status, [5, None, -1])
+        self.assertEqual(array.type, columns.arrow_type(Status))
+        self.assertEqual(array.dictionary.to_pylist(), [0, 1, 5, -1])
+        self.assertEqual(array.indices.to_pylist(), [2, None, 3])
+        self.assertEqual(columns.to_arrow(Status, pa.array([1, None])).indices.to_pylist(), [1, None])
+
+        self.assertRaises(KeyError, columns.to_arrow, Status, [9])
+        self.assertEqual(columns.to_arrow(Status, [9], strict=False).indices.to_pylist(), [None])
+
+    def test_from_arrow(self):
+        array = columns.to_arrow(Color, ['g', None, 'r'])
+        self.assertEqual(columns.from_arrow(Color, array).tolist(), ['GREEN', None, 'RED'])
+        self.assertEqual(columns.from_arrow(Color, array, 'text', default='').tolist(), ['Green', '', 'Red'])
+
+        chunked = pa.chunked_array([array, pa.array(['r', 'x']).dictionary_encode()])
+        self.assertEqual(columns.from_arrow(Color, chunked).tolist(), ['GREEN', None, 'RED', 'RED', None])
+        self.assertRaises(TypeError, columns.from_arrow, Color, pa.array(['r']))
+
+
+if __name__ == '__main__':
+    unittest.main()
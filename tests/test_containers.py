@@ -0,0 +1,162 @@
+import copy
+import pickle
+import unittest
+from optenum import Options, Option, OptionMap, OptionSet
+
+
+class Fruit(Options):
+    APPLE = 1, 'Apple'
+    BANANA = 'b', 'Banana'
+    ORANGE = 3, 'Orange'
+
+
+class Color(Options):
+    RED = 1
+
+
+class Permission(Options):
+    READ = 1
+    WRITE = 2
+    EXEC = 'x'
+    ADMIN = 4
+    P4, P5, P6, P7, P8 = 5, 6, 7, 8, 9
+
+
+class TestOrdinal(unittest.TestCase):
+
+    def test_ordinal(self):
+        self.assertEqual([o.ordinal for o in Fruit.all], [0, 1, 2])
+        self.assertEqual([o.ordinal for o in Color.all], [0])
+        self.assertIsNone(Option(1, 'FOO').ordinal)
+
+
+class TestOptionMap(unittest.TestCase):
+
+    def test_mapping(self):
+        m = OptionMap(Fruit, {Fruit.ORANGE: 3})
+        m[Fruit.APPLE] = 1
+        m['BANANA'] = 2         # name
+        m[3] = 4                # code
+        self.assertEqual(len(m), 3)
+        self.assertEqual(m[Fruit.ORANGE], 4)
+        self.assertEqual(m.keys(), [Fruit.APPLE, Fruit.BANANA, Fruit.ORANGE])
+        self.assertEqual(m.values(), [1, 2, 4])
+        self.assertEqual(m.items(), [(Fruit.APPLE, 1), (Fruit.BANANA, 2), (Fruit.ORANGE, 4)])
+        self.assertEqual(dict(m), {Fruit.APPLE: 1, Fruit.BANANA: 2, Fruit.ORANGE: 4})
+
+        del m[Fruit.BANANA]
+        self.assertEqual(list(m), [Fruit.APPLE, Fruit.ORANGE])
+        self.assertNotIn(Fruit.BANANA, m)
+        self.assertRaises(KeyError, lambda: m[Fruit.BANANA])
+        self.assertRaises(KeyError, m.__delitem__, Fruit.BANANA)
+        self.assertEqual(m.get(Fruit.BANANA, 0), 0)
+        self.assertEqual(m.setdefault(Fruit.BANANA, 5), 5)
+        self.assertEqual(len(m), 3)
+
+    def test_foreign_keys(self):
+        m = OptionMap(Fruit)
+        self.assertRaises(KeyError, m.__setitem__, Color.RED, 1)
+        self.assertRaises(KeyError, m.__setitem__, 'RED', 1)
+        self.assertRaises(KeyError, m.__setitem__, [1], 1)
+        m[Fruit.APPLE] = 1
+        self.assertNotIn(Color.RED, m)
+        self.assertNotIn([1], m)
+        self.assertIsNone(m.get(Color.RED))
+
+    def test_fill_reset(self):
+        m = OptionMap(Fruit)
+        m.fill(0)
+        self.assertEqual(m.items(), [(o, 0) for o in Fruit.all])
+        m.fill(1, ['APPLE', Fruit.ORANGE])
+        self.assertEqual(m.values(), [1, 0, 1])
+        m.reset()
+        self.assertEqual(len(m), 0)
+        self.assertEqual(m.items(), [])
+
+    def test_copy_compare(self):
+        m = OptionMap(Fruit, [(Fruit.APPLE, [1])])
+        c = m.copy()
+        self.assertEqual(c, m)
+        c[Fruit.ORANGE] = 3
+        self.assertNotEqual(c, m)
+        self.assertEqual(m, {Fruit.APPLE: [1]})
+        self.assertNotEqual(OptionMap(Fruit), OptionMap(Color))
+        self.assertEqual(copy.copy(m), m)
+        self.assertEqual(pickle.loads(pickle.dumps(m)), m)
+        self.assertEqual(repr(m), 'OptionMap(Fruit, {APPLE: [1]})')
+
+
+
+class TestOptionSet(unittest.TestCase):
+
+    def test_set(self):
+        s = OptionSet(Permission, [Permission.READ, 'WRITE'])
+        self.assertEqual(len(s), 2)
+        self.assertEqual(list(s), [Permission.READ, Permission.WRITE])
+        self.assertIn(Permission.READ, s)
+        self.assertIn(2, s)
+        self.assertIn('READ', s)
+        self.assertNotIn(Permission.EXEC, s)
+        self.assertNotIn(Fruit.APPLE, s)
+        self.assertNotIn([1], s)
+
+        s.add('x')
+        s.discard(Permission.READ)
+        s.discard(Fruit.APPLE)
+        self.assertEqual(list(s), [Permission.WRITE, Permission.EXEC])
+        s.remove(Permission.WRITE)
+        self.assertRaises(KeyError, s.remove, Permission.WRITE)
+        self.assertRaises(KeyError, s.add, Fruit.APPLE)
+        self.assertEqual(s.pop(), Permission.EXEC)
+        self.assertFalse(s)
+
+    def test_algebra(self):
+        rw = OptionSet(Permission, ['READ', 'WRITE'])
+        wx = OptionSet(Permission, ['WRITE', 'EXEC'])
+        self.assertEqual(rw | wx, OptionSet(Permission, ['READ', 'WRITE', 'EXEC']))
+        self.assertEqual(rw & wx, {Permission.WRITE})
+        self.assertEqual(rw - wx, {1})
+        self.assertEqual(rw ^ wx, {1, 'x'})
+        self.assertEqual(~rw, OptionSet.all_of(Permission) - rw)
+        self.assertEqual(rw | {'x'}, {1, 2, 'x'})
+        self.assertEqual(rw & {1, Fruit.ORANGE}, {1})
+        self.assertEqual({1, 'x'} - rw, {'x'})
+        self.assertIsInstance(rw & wx, OptionSet)
+        self.assertRaises(TypeError, lambda: rw | OptionSet(Color))
+        self.assertRaises(TypeError, lambda: rw | 1)
+
+        s = rw.copy()
+        s |= wx
+        s -= ['READ']
+        self.assertEqual(s, wx)
+        s &= rw
+        s ^= {Permission.ADMIN}
+        self.assertEqual(s, {2, 4})
+        self.assertEqual(rw, {1, 2})
+
+        self.assertTrue(rw <= OptionSet.all_of(Permission))
+        self.assertTrue(rw < OptionSet.all_of(Permission))
+        self.assertFalse(rw < rw)
+        self.assertTrue(rw >= {1})
+        self.assertTrue(rw.issubset([1, 2, 'x']))
+        self.assertTrue(rw.issuperset(['READ', Permission.WRITE]))
+        self.assertTrue(rw.isdisjoint(['x', Fruit.APPLE]))
+        self.assertFalse(rw.isdisjoint(wx))
+        self.assertNotEqual(OptionSet(Permission), OptionSet(Color))
+
+    def test_serialize(self):
+        s = OptionSet(Permission, ['READ', 'P8'])
+        self.assertEqual(int(s), 1 | 1 << 8)
+        self.assertEqual(s.to_bytes(), b'\x01\x01')
+        self.assertEqual(OptionSet(Permission).to_bytes(), b'\x00\x00')
+        self.assertEqual(OptionSet.from_bytes(Permission, s.to_bytes()), s)
+        self.assertEqual(OptionSet.from_int(Permission, int(s)), s)
+        self.assertRaises(ValueError, OptionSet.from_int, Permission, 1 << 9)
+        self.assertRaises(ValueError, OptionSet.from_int, Permission, -1)
+        self.assertEqual(pickle.loads(pickle.dumps(s)), s)
+        self.assertEqual(copy.copy(s), s)
+        self.assertEqual(repr(s), 'OptionSet(Permission, {READ, P8})')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from optenum import Options, instrument
+from optenum.options import OptionsMeta
+
+
+class Fruit(Options):
+    APPLE = 1, 'Apple'
+    ORANGE = 2, 'Orange'
+
+
+class Color(Options):
+    RED = 'r'
+
+
+class TestInstrument(unittest.TestCase):
+
+    def setUp(self):
+        self.originals = dict(OptionsMeta.__dict__)
+        instrument.reset()
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def test_disabled(self):
+        self.assertFalse(instrument.is_enabled())
+        Fruit.from_code(1)
+        self.assertEqual(instrument.snapshot(), {})
+
+        instrument.enable()
+        self.assertTrue(instrument.is_enabled())
+        self.assertIsNot(OptionsMeta.__dict__['from_code'], self.originals['from_code'])
+        instrument.disable()
+        for name in ('from_code', '__getitem__', '__contains__', 'get_list', '_add_option_to_group'):
+            self.assertIs(OptionsMeta.__dict__[name], self.originals[name])
+
+    def test_counters(self):
+        instrument.enable()
+        instrument.enable()     # enabled twice is harmless
+        self.assertIs(Fruit['APPLE'], Fruit.APPLE)
+        self.assertIsNone(Fruit.get('FOO'))
+        self.assertRaises(KeyError, Fruit.__getitem__, 'FOO')
+        self.assertIs(Fruit.from_code(2), Fruit.ORANGE)
+        self.assertIsNone(Fruit.from_code(3, None))
+        self.assertEqual(Fruit.from_codes([1, 2, 3], None), [Fruit.APPLE, Fruit.ORANGE, None])
+        self.assertIs(Fruit.coerce('APPLE'), Fruit.APPLE)
+        self.assertIs(Fruit.from_text('Apple'), Fruit.APPLE)
+        self.assertIn(1, Fruit)
+        self.assertNotIn(3, Fruit)
+        Fruit.get_list('code')
+        Fruit.get_dict('code', 'name')
+        Fruit.choices()
+        Fruit.APPLE.add_tag('RED')
+        Fruit.APPLE.remove_tag('RED')
+        self.assertIn('r', Color)
+
+        snapshot = instrument.snapshot()
+        fruit = snapshot['%s.Fruit' % __name__]
+        self.assertEqual(fruit['name_lookups'], 3)
+        self.assertEqual(fruit['code_lookups'], 6)
+        self.assertEqual(fruit['text_lookups'], 1)
+        self.assertEqual(fruit['misses'], 4)
+        self.assertEqual(fruit['contains'], 2)
+        self.assertEqual(fruit['contains_misses'], 1)
+        self.assertEqual(fruit['projections'], 3)
+        self.assertGreater(fruit['projection_seconds'], 0)
+        self.assertEqual(fruit['tag_mutations'], 2)
+        self.assertEqual(snapshot['%s.Color' % __name__], {'contains': 1})
+
+        instrument.snapshot(reset_counters=True)
+        self.assertEqual(instrument.snapshot(), {})
+
+    def test_hook(self):
+        snapshots = []
+        instrument.enable(hook=snapshots.append, every=3)
+        for _ in range(7):
+            Fruit.from_code(1)
+        self.assertEqual(len(snapshots), 2)
+        self.assertEqual(snapshots[-1]['%s.Fruit' % __name__]['code_lookups'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
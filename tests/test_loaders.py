@@ -0,0 +1,111 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from optenum import Options
+from optenum.loaders import load_csv, load_jsonl
+
+
+class TestLoaders(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def write(self, filename, content):
+        path = os.path.join(self.path, filename)
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_load_csv(self):
+        path = self.write('fruit.csv', u'name,code,text,tags\n'
+                                       u'APPLE,1,Apple,FRUITS|RED\n'
+                                       u'BANANA,2,"Banana, yellow",FRUITS\n'
+                                       u'\n'
+                                       u'CHERRY,3,,\n')
+        for use_mmap in (False, True):
+            Fruit = load_csv(path, 'Fruit', code_type=int, use_mmap=use_mmap)
+            self.assertTrue(issubclass(Fruit, Options))
+            self.assertEqual(Fruit.__module__, __name__)
+            self.assertEqual(Fruit.names, ('APPLE', 'BANANA', 'CHERRY'))
+            self.assertEqual(Fruit.codes, (1, 2, 3))
+            self.assertEqual(Fruit.BANANA.text, 'Banana, yellow')
+            self.assertIs(Fruit.CHERRY.text, None)
+            self.assertEqual(Fruit.FRUITS, (Fruit.APPLE, Fruit.BANANA))
+            self.assertEqual(Fruit.RED, (Fruit.APPLE, ))
+
+    def test_load_csv_columns(self):
+        path = self.write('fruit.csv', u'code;extra;name\nA;x;APPLE\nB;y;BANANA\n')
+        Fruit = load_csv(path, 'Fruit', delimiter=';')
+        self.assertEqual(Fruit.APPLE, 'A')
+        self.assertIs(Fruit.APPLE.text, None)
+
+        path = self.write('fruit.csv', u'APPLE,A,Apple\nBANANA,B\n')
+        Fruit = load_csv(path, 'Fruit', header=False)
+        self.assertEqual(Fruit.tuples, (('APPLE', 'A', 'Apple'), ('BANANA', 'B', None)))
+
+        path = self.write('fruit.csv', u'code,text\nA,Apple\n')
+        self.assertRaises(ValueError, load_csv, path, 'Fruit')
+
+    def test_load_jsonl(self):
+        path = self.write('fruit.jsonl', u'{"name": "APPLE", "code": 1, "text": "Apple", "tags": ["FRUITS"]}\n'
+                                         u'\n'
+                                         u'["BANANA", 2, "Banana", ["FRUITS"]]\n'
+                                         u'["CHERRY", "c"]\n')
+        for use_mmap in (False, True):
+            Fruit = load_jsonl(path, 'Fruit', use_mmap=use_mmap)
+            self.assertEqual(Fruit.names, ('APPLE', 'BANANA', 'CHERRY'))
+            self.assertEqual(Fruit.codes, (1, 2, 'c'))
+            self.assertEqual(Fruit.FRUITS, (1, 2))
+
+    def test_errors(self):
+        path = self.write('fruit.jsonl', u'["APPLE", 1]\n'
+                                         u'["apple", 2]\n'
+                                         u'["BANANA", 1]\n'
+                                         u'["APPLE", 3]\n'
+                                         u'not json\n'
+                                         u'[1]\n'
+                                         u'["CHERRY", [3]]\n'
+                                         u'["", 4]\n'
+                                         u'["DURIAN", 5, null, ["bad"]]\n'
+                                         u'["ELDER", 6]\n')
+        errors = []
+        Fruit = load_jsonl(path, 'Fruit', on_error=lambda *args: errors.append(args))
+        self.assertEqual(Fruit.names, ('APPLE', 'ELDER'))
+        self.assertEqual([e[0] for e in errors], [2, 3, 4, 5, 6, 7, 8, 9])
+        for line_num, row, error in errors:
+            self.assertIsInstance(error, Exception)
+
+        path = self.write('fruit.csv', u'name,code\nAPPLE,1\nBANANA,x\nCHERRY,3\n')
+        errors = []
+        Fruit = load_csv(path, 'Fruit', code_type=int, on_error=lambda *args: errors.append(args))
+        self.assertEqual(Fruit.codes, (1, 3))
+        self.assertEqual(errors[0][:2], (3, ('BANANA', 'x', None, None)))
+        self.assertIsInstance(errors[0][2], ValueError)
+
+        # records with line breaks in quoted fields
+        path = self.write('multiline.csv', u'name,code,text\nAPPLE,1,"multi\nline"\nBANANA,2,"a\n\nb"\nBAD,x\n')
+        for use_mmap in (False, True):
+            errors = []
+            Fruit = load_csv(path, 'Fruit', code_type=int, use_mmap=use_mmap,
+                             on_error=lambda *args: errors.append(args))
+            self.assertEqual(Fruit.APPLE.text, 'multi\nline')
+            self.assertEqual(Fruit.BANANA.text, 'a\n\nb')
+            self.assertEqual([e[0] for e in errors], [7])
+
+    def test_progress(self):
+        path = self.write('numbers.csv', u''.join(u'N%d,%d\n' % (i, i) for i in range(25)))
+        reports = []
+        Numbers = load_csv(path, 'Numbers', header=False, progress_every=10,
+                           progress=lambda rows, position: reports.append((rows, position)))
+        self.assertEqual(len(Numbers.all), 25)
+        self.assertEqual([r[0] for r in reports], [10, 20, 25])
+        self.assertEqual(reports[-1][1], os.path.getsize(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
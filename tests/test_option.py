@@ -1,7 +1,11 @@
 # from __future__ import division
+import copy
+import pickle
+import sys
 import unittest
 import six
 from optenum import Option
+from optenum import option as option_module
 
 
 class Fruit(object):
@@ -373,6 +377,77 @@ class TestOption(unittest.TestCase):
         # self.assertRaises(ZeroDivisionError, divmod, *(Fruit.APPLE, 0))
         # self.assertRaises(ZeroDivisionError, divmod, *(3, Fruit.WATERMELON))
 
+    def test_shared_option_class(self):
+        self.assertIs(type(Fruit.APPLE), type(CellPhone.SAMSUNG))
+        self.assertIs(type(Ball.FOOTBALL), type(Ball.PING_PONG))
+        self.assertIsNot(type(Fruit.APPLE), type(Ball.FOOTBALL))
+        self.assertIsNot(type(Fruit.APPLE), type(Fruit.MONGO))
+        self.assertEqual(type(Fruit.APPLE).__name__, 'Option(int)')
+
+    def test_option_class_cache(self):
+
+        class MyInt(int):
+            pass
+
+        opt1 = Option(MyInt(1), 'FOO')
+        opt2 = Option(MyInt(2), 'BAR')
+        self.assertIs(type(opt1), type(opt2))
+        self.assertIsInstance(opt1, MyInt)
+        self.assertIsInstance(opt1, Option)
+
+        size = option_module.OPTION_CLASS_CACHE_SIZE
+        for i in range(size + 1):
+            Option(type('MyInt%d' % i, (int, ), {})(i), 'FOO')
+        self.assertEqual(len(option_module._option_classes_cache), size)
+        self.assertNotIn(MyInt, option_module._option_classes_cache)
+
+    def test_option_tags_storage(self):
+        opt1 = Option(1, 'FOO')
+        opt2 = Option('B', 'BAR')
+        self.assertIs(opt1.tags, option_module.EMPTY_TAGS)
+        self.assertIs(opt2.tags, option_module.EMPTY_TAGS)
+
+        opt = Option(1, 'FOO', tags=['FOO', 'BAR', 'FOO'])
+        self.assertEqual(opt.tags, ('FOO', 'BAR'))
+        self.assertIs(opt.tags, opt.tags)
+        opt.add_tag('BAZ')
+        opt.add_tag('BAZ')
+        self.assertEqual(opt.tags, ('FOO', 'BAR', 'BAZ'))
+        opt.remove_tag('FOO')
+        self.assertEqual(opt.tags, ('BAR', 'BAZ'))
+        self.assertRaises(KeyError, opt.remove_tag, 'FOO')
+
+    def test_option_memory(self):
+        for code in ('F', 1.5, 1):
+            opt = Option(code, 'FOO', 'Foo', ['BAR'])
+            overhead = sys.getsizeof(opt) - sys.getsizeof(code)
+            if hasattr(opt, '__dict__'):
+                # int does not support __slots__. The fields are in a __dict__, which shares keys with other options.
+                # bare code value + gc header + a pointer to the __dict__, and no more than a dict of the fields.
+                self.assertIsInstance(code, int)
+                self.assertEqual(list(opt.__dict__), list(option_module.OPTION_SLOTS))
+                self.assertLessEqual(overhead, 16 + 8)
+                self.assertLessEqual(sys.getsizeof(opt.__dict__),
+                                     sys.getsizeof(dict.fromkeys(option_module.OPTION_SLOTS)))
+            else:
+                # bare code value + gc header + a pointer per field
+                self.assertRaises(AttributeError, setattr, opt, 'foo', 'bar')
+                self.assertLessEqual(overhead, 16 + 8 * len(option_module.OPTION_SLOTS))
+
+    def test_pickle(self):
+        for code in (1, 'F', 1.5):
+            opt = Option(code, 'FOO', 'Foo', ['BAR', 'BAZ'])
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                restored = pickle.loads(pickle.dumps(opt, protocol))
+                self.assertIsNot(restored, opt)
+                self.assertIs(type(restored), type(opt))
+                self.assertEqual(restored, code)
+                self.assertIs(type(restored.code), type(code))
+                self.assertEqual(restored.name, 'FOO')
+                self.assertEqual(restored.text, 'Foo')
+                self.assertEqual(restored.tags, ('BAR', 'BAZ'))
+        self.assertEqual(copy.copy(Fruit.APPLE).name, 'APPLE')
+
     def test_hash(self):
         self.assertEqual(store.get(Fruit.APPLE), '10 Apples')       # Fruit.APPLE hash is 1
         self.assertEqual(store.get(Fruit.BANANA), None)             # Fruit.BANANA hash is 3
@@ -1,5 +1,11 @@
+import copy
+import pickle
 import unittest
-from optenum import Option, Options, OptionGroup as G
+try:
+    from collections.abc import Mapping
+except ImportError:     # python 2.7
+    from collections import Mapping
+from optenum import Option, Options, OptionGroup as G, InvalidValues
 
 
 class Fruit(Options):
@@ -125,9 +131,115 @@ class TestCustomizedOptions(unittest.TestCase):
         self.assertRaises(KeyError, DoorState.__getitem__, (DoorState.OPEN,))
         self.assertRaises(TypeError, DoorState.__setitem__, ('FOO', 'bar'))
 
+    def test_contains(self):
+        self.assertIn(Fruit.APPLE, Fruit)
+        self.assertIn(1, Fruit)
+        self.assertIn(DoorState.OPEN, DoorState)
+        self.assertIn('O', DoorState)
+        self.assertNotIn('OPEN', DoorState)
+        self.assertNotIn(4, Fruit)
+        self.assertNotIn(EnumCellPhone.APPLE, Fruit)        # same code but other Options class
+        self.assertNotIn(Option(1, 'APPLE'), Fruit)
+        self.assertNotIn(Fruit.APPLE, EnumCellPhone)
+
+    def test_from_code(self):
+        self.assertIs(DoorState.from_code('O'), DoorState.OPEN)
+        self.assertIs(DoorState.from_code(DoorState.OPEN), DoorState.OPEN)
+        self.assertIs(Fruit.from_code(2), Fruit.ORANGE)
+        self.assertRaises(KeyError, DoorState.from_code, 'OPEN')
+        self.assertRaises(KeyError, DoorState.from_code, ['O'])
+        self.assertIs(DoorState.from_code('X', None), None)
+        self.assertEqual(DoorState.from_code('X', default='foo'), 'foo')
+
+    def test_from_codes(self):
+
+        class Level(Options):
+            LOW = -2
+            MIDDLE = 0
+            HIGH = 3
+
+        class Sparse(Options):
+            SMALL = 1
+            BIG = 1000
+
+        self.assertEqual(Level.from_codes([3, -2, 0, 3]), [Level.HIGH, Level.LOW, Level.MIDDLE, Level.HIGH])
+        self.assertEqual(Level.from_codes(iter([0])), [Level.MIDDLE])
+        self.assertEqual(Level.from_codes([]), [])
+        self.assertEqual(Sparse.from_codes((1000, 1)), [Sparse.BIG, Sparse.SMALL])
+        self.assertEqual(DoorState.from_codes(['O', 'C']), [DoorState.OPEN, DoorState.CLOSED])
+        self.assertEqual(Level.from_codes([0.0, Level.HIGH]), [Level.MIDDLE, Level.HIGH])
+
+        for code in (-1, -3, -100, 4, 1000, 'A', None):
+            self.assertRaises(KeyError, Level.from_codes, [0, code])
+            self.assertEqual(Level.from_codes([code, 0], None), [None, Level.MIDDLE])
+        self.assertRaises(KeyError, Sparse.from_codes, [2])
+
+    def test_validate_many(self):
+        values = [1, 4, Fruit.APPLE, 'APPLE', [1], 3, 4]
+        self.assertEqual(list(Fruit.validate_many(values)), [(1, 4), (3, 'APPLE'), (4, [1]), (6, 4)])
+        self.assertEqual(list(Fruit.validate_many(iter([1, 2]))), [])
+
+        errors = InvalidValues(sample_size=2)
+        invalid = Fruit.validate_many(values, errors)
+        self.assertFalse(errors)        # lazy
+        self.assertEqual(len(list(invalid)), 4)
+        self.assertTrue(errors)
+        self.assertEqual(errors.count, 4)
+        self.assertEqual(errors.sample, [(1, 4), (3, 'APPLE')])
+        self.assertIn('4 invalid values', str(errors))
+
+    def test_filter_valid(self):
+        errors = InvalidValues()
+        values = Fruit.filter_valid(iter([1, 4, 4, {}, 3]), errors)
+        self.assertEqual(next(values), 1)
+        self.assertEqual(errors.count, 0)
+        self.assertEqual(list(values), [3])
+        self.assertEqual(errors.count, 3)
+        self.assertEqual(errors.sample, [(1, 4), (3, {})])     # distinct values
+
+    def test_valid_mask(self):
+        self.assertEqual(Fruit.valid_mask([1, 4, {}, 3]), [True, False, False, True])
+        self.assertEqual(DoorState.valid_mask(iter(['O', 'OPEN'])), [True, False])
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        mask = Fruit.valid_mask(np.array([1, 4, 3]))
+        self.assertIsInstance(mask, np.ndarray)
+        self.assertEqual(mask.tolist(), [True, False, True])
+        self.assertEqual(DoorState.valid_mask(np.array(['O', 'X'])).tolist(), [True, False])
+
+    def test_from_text(self):
+        self.assertIs(DoorState.from_text('Door is opened'), DoorState.OPEN)
+        self.assertIs(EnumCellPhone.from_text('Huawei cellphone'), EnumCellPhone.HUAWEI)
+        self.assertRaises(KeyError, DoorState.from_text, 'O')
+        self.assertRaises(KeyError, DoorState.from_text, None)
+        self.assertIs(DoorState.from_text('foo', None), None)
+
+    def test_coerce(self):
+
+        class Foo(Options):
+            A = 'B'
+            B = 'C'
+            C = 1, 'C is 1'
+
+        self.assertIs(DoorState.coerce('O'), DoorState.OPEN)
+        self.assertIs(DoorState.coerce('OPEN'), DoorState.OPEN)
+        self.assertIs(DoorState.coerce(DoorState.OPEN), DoorState.OPEN)
+        self.assertIs(Foo.coerce('B'), Foo.A)       # code first
+        self.assertIs(Foo.coerce('C'), Foo.B)
+        self.assertIs(Foo.coerce(1), Foo.C)
+        self.assertIs(Foo.coerce('A'), Foo.A)
+        self.assertRaises(KeyError, Foo.coerce, 'C is 1')
+        self.assertRaises(KeyError, Fruit.coerce, EnumCellPhone.APPLE)     # option of other class
+        self.assertRaises(KeyError, Fruit.coerce, {})
+        self.assertIs(Fruit.coerce(EnumCellPhone.APPLE, None), None)
+        self.assertIs(Fruit.coerce(4, None), None)
+
     def test_collection_codes(self):
         codes = Fruit.codes
-        self.assertIsInstance(codes, list)
+        self.assertIsInstance(codes, tuple)
+        self.assertIs(codes, Fruit.codes)
         self.assertIn(1, codes)
         self.assertIn(2, codes)
         self.assertIn(3, codes)
@@ -135,7 +247,8 @@ class TestCustomizedOptions(unittest.TestCase):
 
     def test_collection_names(self):
         names = Fruit.names
-        self.assertIsInstance(names, list)
+        self.assertIsInstance(names, tuple)
+        self.assertIs(names, Fruit.names)
         self.assertIn('APPLE', names)
         self.assertIn('ORANGE', names)
         self.assertIn('BANANA', names)
@@ -143,7 +256,9 @@ class TestCustomizedOptions(unittest.TestCase):
 
     def test_collection_all(self):
         lst = Fruit.all
-        self.assertIsInstance(lst, list)
+        self.assertIsInstance(lst, tuple)
+        self.assertIs(lst, Fruit.all)
+        self.assertEqual(lst, (Fruit.APPLE, Fruit.ORANGE, Fruit.BANANA))
         self.assertEqual(len(lst), 3)
         self.assertIn(Fruit.APPLE, lst)
         self.assertIn(Fruit.ORANGE, lst)
@@ -151,7 +266,8 @@ class TestCustomizedOptions(unittest.TestCase):
 
     def test_collection_tuples(self):
         lst = Fruit.tuples
-        self.assertIsInstance(lst, list)
+        self.assertIsInstance(lst, tuple)
+        self.assertIs(lst, Fruit.tuples)
         self.assertEqual(len(lst), 3)
         val = lst[0]
         self.assertIsInstance(val, tuple)
@@ -161,42 +277,63 @@ class TestCustomizedOptions(unittest.TestCase):
 
     def test_collection_items(self):
         items = Fruit.items
-        self.assertIsInstance(items, dict)
+        self.assertIsInstance(items, Mapping)
+        self.assertIs(items, Fruit.items)
+        self.assertFalse(hasattr(items, '__setitem__'))
         self.assertEqual(len(items), 3)
         self.assertIn('APPLE', items)
         self.assertIn(Fruit.ORANGE, items.values())
         self.assertIn(Fruit.BANANA.name, items.keys())
 
+    def test_collection_views_invalidation(self):
+
+        class Foo(Options):
+            A = 1, 'A', ['BAR']
+            B = 2
+
+        codes = Foo.codes
+        self.assertIs(codes, Foo.codes)
+        Foo.B.add_tag('BAR')
+        self.assertIsNot(codes, Foo.codes)
+        self.assertEqual(codes, Foo.codes)
+
     def test_get_list(self):
         lst = Fruit.get_list('code')
-        self.assertIsInstance(lst, list)
+        self.assertIsInstance(lst, tuple)
         self.assertIn(Fruit.APPLE, lst)
         self.assertEqual(len(lst), 3)
 
         lst = Fruit.get_list('name')
-        self.assertIsInstance(lst, list)
+        self.assertIsInstance(lst, tuple)
         self.assertIn(Fruit.APPLE.name, lst)
 
         lst = Fruit.get_list('name', 'text')
-        self.assertIsInstance(lst, list)
+        self.assertIsInstance(lst, tuple)
         self.assertEqual(len(lst), 3)
         name, text = lst[0]
         self.assertIn(name, Fruit.names)
 
         lst = Fruit.get_list('code', 'name', 'text')
-        self.assertIsInstance(lst, list)
+        self.assertIsInstance(lst, tuple)
         self.assertEqual(len(lst), 3)
         code, name, text = lst[0]
         self.assertIn(code, Fruit)
 
+        self.assertEqual(Fruit.get_list('code', 'name'), ((1, 'APPLE'), (2, 'ORANGE'), (3, 'BANANA')))
+        self.assertIs(Fruit.get_list('code', 'name'), Fruit.get_list('code', 'name'))
+        self.assertRaises(NameError, Fruit.get_list, 'foo')
+        self.assertRaises(NameError, Fruit.get_list, ['code'])
+        self.assertRaises(ValueError, Fruit.get_list, 'code', 'code')
+        self.assertRaises(ValueError, Fruit.get_list)
+
     def test_get_dict(self):
         items = Fruit.get_dict('code', 'name')
-        self.assertIsInstance(items, dict)
+        self.assertIsInstance(items, Mapping)
         self.assertIn(Fruit.APPLE.code, items)
         self.assertEqual(len(items), 3)
 
         items = Fruit.get_dict('name', 'code', 'text')
-        self.assertIsInstance(items, dict)
+        self.assertIsInstance(items, Mapping)
         self.assertIn(Fruit.APPLE.name, items)
         self.assertEqual(len(items), 3)
         apple = items.get(Fruit.APPLE.name)
@@ -204,6 +341,81 @@ class TestCustomizedOptions(unittest.TestCase):
         self.assertEqual(len(apple), 2)
         self.assertIn(Fruit.APPLE, apple)
 
+        self.assertIs(items, Fruit.get_dict('name', 'code', 'text'))
+        self.assertFalse(hasattr(items, '__setitem__'))
+        self.assertRaises(NameError, Fruit.get_dict, 'text', 'code')
+        self.assertRaises(NameError, Fruit.get_dict, 'code', 'foo')
+
+    def test_projection_invalidation(self):
+
+        class Foo(Options):
+            A = 1, 'A', ['BAR']
+            B = 2
+
+        choices = Foo.choices()
+        self.assertEqual(choices, ((1, 'A'), (2, None)))
+        self.assertIs(choices, Foo.choices())
+        Foo.B.add_tag('BAR')
+        self.assertIsNot(choices, Foo.choices())
+        self.assertEqual(choices, Foo.choices())
+
+        self.assertIs(Foo.from_text('A'), Foo.A)
+        Foo.B.text = 'B'
+        Foo._invalidate_views()
+        self.assertEqual(Foo.choices(), ((1, 'A'), (2, 'B')))
+        self.assertIs(Foo.from_text('B'), Foo.B)
+
+    def test_from_rows(self):
+        rows = [
+            ('APPLE', 1, 'Apple', ['RED', 'FRUITS']),
+            ('BANANA', 2, 'Banana', ('FRUITS', )),
+            ('FOOTBALL', 'F', None, None),
+            ('BASKETBALL', 'B'),
+        ]
+        Favorite = Options.from_rows('Favorite', rows)
+        self.assertTrue(issubclass(Favorite, Options))
+        self.assertEqual(Favorite.__name__, 'Favorite')
+        self.assertEqual(Favorite.__module__, __name__)
+        self.assertEqual(Favorite.names, ('APPLE', 'BANANA', 'FOOTBALL', 'BASKETBALL'))
+        self.assertEqual(Favorite.codes, (1, 2, 'F', 'B'))
+        self.assertEqual(Favorite.APPLE.text, 'Apple')
+        self.assertEqual(Favorite.FRUITS, (Favorite.APPLE, Favorite.BANANA))
+        self.assertEqual(Favorite.RED, (Favorite.APPLE, ))
+        self.assertIs(Favorite.from_code('F'), Favorite.FOOTBALL)
+
+        Favorite.FOOTBALL.add_tag('RED')
+        self.assertEqual(Favorite.RED, (Favorite.APPLE, Favorite.FOOTBALL))
+
+        Foo = Options.from_rows('Foo', iter([('A', 1)]), module='foo.bar')
+        self.assertEqual(Foo.__module__, 'foo.bar')
+
+        opt = Option('b', 'B', tags=['BAR'])
+        Foo = Options.from_rows('Foo', [('A', 'a'), opt])
+        self.assertIs(Foo.B, opt)
+        self.assertEqual(Foo.BAR, (opt, ))
+        self.assertRaises(AttributeError, Options.from_rows, 'Foo', [('B', 'a'), opt])
+
+        self.assertRaises(AttributeError, Options.from_rows, 'Foo', [('A', 1), ('A', 2)])
+        self.assertRaises(ValueError, Options.from_rows, 'Foo', [('A', 1), ('B', 1)])
+        self.assertRaises(ValueError, Options.from_rows, 'Foo', [('a', 1)])
+        self.assertRaises(ValueError, Options.from_rows, 'Foo', [('__module__', 1)])
+        self.assertRaises(ValueError, Options.from_rows, 'Foo', [(1, 1)])
+        self.assertRaises(ValueError, Options.from_rows, 'Foo', [('A', )])
+        self.assertRaises(TypeError, Options.from_rows, 'Foo', [('A', [1])])
+
+    def test_pickle(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertIs(pickle.loads(pickle.dumps(DoorState.OPEN, protocol)), DoorState.OPEN)
+            self.assertIs(pickle.loads(pickle.dumps(Fruit, protocol)), Fruit)
+            data = [Fruit.APPLE, EnumCellPhone.APPLE, {DoorState.CLOSED: Fruit.APPLE}]
+            restored = pickle.loads(pickle.dumps(data, protocol))
+            self.assertIs(restored[0], Fruit.APPLE)
+            self.assertIs(restored[1], EnumCellPhone.APPLE)
+            self.assertIs(list(restored[2].items())[0][0], DoorState.CLOSED)
+            self.assertIs(list(restored[2].items())[0][1], Fruit.APPLE)
+        self.assertIs(copy.copy(Fruit.APPLE), Fruit.APPLE)
+        self.assertIs(copy.deepcopy(Fruit.APPLE), Fruit.APPLE)
+
     def test_ignore_invalid_name(self):
 
         # invalid name
@@ -339,6 +551,154 @@ class TestCustomizedOptions(unittest.TestCase):
         except Exception as e:
             self.assertIsInstance(e, TypeError)
 
+    def test_group_set(self):
+
+        class Foo(Options):
+            A = 1
+            B = 2, 'B is 2'
+            C = 'C', 'C is letter', ['FOO']
+            D = 'd'
+
+            G1 = G(A, B, A, C, C)
+            G2 = G(B, D)
+
+        g1 = Foo.__groups__['G1']
+        g2 = Foo.__groups__['G2']
+        self.assertIsInstance(g1, list)
+        self.assertEqual(Foo.G1, (Foo.A, Foo.B, Foo.C))
+        self.assertEqual(g1[1], Foo.B)
+        self.assertEqual(g1[-1], Foo.C)
+        self.assertEqual(list(g1), [Foo.A, Foo.B, Foo.C])
+        self.assertIn(Foo.B, g1)
+        self.assertIn(2, g1)
+        self.assertNotIn(Foo.D, g1)
+        self.assertNotIn([1], g1)       # unhashable
+
+        self.assertEqual(g1 | g2, [Foo.A, Foo.B, Foo.C, Foo.D])
+        self.assertEqual(g1 & g2, [Foo.B])
+        self.assertEqual(g1 - g2, [Foo.A, Foo.C])
+        self.assertEqual(g1 ^ g2, [Foo.A, Foo.C, Foo.D])
+        self.assertEqual(g1 | Foo.D, [Foo.A, Foo.B, Foo.C, Foo.D])
+        self.assertEqual(g1 - {1, 2}, [Foo.C])
+        self.assertIsInstance(g1 & g2, G)
+        self.assertRaises(TypeError, lambda: g1 | [Foo.D])
+        self.assertRaises(TypeError, lambda: g1 + 1)
+
+        self.assertTrue((g1 & g2).issubset(g2))
+        self.assertTrue(g1.issubset([Foo.C, Foo.B, Foo.A, Foo.D]))
+        self.assertFalse(g1.issubset(g2))
+        self.assertTrue(g1.issuperset([Foo.A, Foo.C]))
+        self.assertTrue((g1 - g2).isdisjoint(g2))
+        self.assertFalse(g1.isdisjoint(g2))
+
+        # list operations keep the index
+        g = G(*'abc')
+        g.append('a')
+        g.extend(['d', 'b'])
+        g.insert(0, 'z')
+        g.insert(0, 'c')
+        self.assertEqual(g, list('zabcd'))
+        g.remove('a')
+        self.assertNotIn('a', g)
+        self.assertEqual(g.pop(), 'd')
+        self.assertNotIn('d', g)
+        g[0] = 'b'
+        self.assertEqual(g, ['b', 'c'])
+        del g[0]
+        self.assertNotIn('b', g)
+        g += ['c', 'e']
+        self.assertEqual(g, ['c', 'e'])
+        self.assertEqual(copy.copy(g), g)
+        self.assertIn('e', pickle.loads(pickle.dumps(g)))
+
+        raw = G((1, 'x', ['T']), (1, 'x', ['T']), 2)
+        self.assertEqual(len(raw), 2)
+        self.assertIn((1, 'x', ['T']), raw)
+
+    def test_batch_tags(self):
+
+        class Foo(Options):
+            A = 1, None, ['FOO']
+            B = 2, None, ['FOO', 'BAR']
+            C = 3
+            D = 4
+
+        codes = Foo.codes
+        with Foo.batch_tags():
+            Foo.C.add_tag('FOO')
+            Foo.A.remove_tag('FOO')
+            Foo.D.add_tag('BAZ')
+            Foo.D.remove_tag('BAZ')
+            Foo.C.add_tag('QUX')
+            with Foo.batch_tags():
+                Foo.D.add_tag('QUX')
+            # regrouped when the outermost block exits
+            self.assertEqual(Foo.FOO, (1, 2))
+            self.assertFalse(hasattr(Foo, 'QUX'))
+            self.assertIs(Foo.codes, codes)
+        self.assertEqual(Foo.FOO, (Foo.B, Foo.C))
+        self.assertEqual(Foo.QUX, (Foo.C, Foo.D))
+        self.assertIs(Foo.__groups__['FOO'], getattr(Foo, '__FOO'))
+        self.assertNotIn('BAZ', Foo.__groups__)
+        self.assertIsNot(Foo.codes, codes)
+
+        # regrouped on error
+        try:
+            with Foo.batch_tags():
+                Foo.D.add_tag('FOO')
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+        self.assertEqual(Foo.FOO, (2, 3, 4))
+        self.assertRaises(KeyError, Foo.A.remove_tag, 'FOO')
+
+        Foo.set_tags({'A': ['BAR', 'FOO', 'BAR'], Foo.B: (), Foo.D: ['BAR']})
+        self.assertEqual(Foo.A.tags, ('BAR', 'FOO'))
+        self.assertEqual(Foo.B.tags, ())
+        self.assertEqual(Foo.D.tags, ('BAR', ))
+        self.assertEqual(Foo.FOO, (Foo.C, Foo.A))
+        self.assertEqual(Foo.BAR, (Foo.A, Foo.D))
+        self.assertRaises(KeyError, Foo.set_tags, {'Z': ['FOO']})
+
+    def test_tag_group(self):
+        from optenum import TagGroup
+
+        class Foo(Options):
+            A = 1, None, ['FOO']
+            B = 2, None, ['FOO']
+            C = 'c', None, ['BAR']
+
+        self.assertIsInstance(Foo.FOO, TagGroup)
+        self.assertIsInstance(Foo.FOO, tuple)
+        self.assertEqual(Foo.FOO, (1, 2))
+        self.assertEqual(Foo.FOO + Foo.BAR, (1, 2, 'c'))
+        self.assertIs(type(Foo.FOO + Foo.BAR), tuple)
+
+        # replaced, not changed in place
+        foo = Foo.FOO
+        Foo.C.add_tag('FOO')
+        self.assertEqual(foo, (1, 2))
+        self.assertIsNot(Foo.FOO, foo)
+
+        big = TagGroup(range(TagGroup.HASH_MIN_SIZE))
+        self.assertEqual(big, tuple(range(TagGroup.HASH_MIN_SIZE)))
+        self.assertIn(1, big)
+        self.assertIn(1.0, big)
+        self.assertNotIn(-1, big)
+        self.assertNotIn([1], big)
+        self.assertEqual(big[1:3], (1, 2))
+        self.assertIsInstance(pickle.loads(pickle.dumps(big)), TagGroup)
+        self.assertIn(2, pickle.loads(pickle.dumps(big)))
+
+        raw = TagGroup([[1]] * TagGroup.HASH_MIN_SIZE)
+        self.assertIn([1], raw)
+
+        with Foo.batch_tags():
+            for opt in Foo.all:
+                opt.add_tag('ALL')
+        self.assertEqual(Foo.ALL, Foo.all)
+        self.assertIn('c', Foo.ALL)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,79 @@
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from optenum import Options, profiler
+from optenum.options import OptionsMeta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.original = OptionsMeta.__dict__['__new__']
+        profiler.reset()
+
+    def tearDown(self):
+        profiler.disable()
+        profiler.reset()
+
+    def test_records(self):
+        profiler.enable(report_to=None)
+        self.assertTrue(profiler.is_enabled())
+
+        class Fruit(Options):
+            APPLE = 1, 'Apple', ('RED', )
+            BANANA = 2, 'Banana', ('YELLOW', )
+            CHERRY = 3, 'Cherry', ('RED', )
+
+        Color = Options.from_rows('Color', [('RED', 'r')])
+        self.assertIs(Fruit.RED[0], Fruit.APPLE)
+
+        records = profiler.records()
+        self.assertEqual([r['class'] for r in records], ['%s.%s' % (__name__, getattr(Fruit, '__qualname__', 'Fruit')),
+                                                         '%s.Color' % __name__])
+        self.assertEqual(records[0]['options'], 3)
+        self.assertEqual(records[0]['tags'], 2)
+        self.assertGreater(records[0]['seconds'], 0)
+        self.assertEqual(records[1]['options'], 1)
+        if sys.version_info >= (3, 4):
+            self.assertGreater(records[0]['allocated'], 0)
+
+        out = io.StringIO() if sys.version_info[0] > 2 else io.BytesIO()
+        profiler.report(out, limit=1)
+        lines = out.getvalue().splitlines()
+        self.assertIn('2 Options classes (4 options)', lines[0])
+        self.assertEqual(len(lines), 3)
+
+    def test_disable(self):
+        profiler.enable(trace_memory=False, report_to=None)
+        profiler.disable()
+        self.assertFalse(profiler.is_enabled())
+        self.assertIs(OptionsMeta.__dict__['__new__'], self.original)
+
+        class Fruit(Options):
+            APPLE = 1
+
+        self.assertEqual(profiler.records(), [])
+
+    def test_environ(self):
+        path = tempfile.mkdtemp()
+        try:
+            report = os.path.join(path, 'profile.txt')
+            env = dict(os.environ, OPTENUM_PROFILE=report, PYTHONPATH=ROOT)
+            code = 'from optenum import Options\nclass Fruit(Options):\n    APPLE = 1\n'
+            subprocess.check_call([sys.executable, '-c', code], env=env, cwd=path)
+            with open(report) as f:
+                content = f.read()
+            self.assertIn('1 Options classes (1 options)', content)
+            self.assertIn('__main__.Fruit', content)
+        finally:
+            shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from optenum import Options, OptionGroup as G, Tag
+from optenum.query import TagQuery, parse, positions, _MAX_RESULTS
+
+
+class Fruit(Options):
+    APPLE = 1, 'Apple', ['RED', 'FRUITS']
+    BANANA = 2, 'Banana', ['YELLOW']
+    CHERRY = 3, 'Cherry', ['RED', 'BAD']
+    LEMON = 4, 'Lemon', ['YELLOW']
+
+    FRUITS = G(BANANA, CHERRY)
+
+
+class TestQuery(unittest.TestCase):
+
+    def test_query(self):
+        self.assertEqual(Fruit.query('RED & FRUITS & ~BAD'), (Fruit.APPLE, ))
+        self.assertEqual(Fruit.query('RED | YELLOW'), (1, 2, 3, 4))
+        self.assertEqual(Fruit.query('(RED | YELLOW) & ~FRUITS'), (4, ))
+        self.assertEqual(Fruit.query('RED ^ FRUITS'), (2, ))
+        self.assertEqual(Fruit.query('~RED&~YELLOW'), ())
+        self.assertEqual(Fruit.query('UNKNOWN'), ())
+        self.assertEqual(Fruit.query('~UNKNOWN'), Fruit.all)
+
+        self.assertEqual(Fruit.query(Tag('RED') & Tag('FRUITS') - Tag('BAD')), (Fruit.APPLE, ))
+        self.assertEqual(Fruit.query('YELLOW' & ~Tag('FRUITS')), (Fruit.LEMON, ))
+        self.assertIs(Fruit.query('RED & FRUITS'), Fruit.query(Tag('RED') & 'FRUITS'))
+
+    def test_invalidated(self):
+
+        class Foo(Options):
+            A = 1, None, ['RED']
+            B = 2
+
+        self.assertEqual(Foo.query('RED'), (Foo.A, ))
+        Foo.B.add_tag('RED')
+        self.assertEqual(Foo.query('RED'), (Foo.A, Foo.B))
+        Foo.A.remove_tag('RED')
+        self.assertEqual(Foo.query('RED'), (Foo.B, ))
+        Foo.set_tags({'A': ['RED', 'NEW'], 'B': ['NEW']})
+        self.assertEqual(Foo.query('NEW & ~RED'), (Foo.B, ))
+
+        # only masks and results of changed tags are dropped
+        new, red = Foo.query('NEW'), Foo.query('RED')
+        masks = Foo.__tag_index__.masks
+        Foo.B.add_tag('RED')
+        self.assertIs(Foo.query('NEW'), new)
+        self.assertEqual(Foo.query('RED'), (Foo.A, Foo.B))
+        self.assertIsNot(Foo.query('RED'), red)
+        self.assertIs(Foo.__tag_index__.masks['NEW'], masks['NEW'])
+        with Foo.batch_tags():
+            Foo.A.remove_tag('NEW')
+            Foo.B.add_tag('BLUE')
+        self.assertEqual(Foo.query('NEW | BLUE'), (Foo.B, ))
+        self.assertEqual(Foo.query('RED & ~NEW'), (Foo.A, ))
+
+    def test_cache_bounded(self):
+
+        class Foo(Options):
+            A = 1, None, ['RED']
+
+        for i in range(_MAX_RESULTS * 3):
+            self.assertEqual(Foo.query('RED & ~T%d' % i), (Foo.A, ))
+        index = Foo.__tag_index__
+        self.assertLessEqual(len(index.results), _MAX_RESULTS)
+        self.assertEqual(list(index.masks), ['RED'])
+        self.assertFalse(any(isinstance(key, tuple) and key[0] == 'query' for key in Foo.__views__))
+
+    def test_parse(self):
+        self.assertEqual(parse('A & B | ~C ^ D'), (Tag('A') & Tag('B')) | (~Tag('C') ^ Tag('D')))
+        self.assertEqual(parse(' ( A|B ) &C'), (Tag('A') | Tag('B')) & Tag('C'))
+        self.assertEqual(str(parse('~(A | B) & C')), '~(A | B) & C')
+        self.assertEqual(parse(str(parse('A & (B ^ ~C)'))), parse('A & (B ^ ~C)'))
+        self.assertEqual(parse('A & B & ~C').tags(), {'A', 'B', 'C'})
+        self.assertIsInstance(parse('A'), TagQuery)
+        for text in ('', 'A &', '(A', 'A B', 'A + B', ')', '~'):
+            self.assertRaises(ValueError, parse, text)
+        self.assertRaises(TypeError, lambda: Tag('A') & 1)
+
+    def test_positions(self):
+        self.assertEqual(positions(0), [])
+        self.assertEqual(positions(0b101001), [0, 3, 5])
+        self.assertEqual(positions(1 << 100), [100])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from optenum import Option, Options, OptionGroup as G
+from optenum.snapshot import dump_snapshot, load_snapshot, load_or_build, file_hash
+
+
+class Favorite(Options):
+    APPLE = Option(1, 'APPLE', 'Apple', tags=['FRUITS', 'RED'])
+    BANANA = 2, 'Banana', ('FRUITS', )
+    FOOTBALL = 'F', 'Football'
+    BASKETBALL = 'B', 'Basketball', ['RED']
+    PI = 3.14
+
+    SPORTS = G(BASKETBALL, FOOTBALL)
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.snapshot = os.path.join(self.path, 'favorite.snapshot')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_dump_load(self):
+        dump_snapshot(Favorite, self.snapshot, 'v1')
+        Restored = load_snapshot(self.snapshot, 'v1')
+
+        self.assertIsNot(Restored, Favorite)
+        self.assertTrue(issubclass(Restored, Options))
+        self.assertEqual(Restored.__name__, 'Favorite')
+        self.assertEqual(Restored.__module__, __name__)
+        self.assertEqual(Restored.tuples, Favorite.tuples)
+        self.assertEqual(Restored.APPLE.tags, ('FRUITS', 'RED'))
+        self.assertEqual(Restored.FRUITS, (1, 2))
+        self.assertEqual(Restored.RED, (Restored.APPLE, Restored.BASKETBALL))
+        self.assertEqual(Restored.SPORTS, ('B', 'F'))
+        self.assertIs(Restored.coerce('FOOTBALL'), Restored.FOOTBALL)
+        self.assertIn(Restored.PI, Restored)
+        self.assertNotIn(Favorite.PI, Restored)
+
+        Restored.FOOTBALL.add_tag('RED')
+        self.assertEqual(Restored.RED, (Restored.APPLE, Restored.BASKETBALL, Restored.FOOTBALL))
+        self.assertEqual(Favorite.RED, (Favorite.APPLE, Favorite.BASKETBALL))
+
+    def test_stale_or_broken(self):
+        self.assertIsNone(load_snapshot(self.snapshot))
+
+        dump_snapshot(Favorite, self.snapshot, 'v1')
+        self.assertIsNone(load_snapshot(self.snapshot, 'v2'))
+        self.assertIsNotNone(load_snapshot(self.snapshot))
+
+        with open(self.snapshot, 'rb') as f:
+            data = f.read()
+        with open(self.snapshot, 'wb') as f:
+            f.write(data[:-1] + (b'\x01' if data[-1:] == b'\x00' else b'\x00'))
+        self.assertIsNone(load_snapshot(self.snapshot, 'v1'))
+
+        with open(self.snapshot, 'wb') as f:
+            f.write(b'foo')
+        self.assertIsNone(load_snapshot(self.snapshot, 'v1'))
+
+    def test_load_or_build(self):
+        source = os.path.join(self.path, 'source.txt')
+        with io.open(source, 'w') as f:
+            f.write(u'A')
+        calls = []
+
+        def build():
+            calls.append(1)
+            with io.open(source) as f:
+                return Options.from_rows('Foo', [(f.read(), 1)])
+
+        Foo = load_or_build(self.snapshot, build, file_hash(source))
+        self.assertEqual(Foo.names, ('A', ))
+        Foo = load_or_build(self.snapshot, build, file_hash(source))
+        self.assertEqual(Foo.names, ('A', ))
+        self.assertEqual(len(calls), 1)
+
+        with io.open(source, 'w') as f:
+            f.write(u'B')
+        Foo = load_or_build(self.snapshot, build, file_hash(source))
+        self.assertEqual(Foo.names, ('B', ))
+        self.assertEqual(len(calls), 2)
+
+    def test_unsupported(self):
+
+        class Text(object):
+            pass
+
+        Foo = Options.from_rows('Foo', [('A', 1, Text())])
+        self.assertRaises(ValueError, dump_snapshot, Foo, self.snapshot)
+        self.assertFalse(os.path.exists(self.snapshot))
+
+        class Local(Options):
+            A = 1
+
+        Bar = Local.from_rows('Bar', [('B', 2)])
+        self.assertRaises(ValueError, dump_snapshot, Bar, self.snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import sys
+import threading
+import unittest
+from optenum import Options, TagGroup
+from optenum.options import OptionsMeta
+
+THREADS = 4
+ROUNDS = 200
+
+
+def make_class():
+    return OptionsMeta('Stress', (Options, ), dict(('OPT_%d' % i, i) for i in range(20)))
+
+
+class TestThreading(unittest.TestCase):
+
+    def setUp(self):
+        self.interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)     # switch threads as often as possible
+
+    def tearDown(self):
+        sys.setswitchinterval(self.interval)
+
+    def run_threads(self, target, count=THREADS):
+        errors = []
+
+        def run(n):
+            try:
+                target(n)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(n, )) for n in range(count)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+    def assert_consistent(self, cls):
+        for tag, group in cls.__groups__.items():
+            members = [o for o in cls.all if tag in o.tags]
+            self.assertEqual(sorted(group), members)
+            self.assertEqual(sorted(getattr(cls, tag)), members)
+            self.assertIs(getattr(cls, '__%s' % tag), group)
+
+    def test_add_remove(self):
+        cls = make_class()
+
+        def mutate(n):
+            for i in range(ROUNDS):
+                opt = cls.all[n::THREADS][i % (len(cls.all) // THREADS)]   # per-thread tags on own options
+                opt.add_tag('T%d' % (i % 3))
+                opt.add_tag('SHARED')
+                if i % 2:
+                    opt.remove_tag('T%d' % (i % 3))
+
+        self.run_threads(mutate)
+        self.assert_consistent(cls)
+
+    def test_same_options(self):
+        cls = make_class()
+
+        def mutate(n):
+            tag = 'T%d' % n
+            for i in range(ROUNDS):
+                for opt in cls.all:
+                    opt.add_tag(tag)
+                for opt in cls.all:
+                    opt.remove_tag(tag)
+            for opt in cls.all:
+                opt.add_tag(tag)
+
+        self.run_threads(mutate)
+        self.assert_consistent(cls)
+        for opt in cls.all:
+            self.assertEqual(sorted(opt.tags), ['T%d' % n for n in range(THREADS)])
+
+    def test_batch(self):
+        cls = make_class()
+
+        def mutate(n):
+            for i in range(ROUNDS // 10):
+                with cls.batch_tags():
+                    for opt in cls.all[n::THREADS]:
+                        opt.add_tag('EVEN' if i % 2 else 'ODD')
+                cls.set_tags(dict((opt, ('ODD', ) if i % 2 else ()) for opt in cls.all[n::THREADS]))
+
+        self.run_threads(mutate)
+        self.assert_consistent(cls)
+
+    def test_readers(self):
+        cls = make_class()
+        done = []
+        seen = []
+
+        def run(n):
+            if n == 0:
+                try:
+                    for i in range(ROUNDS):
+                        for opt in cls.all:
+                            opt.add_tag('T')
+                        for opt in cls.all:
+                            opt.remove_tag('T')
+                finally:
+                    done.append(True)
+            else:
+                while not done:
+                    group = getattr(cls, 'T', ())
+                    self.assertIsInstance(group, tuple)
+                    self.assertEqual(len(set(group)), len(group))
+                    seen.append(len(group))
+                    cls.query('T & ~X')
+
+        self.run_threads(run)
+        self.assert_consistent(cls)
+        self.assertIsInstance(cls.T, TagGroup)
+        self.assertTrue(seen)
+
+
+if __name__ == '__main__':
+    unittest.main()
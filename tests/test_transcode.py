@@ -0,0 +1,116 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from optenum import Options
+from optenum.transcode import transcode, split_chunks, resolve_options
+from optenum.__main__ import main
+
+
+class Fruit(Options):
+    APPLE = 1, 'Apple'
+    BANANA = 2, 'Banana, yellow'
+    CHERRY = 3
+
+
+class TestTranscode(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.src = self.write('src.csv', u'id,fruit,other\n' + u''.join(u'%d,%d,x\n' % (i, i % 3 + 1)
+                                                                        for i in range(100)))
+        self.dst = os.path.join(self.path, 'dst.csv')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def write(self, filename, content):
+        path = os.path.join(self.path, filename)
+        with io.open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def read(self, path):
+        with io.open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def expected(self, field='name'):
+        values = {'name': ['APPLE', 'BANANA', 'CHERRY'], 'text': ['Apple', '"Banana, yellow"', '']}[field]
+        return u'id,fruit,other\n' + u''.join(u'%d,%s,x\n' % (i, values[i % 3]) for i in range(100))
+
+    def test_split_chunks(self):
+        chunks = split_chunks(self.src, 15, chunk_size=100)
+        self.assertEqual(chunks[0][0], 15)
+        self.assertEqual(chunks[-1][1], os.path.getsize(self.src))
+        with open(self.src, 'rb') as f:
+            data = f.read()
+        for start, end in chunks:
+            self.assertEqual(data[end - 1:end], b'\n')
+        self.assertEqual([c[1] for c in chunks[:-1]], [c[0] for c in chunks[1:]])
+
+    def test_transcode(self):
+        for processes in (1, 2):
+            chunks = transcode(self.src, self.dst, Fruit, ['fruit'], processes=processes, chunk_size=100)
+            self.assertGreater(chunks, 1)
+            self.assertEqual(self.read(self.dst), self.expected())
+
+        transcode(self.src, self.dst, Fruit, [1], to_field='text', processes=2, chunk_size=100)
+        self.assertEqual(self.read(self.dst), self.expected('text'))
+
+    def test_transcode_names_to_codes(self):
+        names = self.write('names.tsv', u'APPLE\t1\nCHERRY\t2\n')
+        transcode(names, self.dst, '%s:Fruit' % __name__, [0], from_field='name', to_field='code', delimiter='\t',
+                  header=False)
+        self.assertEqual(self.read(self.dst), u'1\t1\n3\t2\n')
+
+    def test_line_terminator(self):
+        path = os.path.join(self.path, 'crlf.csv')
+        with open(path, 'wb') as f:
+            f.write(b'id,fruit\r\n' + b''.join(b'%d,%d\r\n' % (i, i % 3 + 1) for i in range(50)))
+        for processes in (1, 2):
+            for header in (True, False):
+                transcode(path, self.dst, Fruit, [1], header=header, default=None, processes=processes,
+                          chunk_size=100)
+                with open(self.dst, 'rb') as f:
+                    lines = f.read().split(b'\r\n')
+                self.assertEqual(lines[-1], b'')
+                self.assertFalse(any(b'\n' in line for line in lines))
+                self.assertEqual(lines[1], b'0,APPLE')
+
+    def test_unknown(self):
+        src = self.write('unknown.csv', u'fruit\n1\n9\n')
+        self.assertRaises(KeyError, transcode, src, self.dst, Fruit, ['fruit'], processes=1)
+        self.assertRaises(KeyError, transcode, src, self.dst, Fruit, ['fruit'], processes=2, chunk_size=1)
+        transcode(src, self.dst, Fruit, ['fruit'], default='?', processes=2, chunk_size=1)
+        self.assertEqual(self.read(self.dst), u'fruit\nAPPLE\n?\n')
+        transcode(src, self.dst, Fruit, ['fruit'], default=None, processes=1)
+        self.assertEqual(self.read(self.dst), u'fruit\nAPPLE\n9\n')
+
+        self.assertRaises(ValueError, transcode, src, self.dst, Fruit, ['foo'])
+        self.assertRaises(NameError, transcode, src, self.dst, Fruit, ['fruit'], to_field='tags')
+
+    def test_resolve_options(self):
+        self.assertIs(resolve_options(Fruit), Fruit)
+        self.assertIs(resolve_options('%s:Fruit' % __name__), Fruit)
+        self.assertIs(resolve_options('%s.Fruit' % __name__), Fruit)
+        self.assertRaises(TypeError, resolve_options, '%s:TestTranscode' % __name__)
+
+    def test_command(self):
+        args = ['transcode', self.src, self.dst, '--options', '%s:Fruit' % __name__, '--columns', 'fruit',
+                '--processes', '2', '--chunk-size', '100']
+        self.assertEqual(main(args), 0)
+        self.assertEqual(self.read(self.dst), self.expected())
+
+        tsv = self.write('src.tsv', u'3\tCHERRY\n')
+        args = ['transcode', tsv, self.dst, '--options', '%s:Fruit' % __name__, '--columns', '1', '--no-header',
+                '--from', 'name', '--to', 'code', '--delimiter', '\\t']
+        self.assertEqual(main(args), 0)
+        self.assertEqual(self.read(self.dst), u'3\t3\n')
+
+        self.assertEqual(main(['transcode', self.src, self.dst, '--options', '%s:Fruit' % __name__,
+                               '--columns', 'id']), 1)       # unknown codes
+
+
+if __name__ == '__main__':
+    unittest.main()